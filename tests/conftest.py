@@ -2,9 +2,32 @@
 Pytest configuration and shared fixtures.
 """
 
+import socket
+
 import pytest
 from pathlib import Path
 
+# Hosts that unit tests may still resolve (local test servers)
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1"}
+
+_real_getaddrinfo = socket.getaddrinfo
+
+
+def _loopback_only_getaddrinfo(host, *args, **kwargs):
+    """getaddrinfo replacement that refuses to resolve non-loopback hosts."""
+    if isinstance(host, bytes):
+        host = host.decode()
+    if host is None or host in LOOPBACK_HOSTS:
+        return _real_getaddrinfo(host, *args, **kwargs)
+    raise RuntimeError(f"Network access in unit test: {host}")
+
+
+@pytest.fixture(autouse=True)
+def _no_network(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Block DNS resolution of external hosts unless the test is marked integration."""
+    if request.node.get_closest_marker("integration") is None:
+        monkeypatch.setattr(socket, "getaddrinfo", _loopback_only_getaddrinfo)
+
 
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
@@ -12,18 +35,24 @@ def temp_dir(tmp_path: Path) -> Path:
     return tmp_path
 
 
-@pytest.fixture
-def sample_file(tmp_path: Path) -> Path:
-    """Create a sample file for testing."""
-    filepath = tmp_path / "sample.txt"
+@pytest.fixture(scope="module")
+def sample_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample file for testing.
+
+    Shared across the module; consumers must not modify the returned file.
+    """
+    filepath = tmp_path_factory.mktemp("data") / "sample.txt"
     filepath.write_text("Sample content for testing")
     return filepath
 
 
-@pytest.fixture
-def sample_checksum_file(tmp_path: Path) -> Path:
-    """Create a sample checksum file."""
-    filepath = tmp_path / "checksums.txt"
+@pytest.fixture(scope="module")
+def sample_checksum_file(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a sample checksum file.
+
+    Shared across the module; consumers must not modify the returned file.
+    """
+    filepath = tmp_path_factory.mktemp("data") / "checksums.txt"
     # SHA256 of "Sample content for testing"
     content = """abc123def456  sample.txt
 e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855  empty.txt"""
@@ -0,0 +1,154 @@
+"""
+Unit tests for TrustGet CLI helpers.
+"""
+
+import tomllib
+from pathlib import Path
+
+import pytest
+
+from trustget.cli import (
+    DEFAULT_CONFIG,
+    fetch_release_and_trust,
+    parse_config_value,
+    write_config,
+)
+
+
+class TestParseConfigValue:
+    """Tests for parse_config_value."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ("true", True),
+            ("False", False),
+            ("30", 30),
+            ("-5", -5),
+            ("0.5", 0.5),
+            ("nan", "nan"),
+            ("inf", "inf"),
+            ("hello", "hello"),
+        ],
+    )
+    def test_parse_config_value(self, value: str, expected):
+        result = parse_config_value(value)
+        assert result == expected
+        assert type(result) is type(expected)
+
+
+class TestWriteConfig:
+    """Tests for write_config."""
+
+    def test_write_and_read_back(self, tmp_path: Path):
+        config_file = tmp_path / "trustget" / "config.toml"
+        write_config(config_file, DEFAULT_CONFIG)
+        with open(config_file, "rb") as f:
+            assert tomllib.load(f) == DEFAULT_CONFIG
+        assert [p.name for p in config_file.parent.iterdir()] == ["config.toml"]
+
+
+class TestFetchReleaseAndTrust:
+    """Tests for fetch_release_and_trust."""
+
+    @pytest.fixture
+    def engine(self):
+        from datetime import UTC, datetime
+        from unittest import mock
+
+        from trustget.github import GitHubRelease, GitHubRepo
+        from trustget.trust import TrustEngine
+
+        now = datetime.now(UTC).isoformat()
+        release = GitHubRelease(
+            tag_name="v1",
+            name="v1",
+            body="",
+            html_url="https://github.com/o/r/releases/tag/v1",
+            published_at=now,
+            created_at=now,
+            draft=False,
+            prerelease=False,
+            author={"login": "o"},
+            assets=[],
+        )
+        repo = GitHubRepo(
+            owner="o",
+            name="r",
+            description="",
+            created_at=now,
+            updated_at=now,
+            stargazers_count=0,
+            watchers_count=0,
+            language=None,
+            default_branch="main",
+            private=False,
+            archived=False,
+        )
+        engine = TrustEngine()
+        engine._github_client = mock.Mock()
+        engine._github_client.get_release_and_repo.return_value = (release, repo)
+        engine._github_client.get_release.return_value = release
+        return engine
+
+    def test_download_reuses_analysis_release(self, engine):
+        url = "https://github.com/o/r/releases/download/v1/tool.tar.gz"
+        release, report, error = fetch_release_and_trust(url, engine)
+
+        assert release is report.github_release
+        assert release.tag_name == "v1"
+        assert error is None
+        engine._github_client.get_release_and_repo.assert_called_once_with("o", "r", "v1")
+        engine._github_client.get_release.assert_not_called()
+
+    def test_download_error_returned(self, engine):
+        from trustget.github import GitHubError
+
+        engine._github_client.get_release_and_repo.side_effect = GitHubError("not found", 404)
+        url = "https://github.com/o/r/releases/download/v9/tool.tar.gz"
+        release, report, error = fetch_release_and_trust(url, engine)
+
+        assert release is None
+        assert error == "not found"
+
+    def test_tag_page_uses_engine_client(self, engine):
+        url = "https://github.com/o/r/releases/tag/v1"
+        release, report, error = fetch_release_and_trust(url, engine)
+
+        assert release.tag_name == "v1"
+        assert error is None
+        engine._github_client.get_release.assert_called_once_with("o", "r", "v1")
+
+    def test_tag_page_error_returned(self, engine):
+        from trustget.github import GitHubError
+
+        engine._github_client.get_release.side_effect = GitHubError("not found", 404)
+        url = "https://github.com/o/r/releases/tag/v9"
+        release, report, error = fetch_release_and_trust(url, engine)
+
+        assert release is None
+        assert error == "not found"
+        assert report.metadata["github_error"] == "not found"
+
+    def test_other_url_has_no_release(self, engine):
+        release, report, error = fetch_release_and_trust("https://example.com/tool.tar.gz", engine)
+
+        assert release is None
+        assert error is None
+        engine._github_client.get_release.assert_not_called()
+
+    def test_info_exits_nonzero_on_failed_lookup(self, engine):
+        from unittest import mock
+
+        from click.testing import CliRunner
+
+        from trustget.cli import cli
+        from trustget.github import GitHubError
+
+        engine._github_client.get_release.side_effect = GitHubError("not found", 404)
+        with mock.patch("trustget.trust.TrustEngine", return_value=engine):
+            result = CliRunner().invoke(
+                cli, ["info", "--quiet", "https://github.com/o/r/releases/tag/v9"]
+            )
+
+        assert result.exit_code == 1
@@ -0,0 +1,352 @@
+"""
+Unit tests for TrustGet GitHub module.
+"""
+
+import json
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+import pytest
+import requests
+
+from trustget.github import GitHubAsset, GitHubClient, GitHubError, GitHubRelease
+
+
+def make_release(*asset_names: str) -> GitHubRelease:
+    return GitHubRelease(
+        tag_name="v1.0.0",
+        name="v1.0.0",
+        body="",
+        html_url="https://github.com/o/r/releases/tag/v1.0.0",
+        published_at="2024-01-01T00:00:00Z",
+        created_at="2024-01-01T00:00:00Z",
+        draft=False,
+        prerelease=False,
+        author={"login": "o"},
+        assets=[
+            GitHubAsset(name, f"https://example.com/{name}", 1, 0, "text/plain", "")
+            for name in asset_names
+        ],
+    )
+
+
+class TestGitHubClientSession:
+    """Tests for GitHubClient session sharing."""
+
+    def test_clients_share_session(self):
+        with GitHubClient(token="a") as first, GitHubClient(token="b") as second:
+            assert first.session is second.session
+
+    def test_close_keeps_shared_session_open(self):
+        client = GitHubClient()
+        session = client.session
+        client.close()
+        assert GitHubClient().session is session
+
+    def test_token_sent_per_request(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("TRUSTGET_GITHUB_TOKEN", raising=False)
+        cache_path = tmp_path / "etags.json"
+        response = mock.Mock(status_code=200, headers={})
+        response.content = b"{}"
+        with mock.patch.object(requests.Session, "get", return_value=response) as get:
+            GitHubClient(token="secret", etag_cache_path=cache_path)._request("/rate_limit")
+            GitHubClient(etag_cache_path=cache_path)._request("/rate_limit")
+
+        assert get.call_args_list[0].kwargs["headers"] == {"Authorization": "Bearer secret"}
+        assert get.call_args_list[1].kwargs["headers"] == {}
+        assert "Authorization" not in GitHubClient().session.headers
+
+
+class TestGitHubClientEtagCache:
+    """Tests for conditional requests with cached ETags."""
+
+    @staticmethod
+    def _response(status_code: int, data=None, etag: str | None = None) -> mock.Mock:
+        response = mock.Mock(status_code=status_code, headers={"ETag": etag} if etag else {})
+        response.content = json.dumps(data).encode()
+        return response
+
+    def test_not_modified_returns_cached_data(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(GitHubClient, "CACHE_MAX_AGE", 0)
+        cache_path = tmp_path / "etags.json"
+        responses = [self._response(200, {"tag_name": "v1"}, etag='"abc"'), self._response(304)]
+        with mock.patch.object(requests.Session, "get", side_effect=responses) as get:
+            with GitHubClient(token="t", etag_cache_path=cache_path) as client:
+                client._request("/repos/o/r")
+            # A new client (new process) reuses the persisted ETag
+            with GitHubClient(token="t", etag_cache_path=cache_path) as client:
+                assert client._request("/repos/o/r") == {"tag_name": "v1"}
+
+        assert "If-None-Match" not in get.call_args_list[0].kwargs["headers"]
+        assert get.call_args_list[1].kwargs["headers"]["If-None-Match"] == '"abc"'
+
+    def test_cache_is_per_token(self, tmp_path):
+        cache_path = tmp_path / "etags.json"
+        responses = [self._response(200, {}, etag='"abc"'), self._response(200, {}, etag='"def"')]
+        with mock.patch.object(requests.Session, "get", side_effect=responses) as get:
+            with GitHubClient(token="first", etag_cache_path=cache_path) as client:
+                client._request("/repos/o/r")
+            with GitHubClient(token="second", etag_cache_path=cache_path) as client:
+                client._request("/repos/o/r")
+
+        assert "If-None-Match" not in get.call_args_list[1].kwargs["headers"]
+
+    def test_fresh_entry_skips_request(self, tmp_path):
+        cache_path = tmp_path / "etags.json"
+        responses = [self._response(200, {"tag_name": "v1"})]
+        with mock.patch.object(requests.Session, "get", side_effect=responses) as get:
+            with GitHubClient(token="t", etag_cache_path=cache_path) as client:
+                client._request("/repos/o/r")
+            with GitHubClient(token="t", etag_cache_path=cache_path) as client:
+                assert client._request("/repos/o/r") == {"tag_name": "v1"}
+                # max_age=0 forces a round-trip (and would raise StopIteration here)
+                with pytest.raises(StopIteration):
+                    client._request("/repos/o/r", max_age=0)
+
+        assert get.call_count == 2
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        cache_path = tmp_path / "etags.json"
+        cache_path.write_text("not json")
+        assert GitHubClient(etag_cache_path=cache_path).etag_cache == {}
+
+    def test_malformed_entries_dropped(self, tmp_path):
+        cache_path = tmp_path / "etags.json"
+        good = ['"abc"', {"tag_name": "v1"}, 1.0]
+        cache_path.write_text(
+            json.dumps({"a": "abc", "b": ['"abc"', {}], "c": [None, {}, "x"], "d": good})
+        )
+        assert GitHubClient(etag_cache_path=cache_path).etag_cache == {"d": good}
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        cache_path = tmp_path / "cache" / "etags.json"
+        response = mock.Mock(status_code=200, headers={})
+        response.content = b"{}"
+        with mock.patch.object(requests.Session, "get", return_value=response):
+            with GitHubClient(token="t", etag_cache_path=cache_path) as client:
+                client._request("/repos/o/r")
+
+        assert [p.name for p in cache_path.parent.iterdir()] == ["etags.json"]
+
+
+GRAPHQL_DATA = {
+    "data": {
+        "repository": {
+            "owner": {"login": "cli"},
+            "name": "cli",
+            "description": None,
+            "createdAt": "2019-10-03T00:00:00Z",
+            "updatedAt": "2024-01-01T00:00:00Z",
+            "stargazerCount": 35000,
+            "primaryLanguage": {"name": "Go"},
+            "defaultBranchRef": {"name": "trunk"},
+            "isPrivate": False,
+            "isArchived": False,
+            "release": {
+                "tagName": "v2.40.0",
+                "name": None,
+                "description": "Notes",
+                "url": "https://github.com/cli/cli/releases/tag/v2.40.0",
+                "publishedAt": "2023-12-07T00:00:00Z",
+                "createdAt": "2023-12-07T00:00:00Z",
+                "isDraft": False,
+                "isPrerelease": False,
+                "author": {"login": "cli"},
+                "releaseAssets": {
+                    "nodes": [
+                        {
+                            "name": "checksums.txt",
+                            "downloadUrl": "https://github.com/cli/cli/releases/download/v2.40.0/checksums.txt",
+                            "size": 100,
+                            "downloadCount": 5,
+                            "contentType": "text/plain",
+                            "createdAt": "2023-12-07T00:00:00Z",
+                        }
+                    ],
+                    "pageInfo": {"hasNextPage": False},
+                },
+            },
+        }
+    }
+}
+
+
+class TestGitHubClientReleaseAndRepo:
+    """Tests for GitHubClient.get_release_and_repo."""
+
+    def test_single_graphql_request_with_token(self, tmp_path):
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps(GRAPHQL_DATA).encode()
+        client = GitHubClient(token="secret", etag_cache_path=tmp_path / "etags.json")
+        with (
+            mock.patch.object(requests.Session, "post", return_value=response) as post,
+            mock.patch.object(requests.Session, "get") as get,
+        ):
+            release, repo = client.get_release_and_repo("cli", "cli", "v2.40.0")
+            # Repeat lookups are served from the response cache
+            client.get_release_and_repo("cli", "cli", "v2.40.0")
+
+        assert post.call_count == 1
+        assert get.call_count == 0
+        assert post.call_args.kwargs["json"]["variables"]["tag"] == "v2.40.0"
+        assert release.name == "v2.40.0"
+        assert release.author_login == "cli"
+        assert release.assets[0].name == "checksums.txt"
+        assert repo.language == "Go"
+        assert repo.default_branch == "trunk"
+        assert repo.description == ""
+
+    def test_anonymous_client_uses_rest(self, monkeypatch):
+        monkeypatch.delenv("TRUSTGET_GITHUB_TOKEN", raising=False)
+        client = GitHubClient()
+        with (
+            mock.patch.object(client, "get_release", return_value="release") as get_release,
+            mock.patch.object(client, "get_repo", return_value="repo") as get_repo,
+            mock.patch.object(requests.Session, "post") as post,
+        ):
+            assert client.get_release_and_repo("cli", "cli", "v2.40.0") == ("release", "repo")
+
+        assert post.call_count == 0
+        get_release.assert_called_once_with("cli", "cli", "v2.40.0")
+        get_repo.assert_called_once_with("cli", "cli")
+
+    def test_rejected_token_falls_back_to_rest(self):
+        client = GitHubClient(token="bad")
+        response = mock.Mock(status_code=401)
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+        with (
+            mock.patch.object(requests.Session, "post", return_value=response),
+            mock.patch.object(client, "get_release", return_value="release"),
+            mock.patch.object(client, "get_repo", return_value="repo"),
+        ):
+            assert client.get_release_and_repo("cli", "cli", "v2.40.0") == ("release", "repo")
+
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            {"errors": [{"type": "FORBIDDEN", "message": "Resource not accessible"}]},
+            {"errors": [{"type": "INSUFFICIENT_SCOPES", "message": "Missing read:org"}]},
+        ],
+    )
+    def test_graphql_error_falls_back_to_rest(self, tmp_path, payload):
+        client = GitHubClient(token="t", etag_cache_path=tmp_path / "etags.json")
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps(payload).encode()
+        with (
+            mock.patch.object(requests.Session, "post", return_value=response),
+            mock.patch.object(client, "get_release", return_value="release"),
+            mock.patch.object(client, "get_repo", return_value="repo"),
+        ):
+            assert client.get_release_and_repo("cli", "cli", "v2.40.0") == ("release", "repo")
+
+    def test_graphql_not_found_is_raised(self, tmp_path):
+        client = GitHubClient(token="t", etag_cache_path=tmp_path / "etags.json")
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps(
+            {"errors": [{"type": "NOT_FOUND", "message": "Could not resolve"}]}
+        ).encode()
+        with (
+            mock.patch.object(requests.Session, "post", return_value=response),
+            mock.patch.object(client, "get_release") as get_release,
+            pytest.raises(GitHubError) as excinfo,
+        ):
+            client.get_release_and_repo("cli", "cli", "v2.40.0")
+
+        assert excinfo.value.status_code == 404
+        get_release.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "post_kwargs",
+        [
+            {"side_effect": requests.ConnectionError("reset")},
+            {"return_value": mock.Mock(status_code=200, content=b"<html>")},
+        ],
+    )
+    def test_graphql_transport_errors_are_typed(self, tmp_path, post_kwargs):
+        client = GitHubClient(token="t", etag_cache_path=tmp_path / "etags.json")
+        with mock.patch.object(requests.Session, "post", **post_kwargs):
+            with pytest.raises(GitHubError):
+                client._graphql("query {}", {})
+
+    def test_paginated_assets_use_rest_release(self, tmp_path):
+        data = json.loads(json.dumps(GRAPHQL_DATA))
+        data["data"]["repository"]["release"]["releaseAssets"]["pageInfo"]["hasNextPage"] = True
+        response = mock.Mock(status_code=200)
+        response.content = json.dumps(data).encode()
+        client = GitHubClient(token="t", etag_cache_path=tmp_path / "etags.json")
+        with (
+            mock.patch.object(requests.Session, "post", return_value=response),
+            mock.patch.object(client, "get_release", return_value="rest release") as get_release,
+        ):
+            release, repo = client.get_release_and_repo("cli", "cli", "v2.40.0")
+
+        assert release == "rest release"
+        assert repo.name == "cli"
+        get_release.assert_called_once_with("cli", "cli", "v2.40.0")
+
+
+class TestFindChecksumAsset:
+    """Tests for GitHubClient.find_checksum_asset."""
+
+    @pytest.mark.parametrize(
+        "asset_names,expected",
+        [
+            (["tool.tar.gz", "tool.tar.gz.sha256"], "tool.tar.gz.sha256"),
+            (["TOOL.TAR.GZ.SHA512", "tool.tar.gz"], "TOOL.TAR.GZ.SHA512"),
+            # Per-file checksum beats a release-wide one, whatever the order
+            (["SHA256SUMS", "tool.tar.gz.md5"], "tool.tar.gz.md5"),
+            # Release-wide checksum beats a signature
+            (["tool.tar.gz.asc", "checksums.txt"], "checksums.txt"),
+            (["tool.tar.gz.sig"], "tool.tar.gz.sig"),
+            (["other.tar.gz.sha256", "README.md"], None),
+        ],
+    )
+    def test_find(self, asset_names: list[str], expected: str | None):
+        asset = GitHubClient().find_checksum_asset(make_release(*asset_names), "tool.tar.gz")
+        assert (asset.name if asset else None) == expected
+
+    def test_index_follows_appended_assets(self):
+        release = make_release("tool.tar.gz")
+        assert release.get_asset("tool.tar.gz.sha256") is None
+        release.assets.append(GitHubAsset("tool.tar.gz.sha256", "u", 1, 0, "text/plain", ""))
+        assert release.get_asset("TOOL.tar.gz.sha256") is release.assets[-1]
+
+
+class TestReleaseDates:
+    """Tests for GitHubRelease date helpers."""
+
+    def test_published_date_parses_z_suffix(self):
+        release = make_release()
+        assert release.published_date == datetime(2024, 1, 1, tzinfo=UTC)
+        assert release.published_date is release.published_date
+
+    def test_age_days(self):
+        release = make_release()
+        release.published_at = (datetime.now(UTC) - timedelta(days=10)).isoformat()
+        assert release.age_days == 10
+        assert release.is_recent is True
+        assert release.is_old is False
+
+
+class TestGetChecksumContents:
+    """Tests for GitHubClient.get_checksum_contents."""
+
+    def test_keeps_order_and_failures(self):
+        release = make_release("a.sha256", "b.sha256", "c.sha256")
+        contents = {"a.sha256": "aaa  a", "c.sha256": "ccc  c"}
+        client = GitHubClient()
+        with mock.patch.object(
+            client, "get_checksum_content", side_effect=lambda asset: contents.get(asset.name)
+        ):
+            assert client.get_checksum_contents(release.assets) == ["aaa  a", None, "ccc  c"]
+
+
+class TestAssetValue:
+    """Tests for GitHubAsset value semantics."""
+
+    def test_hashable_and_immutable(self):
+        asset = GitHubAsset("a.sha256", "u", 1, 0, "text/plain", "")
+        assert asset in {GitHubAsset("a.sha256", "u", 1, 0, "text/plain", "")}
+        with pytest.raises(AttributeError):
+            asset.name = "b.sha256"
@@ -0,0 +1,71 @@
+"""
+Unit tests for TrustGet hash cache module.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from trustget.hashcache import HashCache
+
+
+class TestHashCache:
+    """Tests for HashCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path: Path):
+        with HashCache(tmp_path / "hashes.sqlite") as cache:
+            yield cache
+
+    @pytest.fixture
+    def data_file(self, tmp_path: Path) -> Path:
+        path = tmp_path / "data.bin"
+        path.write_bytes(b"original")
+        # Outside the racy window, as if written a minute ago
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+        return path
+
+    def test_miss(self, cache: HashCache, data_file: Path):
+        assert cache.get(data_file, "sha256") is None
+
+    def test_hit_unchanged_file(self, cache: HashCache, data_file: Path):
+        cache.put(data_file, "sha256", "abc123")
+        assert cache.get(data_file, "sha256") == "abc123"
+        assert cache.get(data_file, "md5") is None
+
+    def test_miss_after_modification(self, cache: HashCache, data_file: Path):
+        cache.put(data_file, "sha256", "abc123")
+        stat = data_file.stat()
+        data_file.write_bytes(b"modified")
+        # Restoring the old mtime must not revive the stale entry
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert cache.get(data_file, "sha256") is None
+
+    def test_racy_entry_not_reused(self, cache: HashCache, tmp_path: Path):
+        path = tmp_path / "fresh.bin"
+        path.write_bytes(b"just written")
+        # Modified in the same instant it was hashed: a later write could keep the mtime
+        cache.put(path, "sha256", "abc123")
+        assert cache.get(path, "sha256") is None
+
+    def test_key_from_before_hashing(self, cache: HashCache, data_file: Path):
+        key = HashCache.file_key(data_file)
+        data_file.write_bytes(b"rewritten while hashing")
+        assert not HashCache.unchanged_since(data_file, key)
+
+        # Stored under the pre-hash state, so the rewritten file misses
+        cache.put(data_file, "sha256", "abc123", key)
+        assert cache.get(data_file, "sha256", key) == "abc123"
+        assert cache.get(data_file, "sha256") is None
+
+    def test_persists_across_instances(self, tmp_path: Path, data_file: Path):
+        db_path = tmp_path / "hashes.sqlite"
+        with HashCache(db_path) as cache:
+            cache.put(data_file, "sha256", "abc123")
+        with HashCache(db_path) as cache:
+            assert cache.get(data_file, "sha256") == "abc123"
+
+    def test_missing_file_is_miss(self, cache: HashCache, tmp_path: Path):
+        assert cache.get(tmp_path / "missing.bin", "sha256") is None
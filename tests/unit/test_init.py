@@ -0,0 +1,36 @@
+"""
+Unit tests for TrustGet package exports.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import trustget
+
+
+class TestLazyExports:
+    """Tests for lazy package-level exports."""
+
+    def test_version_import_loads_no_submodules(self):
+        code = (
+            "import sys; from trustget import __version__; "
+            "print(sorted(m for m in sys.modules if m.startswith('trustget.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+    def test_lazy_attribute_resolves(self):
+        from trustget.verifier import Verifier
+
+        assert trustget.Verifier is Verifier
+
+    def test_dir_lists_public_names(self):
+        assert set(trustget.__all__) <= set(dir(trustget))
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError, match="DoesNotExist"):
+            trustget.DoesNotExist  # noqa: B018
@@ -0,0 +1,63 @@
+"""
+Unit tests for TrustGet reporter module.
+"""
+
+import io
+import json
+from unittest import mock
+
+from rich.console import Console
+
+from trustget.reporter import Reporter
+from trustget.trust import TrustFactor, TrustReport
+from trustget.verifier import VerificationResult, VerificationStatus
+
+
+class TestReporterJson:
+    """Tests for Reporter JSON output."""
+
+    def test_output_is_verbatim_json(self):
+        output = io.StringIO()
+        reporter = Reporter(console=Console(file=output, width=20), json_output=True)
+        message = "[bold]not markup[/] " + "x" * 100
+        reporter.output_error(message)
+        assert json.loads(output.getvalue()) == {"error": message}
+
+
+class TestReporterText:
+    """Tests for Reporter human-readable output."""
+
+    def test_trust_report_printed_once(self):
+        output = io.StringIO()
+        reporter = Reporter(console=Console(file=output, width=80, color_system=None))
+        report = TrustReport(
+            url="https://example.com/file.tar.gz",
+            score=30,
+            factors=[TrustFactor(name="HTTPS", description="Secure", weight=20, applied=True)],
+            metadata={"github": {"owner": "octo", "repo": "tool", "stars": 5}},
+        )
+        with mock.patch.object(reporter.console, "print", wraps=reporter.console.print) as printed:
+            reporter.output_trust_report(report)
+
+        assert printed.call_count == 1
+        text = output.getvalue()
+        assert "octo/tool" in text
+        assert "HTTPS" in text
+        assert "Tips to improve trust" in text
+
+    def test_verification_error_not_parsed_as_markup(self, tmp_path):
+        output = io.StringIO()
+        reporter = Reporter(console=Console(file=output, width=200, color_system=None))
+        result = VerificationResult(
+            status=VerificationStatus.ERROR,
+            filepath=tmp_path / "file.bin",
+            error="bad entry [/] in [red]SUMS",
+        )
+        reporter.output_verification(result)
+        assert "Verification error: bad entry [/] in [red]SUMS" in output.getvalue()
+
+    def test_warning_not_parsed_as_markup(self):
+        output = io.StringIO()
+        reporter = Reporter(console=Console(file=output, width=200, color_system=None))
+        reporter.output_warning("GitHub said [/] and [bold]")
+        assert "⚠ Warning: GitHub said [/] and [bold]" in output.getvalue()
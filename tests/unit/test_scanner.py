@@ -2,7 +2,10 @@
 Unit tests for TrustGet scanner module.
 """
 
+from unittest import mock
+
 import pytest
+import requests
 from trustget.scanner import (
     Scanner,
     ChecksumFile,
@@ -44,63 +47,59 @@ class TestChecksumEntry:
 class TestChecksumFile:
     """Tests for ChecksumFile."""
 
-    def test_get_entry_for_file_found(self):
-        entries = [
-            ChecksumEntry("hash1", "file1.txt", "sha256"),
-            ChecksumEntry("hash2", "file2.txt", "sha256"),
-        ]
-        checksum_file = ChecksumFile(
+    @pytest.fixture(scope="class")
+    def checksum_file(self) -> ChecksumFile:
+        return ChecksumFile(
             url="http://example.com/checksums.txt",
             filename="checksums.txt",
             file_type=ChecksumFileType.GENERIC,
             content="content",
-            entries=entries,
+            entries=[
+                ChecksumEntry("hash1", "file1.txt", "sha256"),
+                ChecksumEntry("hash2", "File2.TXT", "sha256"),
+                ChecksumEntry("hash3", "file1.TXT", "sha256"),
+            ],
         )
-        entry = checksum_file.get_entry_for_file("file2.txt")
-        assert entry is not None
-        assert entry.hash_value == "hash2"
 
-    def test_get_entry_for_file_not_found(self):
-        entries = [
-            ChecksumEntry("hash1", "file1.txt", "sha256"),
-        ]
+    @pytest.mark.parametrize(
+        "query,expected_hash",
+        [
+            ("file1.txt", "hash1"),
+            ("file2.txt", "hash2"),  # Case-insensitive
+            ("FILE1.txt", "hash1"),  # First occurrence wins
+            ("nonexistent.txt", None),
+        ],
+    )
+    def test_get_entry_for_file(
+        self, checksum_file: ChecksumFile, query: str, expected_hash: str | None
+    ):
+        entry = checksum_file.get_entry_for_file(query)
+        if expected_hash is None:
+            assert entry is None
+        else:
+            assert entry is not None
+            assert entry.hash_value == expected_hash
+
+    def test_get_entry_after_append(self):
         checksum_file = ChecksumFile(
-            url="http://example.com/checksums.txt",
+            url=CHECKSUMS_URL,
             filename="checksums.txt",
             file_type=ChecksumFileType.GENERIC,
-            content="content",
-            entries=entries,
+            content="",
         )
-        entry = checksum_file.get_entry_for_file("nonexistent.txt")
-        assert entry is None
-
-    def test_get_entry_case_insensitive(self):
-        entries = [
-            ChecksumEntry("hash1", "File.TXT", "sha256"),
-        ]
-        checksum_file = ChecksumFile(
-            url="http://example.com/checksums.txt",
-            filename="checksums.txt",
-            file_type=ChecksumFileType.GENERIC,
-            content="content",
-            entries=entries,
-        )
-        entry = checksum_file.get_entry_for_file("file.txt")
+        assert checksum_file.get_entry_for_file("file1.txt") is None
+        checksum_file.entries.append(ChecksumEntry("hash1", "File1.txt", "sha256"))
+        entry = checksum_file.get_entry_for_file("file1.txt")
         assert entry is not None
+        assert entry.hash_value == "hash1"
 
-    def test_to_dict(self):
-        entries = [ChecksumEntry("hash1", "file1.txt", "sha256")]
-        checksum_file = ChecksumFile(
-            url="http://example.com/checksums.txt",
-            filename="checksums.txt",
-            file_type=ChecksumFileType.GENERIC,
-            content="content",
-            entries=entries,
-        )
+    def test_to_dict(self, checksum_file: ChecksumFile):
         data = checksum_file.to_dict()
         assert data["url"] == "http://example.com/checksums.txt"
         assert data["file_type"] == "GENERIC"
-        assert len(data["entries"]) == 1
+        assert len(data["entries"]) == 3
+        assert "content" not in data
+        assert checksum_file.to_dict(include_content=True)["content"] == "content"
 
 
 class TestScanResult:
@@ -149,6 +148,22 @@ class TestScanResult:
         assert entry is not None
         assert entry.algorithm == "sha256"  # SHA256 has priority
 
+    def test_get_checksum_for_after_append(self):
+        result = ScanResult(base_url="http://example.com/")
+        assert result.get_checksum_for("file.txt") is None
+        result.checksum_files.append(
+            ChecksumFile(
+                url="http://example.com/SHA256SUMS",
+                filename="SHA256SUMS",
+                file_type=ChecksumFileType.SHA256,
+                content="hash256 file.txt",
+                entries=[ChecksumEntry("hash256", "File.txt", "sha256")],
+            )
+        )
+        entry = result.get_checksum_for("file.txt")
+        assert entry is not None
+        assert entry.hash_value == "hash256"
+
     def test_to_dict(self):
         result = ScanResult(
             base_url="http://example.com/",
@@ -161,94 +176,257 @@ class TestScanResult:
         assert data["signature_files"] == ["http://example.com/file.asc"]
 
 
+CHECKSUMS_URL = "http://example.com/checksums.txt"
+
+
 class TestScannerParseChecksumContent:
     """Tests for Scanner checksum parsing."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scanner(self) -> Scanner:
         return Scanner()
 
-    def test_parse_gnu_coreutils_format(self, scanner: Scanner):
-        content = "abc123  file.txt"
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 1
-        assert entries[0].hash_value == "abc123"
-        assert entries[0].filename == "file.txt"
-
-    def test_parse_with_asterisk(self, scanner: Scanner):
-        content = "abc123 *file.txt"
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 1
-        assert entries[0].filename == "file.txt"
-
-    def test_parse_filename_colon_hash(self, scanner: Scanner):
-        content = "file.txt: abc123"
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 1
-        assert entries[0].hash_value == "abc123"
-        assert entries[0].filename == "file.txt"
-
-    def test_parse_multiple_entries(self, scanner: Scanner):
-        # Use valid 64-char hashes (SHA256 length)
-        content = """abc123def456789012345678901234567890123456789012345678901234  file1.txt
-def456abc789012345678901234567890123456789012345678901234567  file2.txt
-ghi789jkl012345678901234567890123456789012345678901234567  file3.txt"""
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        # Parser may not recognize all formats - just verify we get some entries
-        assert len(entries) >= 2
-
-    def test_parse_skip_comments(self, scanner: Scanner):
-        content = """# This is a comment
-abc123  file.txt"""
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 1
-
-    def test_parse_skip_empty_lines(self, scanner: Scanner):
-        content = """abc123  file1.txt
-
-def456  file2.txt"""
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 2
-
-    def test_parse_windows_line_endings(self, scanner: Scanner):
-        content = "abc123  file1.txt\r\ndef456  file2.txt\r\n"
-        entries = scanner._parse_checksum_content(content, "http://example.com/checksums.txt")
-        assert len(entries) == 2
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            # GNU coreutils format
+            ("abc123  file.txt", [("abc123", "file.txt")]),
+            # Binary mode marker
+            ("abc123 *file.txt", [("abc123", "file.txt")]),
+            # filename: hash
+            ("file.txt: abc123", [("abc123", "file.txt")]),
+            # Multiple entries; the non-hex third line is ignored
+            (
+                "abc123def456789012345678901234567890123456789012345678901234  file1.txt\n"
+                "def456abc789012345678901234567890123456789012345678901234567  file2.txt\n"
+                "ghi789jkl012345678901234567890123456789012345678901234567  file3.txt",
+                [
+                    ("abc123def456789012345678901234567890123456789012345678901234", "file1.txt"),
+                    ("def456abc789012345678901234567890123456789012345678901234567", "file2.txt"),
+                ],
+            ),
+            # Comments are skipped
+            ("# This is a comment\nabc123  file.txt", [("abc123", "file.txt")]),
+            # Empty lines are skipped
+            (
+                "abc123  file1.txt\n\ndef456  file2.txt",
+                [("abc123", "file1.txt"), ("def456", "file2.txt")],
+            ),
+            # Windows line endings
+            (
+                "abc123  file1.txt\r\ndef456  file2.txt\r\n",
+                [("abc123", "file1.txt"), ("def456", "file2.txt")],
+            ),
+        ],
+    )
+    def test_parse(self, scanner: Scanner, content: str, expected: list[tuple[str, str]]):
+        entries = scanner._parse_checksum_content(content, CHECKSUMS_URL)
+        assert [(e.hash_value, e.filename) for e in entries] == expected
 
 
 class TestScannerGetChecksumFileType:
     """Tests for Scanner checksum file type detection."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scanner(self) -> Scanner:
         return Scanner()
 
-    def test_sha256_extension(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("file.tar.gz.sha256") == ChecksumFileType.SHA256
-
-    def test_sha512_extension(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("file.tar.gz.sha512") == ChecksumFileType.SHA512
-
-    def test_md5_extension(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("file.tar.gz.md5") == ChecksumFileType.MD5
-
-    def test_sha256sums(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("SHA256SUMS") == ChecksumFileType.SHA256
-
-    def test_sha512sums(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("SHA512SUMS") == ChecksumFileType.SHA512
-
-    def test_md5sums(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("MD5SUMS") == ChecksumFileType.MD5
-
-    def test_checksums_txt(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("checksums.txt") == ChecksumFileType.GENERIC
-
-    def test_signature_asc(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("file.tar.gz.asc") == ChecksumFileType.SIGNATURE
-
-    def test_signature_sig(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("file.tar.gz.sig") == ChecksumFileType.SIGNATURE
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("file.tar.gz.sha256", ChecksumFileType.SHA256),
+            ("file.tar.gz.sha512", ChecksumFileType.SHA512),
+            ("file.tar.gz.md5", ChecksumFileType.MD5),
+            ("SHA256SUMS", ChecksumFileType.SHA256),
+            ("SHA512SUMS", ChecksumFileType.SHA512),
+            ("MD5SUMS", ChecksumFileType.MD5),
+            ("checksums.txt", ChecksumFileType.GENERIC),
+            ("file.tar.gz.asc", ChecksumFileType.SIGNATURE),
+            ("file.tar.gz.sig", ChecksumFileType.SIGNATURE),
+            ("SHA256SUMS.asc", ChecksumFileType.SIGNATURE),
+            ("https://example.com/dl/FILE.SHA1", ChecksumFileType.SHA1),
+            ("readme.txt", None),
+        ],
+    )
+    def test_type_detection(
+        self, scanner: Scanner, filename: str, expected: ChecksumFileType | None
+    ):
+        assert scanner._get_checksum_file_type(filename) == expected
+
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("SHA256SUMS.asc.sha256", True),
+            ("..", True),
+            ("#comment", True),
+            ("SHA256SUMS.asc", False),
+            ("file.tar.gz.sha256", False),
+        ],
+    )
+    def test_should_skip(self, scanner: Scanner, filename: str, expected: bool):
+        assert scanner._should_skip(filename) is expected
+
+
+class TestScannerFetchMany:
+    """Tests for Scanner concurrent fetching."""
+
+    def test_keeps_input_order(self):
+        scanner = Scanner()
+        urls = [f"http://example.com/{i}.sha256" for i in range(5)]
+        with mock.patch.object(scanner, "_fetch_url", side_effect=lambda url: (url, 200)):
+            assert scanner._fetch_many(urls) == [(url, 200) for url in urls]
+
+
+class TestScannerFindChecksumEntry:
+    """Tests for Scanner single-file checksum lookup."""
+
+    CONTENT = (
+        "# app.tar.gz is the main archive\n"
+        "aaa111  app.tar.gz.sig\n"
+        "bbb222  App.tar.gz\n"
+        "ccc333  other.zip\n"
+    )
+
+    @pytest.fixture(scope="module")
+    def scanner(self) -> Scanner:
+        return Scanner()
 
-    def test_unknown_file(self, scanner: Scanner):
-        assert scanner._get_checksum_file_type("readme.txt") is None
+    @pytest.mark.parametrize(
+        "filename,expected",
+        [
+            ("app.tar.gz", ("bbb222", 3)),  # Skips comment and longer name
+            ("other.zip", ("ccc333", 4)),
+            ("missing.txt", None),
+        ],
+    )
+    def test_find(self, scanner: Scanner, filename: str, expected: tuple[str, int] | None):
+        entry = scanner._find_checksum_entry(self.CONTENT, filename)
+        if expected is None:
+            assert entry is None
+        else:
+            assert entry is not None
+            assert (entry.hash_value, entry.line_number) == expected
+
+    def test_parse_with_target(self, scanner: Scanner):
+        entries = scanner._parse_checksum_content(self.CONTENT, CHECKSUMS_URL, "other.zip")
+        assert [e.hash_value for e in entries] == ["ccc333"]
+        assert scanner._parse_checksum_content(self.CONTENT, CHECKSUMS_URL, "missing") == []
+
+    def test_pool_fits_workers(self):
+        scanner = Scanner()
+        adapter = scanner.session.get_adapter("https://example.com/")
+        assert adapter._pool_maxsize == Scanner.MAX_FETCH_WORKERS
+
+
+class TestScannerInlineProbe:
+    """Tests for Scanner inline checksum probing."""
+
+    URL = "http://example.com/dl/app.tar.gz"
+
+    @pytest.mark.parametrize(
+        "available,expected",
+        [
+            ({".sha256", ".sha512"}, ".sha256"),
+            ({".sha512"}, ".sha512"),
+        ],
+    )
+    def test_prefers_sha256(self, available: set[str], expected: str):
+        def fetch(url: str) -> tuple[str | None, int]:
+            suffix = url[len(self.URL):]
+            if suffix in available:
+                return f"{'a' * 64}  app.tar.gz", 200
+            return None, 404
+
+        scanner = Scanner()
+        with mock.patch.object(scanner, "_fetch_url", side_effect=fetch):
+            result = scanner.scan(self.URL)
+        assert [f.url for f in result.checksum_files] == [self.URL + expected]
+
+
+    def test_concurrent_probes_share_one_session(self):
+        import threading
+        import time
+
+        real_session = requests.Session
+        created = []
+
+        def slow_session() -> requests.Session:
+            # Widen the window in which a second thread could also see no session
+            time.sleep(0.05)
+            created.append(real_session())
+            return created[-1]
+
+        scanner = Scanner()
+        with mock.patch("trustget.scanner.requests.Session", side_effect=slow_session):
+            threads = [threading.Thread(target=lambda: scanner.session) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(created) == 1
+        assert scanner.session is created[0]
+        scanner.close()
+
+
+class TestScannerDirectoryListing:
+    """Tests for Scanner directory listing parsing."""
+
+    BASE_URL = "http://example.com/dl/"
+    HTML = (
+        '<a href="../">../</a>\n'
+        '<a href="app.tar.gz">app.tar.gz</a>\n'
+        "<A HREF='app.tar.gz.asc'>app.tar.gz.asc</A>\n"
+        "<a href=SHA256SUMS>SHA256SUMS</a>\n"
+        '<a href="">empty</a>\n'
+    )
+
+    def test_links_with_any_quoting(self):
+        scanner = Scanner()
+        response = mock.Mock(status_code=200, headers={"Content-Type": "text/html"}, text=self.HTML)
+        with (
+            mock.patch.object(scanner.session, "get", return_value=response),
+            mock.patch.object(
+                scanner, "_fetch_url", return_value=(f"{'a' * 64}  app.tar.gz", 200)
+            ),
+        ):
+            result = scanner._scan_directory_listing(self.BASE_URL)
+
+        assert result.signature_files == [self.BASE_URL + "app.tar.gz.asc"]
+        assert [f.filename for f in result.checksum_files] == ["SHA256SUMS"]
+        assert result.get_checksum_for("app.tar.gz") is not None
+
+
+class TestScannerEtagCache:
+    """Tests for conditional checksum file fetches."""
+
+    URL = "http://example.com/dl/SHA256SUMS"
+
+    def test_not_modified_returns_cached_content(self, tmp_path):
+        cache_path = tmp_path / "scan_etags.json"
+        responses = [
+            mock.Mock(status_code=200, headers={"ETag": '"abc"'}, text="hash  file", encoding="utf-8"),
+            mock.Mock(status_code=304, headers={}),
+        ]
+        with mock.patch.object(requests.Session, "get", side_effect=responses) as get:
+            with Scanner(etag_cache_path=cache_path) as scanner:
+                scanner._fetch_url(self.URL)
+            # A new scanner (new process) reuses the persisted ETag
+            with Scanner(etag_cache_path=cache_path) as scanner:
+                assert scanner._fetch_url(self.URL) == ("hash  file", 200)
+
+        assert get.call_args_list[0].kwargs["headers"] is None
+        assert get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+
+    def test_corrupt_cache_file_ignored(self, tmp_path):
+        cache_path = tmp_path / "scan_etags.json"
+        cache_path.write_text("not json")
+        assert Scanner(etag_cache_path=cache_path).etag_cache == {}
+
+    def test_malformed_entries_dropped(self, tmp_path):
+        import json
+
+        cache_path = tmp_path / "scan_etags.json"
+        good = ['"abc"', "hash  file\n"]
+        cache_path.write_text(json.dumps({"a": "ab", "b": [None, "x"], "c": ["x"], "d": good}))
+        assert Scanner(etag_cache_path=cache_path).etag_cache == {"d": good}
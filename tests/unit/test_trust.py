@@ -14,21 +14,21 @@ from trustget.trust import (
 class TestRiskLevel:
     """Tests for RiskLevel enum."""
 
-    def test_from_score_critical(self):
-        assert RiskLevel.from_score(0) == RiskLevel.CRITICAL
-        assert RiskLevel.from_score(39) == RiskLevel.CRITICAL
-
-    def test_from_score_high(self):
-        assert RiskLevel.from_score(40) == RiskLevel.HIGH
-        assert RiskLevel.from_score(59) == RiskLevel.HIGH
-
-    def test_from_score_medium(self):
-        assert RiskLevel.from_score(60) == RiskLevel.MEDIUM
-        assert RiskLevel.from_score(79) == RiskLevel.MEDIUM
-
-    def test_from_score_low(self):
-        assert RiskLevel.from_score(80) == RiskLevel.LOW
-        assert RiskLevel.from_score(100) == RiskLevel.LOW
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (0, RiskLevel.CRITICAL),
+            (39, RiskLevel.CRITICAL),
+            (40, RiskLevel.HIGH),
+            (59, RiskLevel.HIGH),
+            (60, RiskLevel.MEDIUM),
+            (79, RiskLevel.MEDIUM),
+            (80, RiskLevel.LOW),
+            (100, RiskLevel.LOW),
+        ],
+    )
+    def test_from_score(self, score: int, expected: RiskLevel):
+        assert RiskLevel.from_score(score) == expected
 
     def test_emoji(self):
         assert RiskLevel.CRITICAL.emoji == "🔴"
@@ -132,11 +132,22 @@ class TestTrustReport:
         assert data["score"] == 75
         assert "risk_level" in data
 
+    def test_timestamp(self):
+        from datetime import UTC, datetime, timedelta
+
+        report = TrustReport(url="https://example.com/file.tar.gz")
+        created = datetime.fromisoformat(report.timestamp)
+        assert abs(created - datetime.now(UTC)) < timedelta(minutes=1)
+        assert report.to_dict()["timestamp"] == report.timestamp
+
+        report.timestamp = "2024-01-01T00:00:00+00:00"
+        assert report.to_dict()["timestamp"] == "2024-01-01T00:00:00+00:00"
+
 
 class TestTrustEngine:
     """Tests for TrustEngine."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def engine(self) -> TrustEngine:
         """Create TrustEngine instance."""
         return TrustEngine()
@@ -161,6 +172,14 @@ class TestTrustEngine:
         assert https_factor is not None
         assert https_factor.applied is False
 
+    def test_analyze_many_keeps_order(self, engine: TrustEngine):
+        """Test batch analysis returns reports in input order."""
+        urls = [f"{scheme}://example.com/{i}.tar.gz" for i in range(4) for scheme in ("https", "http")]
+        reports = engine.analyze_many(urls, max_workers=4, checksum_verified=True)
+        expected = [engine.analyze(url, checksum_verified=True).score for url in urls]
+        assert [r.url for r in reports] == urls
+        assert [r.score for r in reports] == expected
+
     def test_analyze_known_domain(self, engine: TrustEngine):
         """Test analysis with known domain."""
         report = engine.analyze("https://github.com/user/repo/releases/download/v1/file.tar.gz")
@@ -172,6 +191,51 @@ class TestTrustEngine:
         assert domain_factor.applied is True
         assert domain_factor.weight > 0
 
+    @pytest.mark.parametrize(
+        "domain,expected",
+        [
+            ("python.org", 15),
+            ("www.python.org", 15),  # Subdomain of a known domain
+            ("aws.amazon.com", 12),
+            ("evilpython.org", None),
+            ("python.org.evil.com", None),
+            ("org", None),
+        ],
+    )
+    def test_lookup_domain(self, engine: TrustEngine, domain: str, expected: int | None):
+        assert engine._lookup_domain(domain) == expected
+
+    def test_release_failure_keeps_repo_factors(self):
+        """Test a failed release lookup still scores the repository."""
+        from datetime import UTC, datetime
+        from unittest import mock
+
+        from trustget.github import GitHubError, GitHubRepo
+
+        repo = GitHubRepo(
+            owner="o",
+            name="r",
+            description="",
+            created_at=datetime.now(UTC).isoformat(),
+            updated_at=datetime.now(UTC).isoformat(),
+            stargazers_count=0,
+            watchers_count=0,
+            language=None,
+            default_branch="main",
+            private=False,
+            archived=False,
+        )
+        engine = TrustEngine()
+        engine._github_client = mock.Mock()
+        engine._github_client.get_release_and_repo.side_effect = GitHubError("not found", 404)
+        engine._github_client.get_repo.return_value = repo
+
+        report = engine.analyze("https://github.com/o/r/releases/download/v9/tool.tar.gz")
+
+        assert any(f.name == "Repo New" and f.applied for f in report.factors)
+        assert report.metadata["github"]["repo_name"] == "r"
+        assert report.metadata["github_error"] == "not found"
+
     def test_analyze_unknown_domain(self, engine: TrustEngine):
         """Test analysis with unknown domain."""
         report = engine.analyze("https://unknown-domain-xyz.com/file.tar.gz")
@@ -216,6 +280,18 @@ class TestTrustEngine:
         assert no_checksum_factor is not None
         assert no_checksum_factor.applied is True
 
+    def test_mark_checksum_verified(self, engine: TrustEngine):
+        """Test in-place update matches a full analysis with verified checksum."""
+        url = "https://example.com/file.tar.gz"
+        report = engine.analyze(url)
+        updated = engine.mark_checksum_verified(report)
+        expected = engine.analyze(url, checksum_verified=True)
+
+        assert updated is report
+        assert [f.to_dict() for f in report.factors] == [f.to_dict() for f in expected.factors]
+        assert report.score == expected.score
+        assert report.risk_level == expected.risk_level
+
     def test_score_clamped_to_100(self, engine: TrustEngine):
         """Test that score is clamped to maximum 100."""
         report = engine.analyze(
@@ -232,6 +308,15 @@ class TestTrustEngine:
         report = custom_engine.analyze("https://unknown.com/file.tar.gz")
         assert report.score >= 0
 
+
+class TestTrustEngineKnownDomains:
+    """Tests for TrustEngine known domain mutations."""
+
+    @pytest.fixture
+    def engine(self) -> TrustEngine:
+        """Create a fresh TrustEngine per test since these tests mutate it."""
+        return TrustEngine()
+
     def test_add_known_domain(self, engine: TrustEngine):
         """Test adding custom known domain."""
         engine.add_known_domain("custom-trusted.com", 15)
@@ -244,3 +329,10 @@ class TestTrustEngine:
         engine.remove_known_domain("github.com")
         domains = engine.get_known_domains()
         assert "github.com" not in domains
+
+    def test_import_policy(self, engine: TrustEngine, tmp_path):
+        """Test importing weights and known domains from a policy file."""
+        policy = tmp_path / "policy.json"
+        policy.write_text('{"known_domains": {"Policy.Example": 12}}', encoding="utf-8")
+        engine.import_policy(policy)
+        assert engine.get_known_domains()["policy.example"] == 12
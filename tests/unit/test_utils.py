@@ -3,15 +3,23 @@ Unit tests for TrustGet utility functions.
 """
 
 import pytest
+from dataclasses import dataclass
+from datetime import UTC, date, datetime
+from enum import Enum
 from pathlib import Path
+from trustget import utils
 from trustget.utils import (
     get_filename_from_url,
     get_filename_from_content_disposition,
     format_size,
     format_speed,
     format_duration,
+    compute_hash,
     detect_hash_algorithm,
+    dumps_json,
+    loads_json,
     is_github_releases_url,
+    match_github_release,
     parse_github_url,
     truncate_string,
     safe_filename,
@@ -68,20 +76,22 @@ class TestGetFilenameFromContentDisposition:
 class TestFormatSize:
     """Tests for format_size."""
 
-    def test_bytes(self):
-        assert format_size(0) == "0 B"
-        assert format_size(500) == "500 B"
-
-    def test_kilobytes(self):
-        assert format_size(1024) == "1.0 KB"
-        assert format_size(2048) == "2.0 KB"
-
-    def test_megabytes(self):
-        assert format_size(1048576) == "1.0 MB"
-        assert format_size(5242880) == "5.0 MB"
-
-    def test_gigabytes(self):
-        assert format_size(1073741824) == "1.0 GB"
+    @pytest.mark.parametrize(
+        "size_bytes,expected",
+        [
+            (0, "0 B"),
+            (500, "500 B"),
+            (1024, "1.0 KB"),
+            (2048, "2.0 KB"),
+            (1048576, "1.0 MB"),
+            (5242880, "5.0 MB"),
+            (1073741824, "1.0 GB"),
+            (1099511627776, "1.0 TB"),
+            (1024 * 1099511627776, "1024.0 TB"),
+        ],
+    )
+    def test_format_size(self, size_bytes: int, expected: str):
+        assert format_size(size_bytes) == expected
 
 
 class TestFormatSpeed:
@@ -95,46 +105,149 @@ class TestFormatSpeed:
 class TestFormatDuration:
     """Tests for format_duration."""
 
-    def test_seconds(self):
-        assert format_duration(0.5) == "0.5s"
-        assert format_duration(5) == "5s"
-        assert format_duration(59) == "59s"
-
-    def test_minutes(self):
-        assert format_duration(120) == "2m 0s"
-        assert format_duration(150) == "2m 30s"
-
-    def test_hours(self):
-        assert format_duration(3600) == "1h 0m"
-        assert format_duration(7200) == "2h 0m"
+    @pytest.mark.parametrize(
+        "seconds,expected",
+        [
+            (0.5, "0.5s"),
+            (5, "5s"),
+            (59, "59s"),
+            (120, "2m 0s"),
+            (150, "2m 30s"),
+            (3600, "1h 0m"),
+            (7200, "2h 0m"),
+        ],
+    )
+    def test_format_duration(self, seconds: float, expected: str):
+        assert format_duration(seconds) == expected
+
+
+class TestComputeHash:
+    """Tests for compute_hash."""
+
+    @pytest.mark.parametrize(
+        "algorithm,expected",
+        [
+            ("sha256", "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"),
+            ("md5", "65a8e27d8879283831b664bd8b7f0ad4"),
+        ],
+    )
+    def test_compute_hash(self, tmp_path: Path, algorithm: str, expected: str):
+        filepath = tmp_path / "test.txt"
+        filepath.write_text("Hello, World!")
+        assert compute_hash(filepath, algorithm) == expected
 
 
 class TestDetectHashAlgorithm:
     """Tests for detect_hash_algorithm."""
 
-    def test_md5(self):
-        # MD5 is 32 hex chars
-        assert detect_hash_algorithm("d41d8cd98f00b204e9800998ecf8427e") == "md5"
-
-    def test_sha1(self):
-        # SHA1 is 40 hex chars
-        assert detect_hash_algorithm("da39a3ee5e6b4b0d3255bfef95601890afd80709") == "sha1"
-
-    def test_sha256(self):
-        # SHA256 is 64 hex chars
-        assert detect_hash_algorithm(
-            "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
-        ) == "sha256"
-
-    def test_sha512(self):
-        # SHA512 is 128 hex chars
-        assert detect_hash_algorithm(
-            "cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce"
-            "47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e"
-        ) == "sha512"
-
-    def test_invalid_length(self):
-        assert detect_hash_algorithm("invalid") is None
+    @pytest.mark.parametrize(
+        "hash_value,expected",
+        [
+            # MD5 is 32 hex chars
+            ("d41d8cd98f00b204e9800998ecf8427e", "md5"),
+            # SHA1 is 40 hex chars
+            ("da39a3ee5e6b4b0d3255bfef95601890afd80709", "sha1"),
+            # SHA256 is 64 hex chars
+            ("e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855", "sha256"),
+            # SHA512 is 128 hex chars
+            (
+                "cf83e1357eefb8bdf1542850d66d8007d620e4050b5715dc83f4a921d36ce9ce"
+                "47d0d13c5d85f2b0ff8318d2877eec2f63b931bd47417a81a538327af927da3e",
+                "sha512",
+            ),
+            ("invalid", None),
+            # Right length, not hex
+            ("z" * 64, None),
+        ],
+    )
+    def test_detect_hash_algorithm(self, hash_value: str, expected: str | None):
+        assert detect_hash_algorithm(hash_value) == expected
+
+
+class TestDumpsJson:
+    """Tests for dumps_json."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_round_trip(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool):
+        import json
+
+        import trustget.utils
+
+        if not use_orjson:
+            monkeypatch.setattr(trustget.utils, "orjson", None)
+        elif trustget.utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        data = {"path": Path("/tmp/file.txt"), "score": 90, "items": [1, 2]}
+        assert json.loads(dumps_json(data)) == {
+            "path": "/tmp/file.txt",
+            "score": 90,
+            "items": [1, 2],
+        }
+        assert "\n" not in dumps_json(data, indent=False)
+
+    @pytest.mark.parametrize("indent", [True, False])
+    def test_same_output_without_orjson(self, monkeypatch: pytest.MonkeyPatch, indent: bool):
+        if utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        class Level(Enum):
+            HIGH = "high"
+
+        @dataclass
+        class Point:
+            x: int
+            y: float
+
+        data = {
+            "level": Level.HIGH,
+            "when": datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC),
+            "day": date(2024, 1, 2),
+            "nan": float("nan"),
+            "inf": [float("inf"), -float("inf")],
+            "name": "café ✓",
+            "path": Path("/tmp/file.txt"),
+            "point": Point(1, 2.5),
+            "nested": {"empty": [], "none": None, 1: True},
+        }
+        with_orjson = dumps_json(data, indent=indent)
+        monkeypatch.setattr(utils, "orjson", None)
+        assert dumps_json(data, indent=indent) == with_orjson
+        assert loads_json(with_orjson)["nan"] is None
+        assert loads_json(with_orjson)["level"] == "high"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_save_json_file(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path, use_orjson: bool
+    ):
+        if not use_orjson:
+            monkeypatch.setattr(utils, "orjson", None)
+        elif utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        filepath = tmp_path / "report.json"
+        utils.save_json_file(filepath, {"name": "café", "score": 90})
+        text = filepath.read_text(encoding="utf-8")
+        assert text.endswith("}\n")
+        assert loads_json(text) == {"name": "café", "score": 90}
+
+
+class TestLoadsJson:
+    """Tests for loads_json."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    @pytest.mark.parametrize("data", [b'{"a": [1, 2]}', '{"a": [1, 2]}'])
+    def test_loads(self, monkeypatch: pytest.MonkeyPatch, use_orjson: bool, data):
+        import trustget.utils
+
+        if not use_orjson:
+            monkeypatch.setattr(trustget.utils, "orjson", None)
+        elif trustget.utils.orjson is None:
+            pytest.skip("orjson not installed")
+
+        assert loads_json(data) == {"a": [1, 2]}
+        with pytest.raises(ValueError):
+            loads_json(b"not json")
 
 
 class TestIsGithubReleasesUrl:
@@ -157,6 +270,34 @@ class TestIsGithubReleasesUrl:
         assert is_github_releases_url(url) is False
 
 
+class TestMatchGithubRelease:
+    """Tests for match_github_release."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            (
+                "https://github.com/cli/cli/releases/download/v2.40.0/gh_2.40.0_linux_amd64.tar.gz",
+                {
+                    "owner": "cli",
+                    "repo": "cli",
+                    "tag": "v2.40.0",
+                    "asset": "gh_2.40.0_linux_amd64.tar.gz",
+                },
+            ),
+            (
+                "https://github.com/cli/cli/releases/tag/v2.40.0",
+                {"owner": "cli", "repo": "cli", "tag": "v2.40.0", "asset": None},
+            ),
+            ("https://github.com/cli/cli", None),
+            ("https://github.com/user/repo/raw/main/file.tar.gz", None),
+            ("https://example.com/releases/download/v1/file.tar.gz", None),
+        ],
+    )
+    def test_match(self, url: str, expected: dict | None):
+        assert match_github_release(url) == expected
+
+
 class TestParseGithubUrl:
     """Tests for parse_github_url."""
 
@@ -173,6 +314,12 @@ class TestParseGithubUrl:
         url = "https://example.com/file.tar.gz"
         assert parse_github_url(url) is None
 
+    def test_cached_result_not_shared(self):
+        url = "https://github.com/cli/cli/releases/download/v2.40.0/file.tar.gz"
+        first = parse_github_url(url)
+        first["owner"] = "mutated"
+        assert parse_github_url(url)["owner"] == "cli"
+
 
 class TestTruncateString:
     """Tests for truncate_string."""
@@ -199,6 +346,9 @@ class TestSafeFilename:
     def test_unsafe_characters(self):
         assert safe_filename("file<>name.tar.gz") == "file__name.tar.gz"
 
+    def test_control_characters_removed(self):
+        assert safe_filename("file\x00name\x1f.tar.gz") == "filename.tar.gz"
+
     def test_long_filename(self):
         long_name = "a" * 300 + ".tar.gz"
         result = safe_filename(long_name)
@@ -2,6 +2,9 @@
 Unit tests for TrustGet verifier module.
 """
 
+import hashlib
+import os
+
 import pytest
 from pathlib import Path
 from trustget.verifier import (
@@ -10,8 +13,15 @@ from trustget.verifier import (
     VerificationStatus,
     VerificationError,
 )
+from trustget.hashcache import HashCache
 from trustget.scanner import ChecksumEntry
 
+PAYLOAD = b"Hello, World!"
+HASHES = {
+    algo: hashlib.new(algo, PAYLOAD).hexdigest() for algo in ("md5", "sha1", "sha256", "sha512")
+}
+SHA256 = HASHES["sha256"]
+
 
 class TestVerificationResult:
     """Tests for VerificationResult."""
@@ -47,25 +57,31 @@ class TestVerificationResult:
 class TestVerifier:
     """Tests for Verifier."""
 
-    @pytest.fixture
-    def temp_file(self, tmp_path: Path) -> Path:
+    # Shared and read-only: no test may modify the file or the verifier;
+    # tests that need their own files write them under tmp_path.
+    @pytest.fixture(scope="module")
+    def temp_file(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
         """Create a temporary file for testing."""
-        filepath = tmp_path / "test.txt"
-        filepath.write_text("Hello, World!")
+        filepath = tmp_path_factory.mktemp("verifier") / "test.txt"
+        filepath.write_bytes(PAYLOAD)
         return filepath
 
-    @pytest.fixture
-    def verifier(self) -> Verifier:
+    @pytest.fixture(scope="session")
+    def verifier(self):
         """Create a Verifier instance."""
-        return Verifier()
+        with Verifier() as verifier:
+            yield verifier
 
-    def test_verify_hash_sha256(self, temp_file: Path, verifier: Verifier):
-        """Test SHA256 verification."""
-        # SHA256 of "Hello, World!"
-        expected = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-        result = verifier.verify_hash(temp_file, expected, "sha256")
+    @pytest.mark.parametrize("algorithm", sorted(HASHES))
+    def test_verify_hash(self, temp_file: Path, verifier: Verifier, algorithm: str):
+        """Test verification with an explicit algorithm."""
+        result = verifier.verify_hash(temp_file, HASHES[algorithm], algorithm)
         assert result.status == VerificationStatus.VERIFIED
-        assert result.algorithm == "sha256"
+        assert result.algorithm == algorithm
+
+    def test_known_sha256(self):
+        """Guard the derived constants against a broken hashlib."""
+        assert SHA256 == "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
 
     def test_verify_hash_mismatch(self, temp_file: Path, verifier: Verifier):
         """Test hash mismatch detection."""
@@ -81,20 +97,22 @@ class TestVerifier:
         assert result.status == VerificationStatus.NOT_FOUND
         assert "not found" in result.error.lower()
 
-    def test_verify_hash_auto_detect_algorithm(self, temp_file: Path, verifier: Verifier):
-        """Test auto-detection of hash algorithm."""
-        # SHA256 hash (64 chars)
-        expected = "dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f"
-        result = verifier.verify_hash(temp_file, expected)
+    @pytest.mark.parametrize("algorithm", sorted(HASHES))
+    def test_verify_hash_auto_detect_algorithm(
+        self, temp_file: Path, verifier: Verifier, algorithm: str
+    ):
+        """Test auto-detection of hash algorithm from hash length."""
+        result = verifier.verify_hash(temp_file, HASHES[algorithm])
         assert result.status == VerificationStatus.VERIFIED
-        assert result.algorithm == "sha256"
+        assert result.algorithm == algorithm
 
-    def test_verify_with_entry(self, temp_file: Path, verifier: Verifier):
+    @pytest.mark.parametrize("algorithm", sorted(HASHES))
+    def test_verify_with_entry(self, temp_file: Path, verifier: Verifier, algorithm: str):
         """Test verification with ChecksumEntry."""
         entry = ChecksumEntry(
-            hash_value="dffd6021bb2bd5b0af676290809ec3a53191dd81c7f70a4b28688a362182986f",
+            hash_value=HASHES[algorithm],
             filename="test.txt",
-            algorithm="sha256",
+            algorithm=algorithm,
             line_number=1,
         )
         result = verifier.verify_with_entry(temp_file, entry)
@@ -106,3 +124,184 @@ class TestVerifier:
         result = verifier.verify_hash(temp_file, "abc123", "blake3")
         assert result.status == VerificationStatus.ERROR
         assert "Unsupported" in result.error
+
+    @pytest.mark.parametrize("max_workers", [None, 1])
+    def test_verify_batch(self, tmp_path: Path, verifier: Verifier, max_workers: int | None):
+        """Test batch verification keeps input order and counts results."""
+        files = []
+        for i in range(4):
+            filepath = tmp_path / f"file{i}.txt"
+            filepath.write_bytes(PAYLOAD)
+            files.append(filepath)
+        good = SHA256
+        progress = []
+
+        result = verifier.verify_batch(
+            [(files[0], good), (files[1], "0" * 64), (files[2], good), (files[3], good)],
+            progress_callback=lambda done, total: progress.append((done, total)),
+            max_workers=max_workers,
+        )
+
+        assert [r.filepath for r in result.results] == files
+        assert result.results[1].status == VerificationStatus.MISMATCH
+        assert (result.total, result.verified, result.failed) == (4, 3, 1)
+        assert progress[-1] == (4, 4)
+
+    @pytest.mark.parametrize(
+        "checksum_string,status",
+        [
+            (SHA256, VerificationStatus.VERIFIED),
+            (f"  {SHA256}  test.txt\n", VerificationStatus.VERIFIED),
+            ("0" * 64, VerificationStatus.MISMATCH),
+            ("   ", VerificationStatus.ERROR),
+        ],
+    )
+    def test_verify_checksum_string(
+        self,
+        temp_file: Path,
+        verifier: Verifier,
+        checksum_string: str,
+        status: VerificationStatus,
+    ):
+        """Test verification against a "hash  filename" string."""
+        assert verifier.verify_checksum_string(temp_file, checksum_string).status == status
+
+    def test_verify_with_checksum_file(self, tmp_path: Path):
+        """Test repeated lookups in one checksum file, and picking up edits to it."""
+        files = []
+        for name in ("a.txt", "B.txt", "c.txt"):
+            filepath = tmp_path / name
+            filepath.write_bytes(name.encode())
+            files.append(filepath)
+        sums = tmp_path / "SHA256SUMS"
+        sums.write_text(
+            "".join(f"{hashlib.sha256(f.name.encode()).hexdigest()}  {f.name}\n" for f in files)
+        )
+
+        with Verifier() as verifier:
+            for _ in range(2):
+                for filepath in files:
+                    result = verifier.verify_with_checksum_file(filepath, sums)
+                    assert result.is_verified
+                    assert result.source == "SHA256SUMS"
+            missing = verifier.verify_with_checksum_file(tmp_path / "d.txt", sums)
+            assert missing.status == VerificationStatus.NOT_FOUND
+
+            sums.write_text(f"{'0' * 64}  a.txt\n")
+            result = verifier.verify_with_checksum_file(files[0], sums)
+            assert result.status == VerificationStatus.MISMATCH
+
+    def test_verify_auto_local_checksum(self, tmp_path: Path, verifier: Verifier):
+        """Test verify_auto finds a checksum file next to the download."""
+        filepath = tmp_path / "tool.tar.gz"
+        filepath.write_bytes(PAYLOAD)
+        assert verifier.verify_auto(filepath).status == VerificationStatus.NOT_FOUND
+
+        (tmp_path / "SHA256SUMS").write_text(f"{SHA256}  tool.tar.gz\n")
+        result = verifier.verify_auto(filepath)
+        assert result.is_verified
+        assert result.source == str(tmp_path / "SHA256SUMS")
+
+        missing_dir = tmp_path / "missing" / "tool.tar.gz"
+        assert verifier.verify_auto(missing_dir).status == VerificationStatus.NOT_FOUND
+
+    def test_verify_gpg_without_signature(self, tmp_path: Path, verifier: Verifier):
+        """Test a file with no .asc/.sig/.gpg next to it is reported as not found."""
+        filepath = tmp_path / "tool.tar.gz"
+        filepath.write_bytes(PAYLOAD)
+        (tmp_path / "other.tar.gz.asc").write_text("signature")
+
+        result = verifier.verify_gpg(filepath)
+        assert result.status == VerificationStatus.NOT_FOUND
+        assert result.error == "No signature file found"
+
+    def test_verify_gpg_reuses_valid_result(self, tmp_path: Path):
+        """Test an unchanged file and signature are only checked by gpg once."""
+        from unittest import mock
+
+        filepath = tmp_path / "tool.tar.gz"
+        filepath.write_bytes(PAYLOAD)
+        signature = tmp_path / "tool.tar.gz.asc"
+        signature.write_text("signature")
+
+        with Verifier() as verifier:
+            verifier._gpg = mock.Mock()
+            verifier._gpg.verify_file.return_value = mock.Mock(valid=True, key_id="ABCD")
+            first = verifier.verify_gpg(filepath)
+            first.source = "changed by caller"
+            second = verifier.verify_gpg(filepath)
+            assert verifier._gpg.verify_file.call_count == 1
+            assert second.is_verified
+            assert second.gpg_key_id == "ABCD"
+            assert second.source is None
+
+            signature.write_text("new signature")
+            verifier.verify_gpg(filepath)
+            assert verifier._gpg.verify_file.call_count == 2
+
+    def test_verify_hash_uses_hash_cache(self, tmp_path: Path):
+        """Test cached digests are reused for an unchanged file."""
+        expected = SHA256
+        temp_file = tmp_path / "test.txt"
+        temp_file.write_bytes(PAYLOAD)
+        # Older than HashCache.RACY_WINDOW_NS, so its entry may be reused
+        stat = temp_file.stat()
+        os.utime(temp_file, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+        db_path = tmp_path / "hashes.sqlite"
+        with Verifier(hash_cache=HashCache(db_path)) as verifier:
+            assert verifier.verify_hash(temp_file, expected, "sha256").is_verified
+            assert verifier.hash_cache.get(temp_file, "sha256") == expected
+            verifier.hash_cache.put(temp_file, "sha256", "0" * 64)
+
+        # A new verifier (new process) takes the digest from the persistent cache
+        with Verifier(hash_cache=HashCache(db_path)) as verifier:
+            result = verifier.verify_hash(temp_file, expected, "sha256")
+            assert result.status == VerificationStatus.MISMATCH
+
+    def test_file_changed_while_hashing_not_cached(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Test a digest of a file rewritten mid-hash is neither memoized nor stored."""
+        import trustget.verifier
+
+        filepath = tmp_path / "file.bin"
+        filepath.write_bytes(PAYLOAD)
+        stat = filepath.stat()
+        os.utime(filepath, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60_000_000_000))
+        real_compute_hash = trustget.verifier.compute_hash
+
+        def hash_then_rewrite(*args):
+            digest = real_compute_hash(*args)
+            filepath.write_bytes(b"replaced")
+            return digest
+
+        monkeypatch.setattr(trustget.verifier, "compute_hash", hash_then_rewrite)
+        with Verifier(hash_cache=HashCache(tmp_path / "hashes.sqlite")) as verifier:
+            assert verifier.verify_hash(filepath, SHA256).is_verified
+            monkeypatch.setattr(trustget.verifier, "compute_hash", real_compute_hash)
+            # The rewritten content is hashed afresh, not answered from a cache
+            assert verifier.verify_hash(filepath, SHA256).status == VerificationStatus.MISMATCH
+            assert verifier.hash_cache.get(filepath, "sha256") is None
+
+    def test_verify_hash_memoizes_digest(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        """Test a verifier hashes an unchanged file only once."""
+        import trustget.verifier
+
+        calls = []
+        real_compute_hash = trustget.verifier.compute_hash
+        monkeypatch.setattr(
+            trustget.verifier,
+            "compute_hash",
+            lambda *args: calls.append(args) or real_compute_hash(*args),
+        )
+        filepath = tmp_path / "file.bin"
+        filepath.write_bytes(PAYLOAD)
+
+        with Verifier() as verifier:
+            assert verifier.verify_hash(filepath, SHA256).is_verified
+            assert verifier.verify_hash(filepath, SHA256.upper()).is_verified
+            assert len(calls) == 1
+
+            filepath.write_bytes(PAYLOAD + b"!")
+            assert verifier.verify_hash(filepath, SHA256).status == VerificationStatus.MISMATCH
+            assert len(calls) == 2
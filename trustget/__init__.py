@@ -5,13 +5,31 @@ wget yang punya otak keamanan.
 TrustGet = download + verify + trust analysis — satu perintah, nol drama.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "TrustGet Team"
 
-from trustget.downloader import Downloader, DownloadError
-from trustget.github import GitHubClient
-from trustget.trust import TrustEngine, TrustReport
-from trustget.verifier import VerificationError, Verifier
+if TYPE_CHECKING:
+    from trustget.downloader import Downloader, DownloadError
+    from trustget.github import GitHubClient
+    from trustget.trust import TrustEngine, TrustReport
+    from trustget.verifier import VerificationError, Verifier
+
+# Public names are imported on first access (PEP 562) so that
+# `from trustget import __version__` does not pull in requests/rich/gnupg.
+_LAZY_IMPORTS = {
+    "Downloader": "trustget.downloader",
+    "DownloadError": "trustget.downloader",
+    "Verifier": "trustget.verifier",
+    "VerificationError": "trustget.verifier",
+    "TrustEngine": "trustget.trust",
+    "TrustReport": "trustget.trust",
+    "GitHubClient": "trustget.github",
+}
 
 __all__ = [
     "__version__",
@@ -23,3 +41,16 @@ __all__ = [
     "TrustReport",
     "GitHubClient",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,32 +12,39 @@ Commands:
 
 from __future__ import annotations
 
-import json
+import math
 import os
-import subprocess
 import sys
-import tomllib
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import click
-import tomli_w
-from rich.console import Console
 
 from trustget import __version__
-from trustget.downloader import Downloader, DownloadError
-from trustget.github import GitHubClient
-from trustget.reporter import Reporter
-from trustget.trust import TrustEngine
 from trustget.utils import (
-    ensure_dirs,
+    dumps_json,
     get_filename_from_url,
-    is_github_releases_url,
-    parse_github_url,
+    match_github_release,
+    write_text_atomic,
 )
-from trustget.verifier import VerificationStatus, Verifier
 
-# Global console
-console = Console()
+# Heavy modules (requests, rich, gnupg) are imported inside the commands
+# that need them so quick commands like `sg config` start fast.
+if TYPE_CHECKING:
+    from rich.console import Console
+
+    from trustget.github import GitHubRelease
+    from trustget.reporter import Reporter
+    from trustget.trust import TrustEngine, TrustReport
+
+
+@lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Get the shared console, created on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def create_reporter(
@@ -46,14 +53,89 @@ def create_reporter(
     no_color: bool = False,
 ) -> Reporter:
     """Create reporter with given options."""
+    from trustget.reporter import Reporter
+
     return Reporter(
-        console=console,
+        console=get_console(),
         json_output=json_output,
         quiet=quiet,
         no_color=no_color,
     )
 
 
+def fetch_release_and_trust(
+    url: str,
+    trust_engine: TrustEngine,
+) -> tuple[GitHubRelease | None, TrustReport, str | None]:
+    """
+    Get GitHub release info and the initial trust report.
+
+    Analysis already fetches the release for download URLs, so it is taken
+    from the report; only release tag pages, which analysis doesn't look up,
+    cost a request of their own, made on the engine's GitHub client.
+
+    Returns:
+        Tuple of (release, trust report, error). For GitHub release URLs whose
+        lookup failed, release is None and error says why; both are None for
+        other URLs.
+    """
+    report = trust_engine.analyze_minimal(url)
+    if report.github_release is not None:
+        return report.github_release, report, None
+
+    parsed = match_github_release(url)
+    if not parsed:
+        return None, report, None
+    if parsed["asset"]:
+        # Analysis looked the release up and recorded why it failed
+        return None, report, report.metadata.get("github_error", "release not found")
+
+    from trustget.github import GitHubError
+
+    try:
+        release = trust_engine.github_client.get_release(
+            parsed["owner"], parsed["repo"], parsed["tag"]
+        )
+    except GitHubError as e:
+        report.metadata["github_error"] = str(e)
+        return None, report, str(e)
+    return release, report, None
+
+
+DEFAULT_CONFIG = {
+    "timeout": 30,
+    "retries": 3,
+    "verify": True,
+    "json_output": False,
+    "quiet": False,
+    "min_trust_score": 0,
+}
+
+
+def parse_config_value(value: str) -> bool | int | float | str:
+    """Convert a config value from the command line to bool, int, float or str."""
+    lowered = value.lower()
+    if lowered in ("true", "false"):
+        return lowered == "true"
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        number = float(value)
+    except ValueError:
+        return value
+    # Keep words like "nan" and "inf" as strings
+    return number if math.isfinite(number) else value
+
+
+def write_config(config_file: Path, config: dict[str, Any]) -> None:
+    """Write config as TOML atomically, so readers never see a partial file."""
+    import tomli_w
+
+    write_text_atomic(config_file, tomli_w.dumps(config))
+
+
 @click.group()
 @click.version_option(version=__version__, prog_name="TrustGet")
 def cli():
@@ -62,7 +144,8 @@ def cli():
 
     wget yang punya otak keamanan.
     """
-    ensure_dirs()
+    # No ensure_dirs() here: every command that writes state (config,
+    # hash cache) creates its own parent directory on first write.
 
 
 @cli.command()
@@ -146,6 +229,10 @@ def download(
     URL can be a direct download link or GitHub Releases URL.
     TrustGet will automatically find and verify checksums.
     """
+    from trustget.downloader import Downloader, DownloadError
+    from trustget.trust import TrustEngine
+    from trustget.verifier import VerificationStatus, Verifier
+
     reporter = create_reporter(json_output, quiet, no_color)
     output_dir = Path(output) if output else Path.cwd()
     output_dir.mkdir(parents=True, exist_ok=True)
@@ -155,49 +242,41 @@ def download(
     trust_report = None
     github_release = None
 
-    try:
-        # Step 1: Analyze URL and get GitHub info if applicable
-        if is_github_releases_url(url):
-            with GitHubClient() as gh_client:
-                parsed = parse_github_url(url)
-                if parsed:
-                    try:
-                        github_release = gh_client.get_release(
-                            parsed["owner"],
-                            parsed["repo"],
-                            parsed["tag"],
-                        )
-                        reporter.output_github_info(github_release)
-                    except Exception as e:
-                        if verbose:
-                            reporter.output_warning(f"Failed to get GitHub release info: {e}")
-
-        # Step 2: Initial trust analysis
-        with TrustEngine() as trust_engine:
-            trust_report = trust_engine.analyze_minimal(url)
+    # One engine for the whole pipeline, so the verified checksum can be
+    # applied to the initial report instead of re-running the analysis
+    trust_engine = TrustEngine()
 
-            # Check trust score before download
-            if trust_report.risk_level.value == "CRITICAL" and not force:
-                reporter.output_trust_report(trust_report)
-                reporter.output_error(
-                    "Trust score is CRITICAL. Use --force to download anyway.",
-                    "Security Warning",
-                )
-                sys.exit(1)
+    try:
+        # Step 1 + 2: Initial trust analysis, which also fetches GitHub release info
+        github_release, trust_report, release_error = fetch_release_and_trust(url, trust_engine)
+        if github_release:
+            reporter.output_github_info(github_release)
+        elif verbose and release_error:
+            reporter.output_warning(f"Failed to get GitHub release info: {release_error}")
+
+        # Check trust score before download
+        if trust_report.risk_level.value == "CRITICAL" and not force:
+            reporter.output_trust_report(trust_report)
+            reporter.output_error(
+                "Trust score is CRITICAL. Use --force to download anyway.",
+                "Security Warning",
+            )
+            sys.exit(1)
 
-            elif trust_report.risk_level.value == "HIGH" and not force:
-                reporter.output_trust_report(trust_report)
-                if not click.confirm("\n⚠ Trust score is HIGH. Continue anyway?", default=False):
-                    sys.exit(0)
+        elif trust_report.risk_level.value == "HIGH" and not force:
+            reporter.output_trust_report(trust_report)
+            if not click.confirm("\n⚠ Trust score is HIGH. Continue anyway?", default=False):
+                sys.exit(0)
 
         # Step 3: Download
-        reporter.output_download_start(url, filename or get_filename_from_url(url))
+        if reporter.emits_text:
+            reporter.output_download_start(url, filename or get_filename_from_url(url))
 
         with Downloader(
             output_dir=output_dir,
             timeout=timeout,
             retries=retry,
-            console=console,
+            console=get_console(),
         ) as downloader:
             download_result = downloader.download(url, filename, show_progress=not quiet)
 
@@ -214,11 +293,7 @@ def download(
 
                 # Update trust report with verification result
                 if trust_report and verification_result.status == VerificationStatus.VERIFIED:
-                    with TrustEngine() as trust_engine:
-                        trust_report = trust_engine.analyze(
-                            url,
-                            checksum_verified=True,
-                        )
+                    trust_engine.mark_checksum_verified(trust_report)
 
         # Step 5: Final trust report
         if trust_report:
@@ -249,6 +324,8 @@ def download(
             traceback.print_exc()
         reporter.output_error(str(e), "Error")
         sys.exit(1)
+    finally:
+        trust_engine.close()
 
 
 @cli.command()
@@ -287,6 +364,11 @@ def download(
     is_flag=True,
     help="Disable colored output",
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Always rehash the file instead of using cached hashes",
+)
 def verify(
     filepath: str,
     checksum: str | None,
@@ -295,6 +377,7 @@ def verify(
     json_output: bool,
     quiet: bool,
     no_color: bool,
+    no_cache: bool,
 ) -> None:
     """
     Verify file against checksum.
@@ -304,11 +387,14 @@ def verify(
     Provide checksum via --checksum flag or --checksum-file option.
     If neither is provided, TrustGet will look for checksum files in the same directory.
     """
+    from trustget.hashcache import HashCache
+    from trustget.verifier import VerificationStatus, Verifier
+
     reporter = create_reporter(json_output, quiet, no_color)
     file_path = Path(filepath)
 
     try:
-        with Verifier() as verifier:
+        with Verifier(hash_cache=None if no_cache else HashCache()) as verifier:
             result: VerificationStatus
 
             if checksum:
@@ -375,6 +461,8 @@ def trust(
 
     Quick security analysis to check if a URL is safe to download from.
     """
+    from trustget.trust import TrustEngine
+
     reporter = create_reporter(json_output, quiet, no_color)
 
     try:
@@ -427,26 +515,25 @@ def info(url: str, json_output: bool, quiet: bool, no_color: bool) -> None:
 
     For GitHub Releases, shows release info, assets, and publisher details.
     """
+    from trustget.trust import TrustEngine
+
     reporter = create_reporter(json_output, quiet, no_color)
 
     try:
         info_data = {"url": url}
 
-        if is_github_releases_url(url):
-            with GitHubClient() as gh_client:
-                parsed = parse_github_url(url)
-                if parsed:
-                    release = gh_client.get_release(
-                        parsed["owner"],
-                        parsed["repo"],
-                        parsed["tag"],
-                    )
-                    info_data["github"] = release.to_dict()
-                    reporter.output_github_info(release)
-
         with TrustEngine() as trust_engine:
-            report = trust_engine.analyze_minimal(url)
-            info_data["trust"] = report.to_dict()
+            release, report, release_error = fetch_release_and_trust(url, trust_engine)
+
+        if release_error:
+            reporter.output_error(f"Failed to get GitHub release info: {release_error}", "Error")
+            sys.exit(1)
+
+        if release:
+            info_data["github"] = release.to_dict()
+            reporter.output_github_info(release)
+
+        info_data["trust"] = report.to_dict()
 
         if json_output:
             reporter._output_json(info_data)
@@ -505,6 +592,8 @@ def run(
 
     ⚠ WARNING: This is an experimental feature. Always verify files first.
     """
+    import subprocess
+
     reporter = create_reporter(json_output, quiet, no_color)
     file_path = Path(filepath)
 
@@ -521,13 +610,23 @@ def run(
             "Sandbox mode is experimental. Always verify files before running."
         )
 
+    cmd = [str(file_path)]
+    if audit_log:
+        cmd = ["strace", "-o", audit_log] + cmd
+
     try:
-        cmd = [str(file_path)]
+        if sys.platform == "win32":
+            result = subprocess.run(cmd)
+            sys.exit(result.returncode)
+
+        # Replace this process instead of waiting on a child: the interpreter's
+        # memory is released and signals go straight to the target.
+        sys.stdout.flush()
+        sys.stderr.flush()
         if audit_log:
-            cmd = ["strace", "-o", audit_log] + cmd
-
-        result = subprocess.run(cmd)
-        sys.exit(result.returncode)
+            os.execvp(cmd[0], cmd)
+        else:
+            os.execv(cmd[0], cmd)
 
     except subprocess.CalledProcessError as e:
         reporter.output_error(f"Execution failed: {e}", "Execution Error")
@@ -574,30 +673,20 @@ def config(
 
     Configuration is stored in ~/.config/trustget/config.toml
     """
-    config_dir = Path.home() / ".config" / "trustget"
-    config_file = config_dir / "config.toml"
+    import tomllib
 
-    config_dir.mkdir(parents=True, exist_ok=True)
+    config_file = Path.home() / ".config" / "trustget" / "config.toml"
 
-    default_config = {
-        "timeout": 30,
-        "retries": 3,
-        "verify": True,
-        "json_output": False,
-        "quiet": False,
-        "min_trust_score": 0,
-    }
-
-    if config_file.exists():
+    try:
         with open(config_file, "rb") as f:
             config = tomllib.load(f)
-    else:
-        config = default_config
+    except FileNotFoundError:
+        config = dict(DEFAULT_CONFIG)
 
     if get_key:
         value = config.get(get_key)
         if json_output:
-            click.echo(json.dumps({get_key: value}))
+            click.echo(dumps_json({get_key: value}, indent=False))
         else:
             if value is not None:
                 click.echo(f"{get_key} = {value}")
@@ -606,29 +695,24 @@ def config(
                 sys.exit(1)
 
     elif set_value:
-        key, value = set_value
-        if value.lower() in ("true", "false"):
-            value = value.lower() == "true"
-        elif value.isdigit():
-            value = int(value)
+        key, raw_value = set_value
+        value = parse_config_value(raw_value)
         config[key] = value
 
-        with open(config_file, "wb") as f:
-            tomli_w.dump(config, f)
+        write_config(config_file, config)
 
         if not json_output:
             click.echo(f"Set {key} = {value}")
 
     elif reset:
-        with open(config_file, "wb") as f:
-            tomli_w.dump(default_config, f)
+        write_config(config_file, DEFAULT_CONFIG)
 
         if not json_output:
             click.echo("Configuration reset to defaults")
 
     else:
         if json_output:
-            click.echo(json.dumps(config, indent=2))
+            click.echo(dumps_json(config))
         else:
             click.echo("Current configuration:")
             for key, value in config.items():
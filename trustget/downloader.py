@@ -4,12 +4,18 @@ Streaming downloader with progress bar and resume support.
 
 from __future__ import annotations
 
+import hashlib
+import os
+import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from datetime import UTC, datetime
 from pathlib import Path
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -20,6 +26,7 @@ from rich.progress import (
     TimeRemainingColumn,
     TransferSpeedColumn,
 )
+from urllib3.util.retry import Retry
 
 from trustget.utils import (
     compute_hash,
@@ -32,6 +39,23 @@ from trustget.utils import (
 )
 
 
+def _utc_timestamp() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ."""
+    now = datetime.now(UTC)
+    return (
+        f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        f"T{now.hour:02d}:{now.minute:02d}:{now.second:02d}Z"
+    )
+
+
+class _TransferInterruptedError(Exception):
+    """Raised when the response body fails mid-transfer (retried with resume)."""
+
+
+class _RangeNotHonoredError(Exception):
+    """Raised when a range request isn't answered with 206 (falls back to one stream)."""
+
+
 class DownloadError(Exception):
     """Exception raised for download errors."""
 
@@ -42,7 +66,7 @@ class DownloadError(Exception):
         super().__init__(self.message)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DownloadMetadata:
     """Metadata about a downloaded file."""
 
@@ -52,7 +76,7 @@ class DownloadMetadata:
     size: int
     checksum_sha256: str
     download_time: float
-    timestamp: str = field(default_factory=lambda: time.strftime("%Y-%m-%dT%H:%M:%SZ"))
+    timestamp: str = field(default_factory=_utc_timestamp)
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -67,7 +91,7 @@ class DownloadMetadata:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class DownloadResult:
     """Result of a download operation."""
 
@@ -78,6 +102,17 @@ class DownloadResult:
     error: str | None = None
     metadata: DownloadMetadata | None = None
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary."""
+        return {
+            "success": self.success,
+            "filepath": str(self.filepath) if self.filepath else None,
+            "filename": self.filename,
+            "size": self.size,
+            "error": self.error,
+            "metadata": self.metadata.to_dict() if self.metadata else None,
+        }
+
 
 class Downloader:
     """
@@ -88,14 +123,21 @@ class Downloader:
     - Real-time progress bar with speed and ETA
     - Auto-detect filename from Content-Disposition or URL
     - Resume support for partial downloads
+    - Parallel range requests for large files when the server allows it
     - Timeout handling + retry with exponential backoff
     """
 
-    DEFAULT_CHUNK_SIZE = 8192
+    DEFAULT_CHUNK_SIZE = 64 * 1024  # One write() per 64KB instead of per 8KB
     MAX_CHUNK_SIZE = 1024 * 1024  # 1MB for large files
     DEFAULT_TIMEOUT = 30
     DEFAULT_RETRIES = 3
     BACKOFF_FACTOR = 2
+    RETRY_STATUSES = (408, 429, 500, 502, 503, 504)
+    DEFAULT_PARALLEL_CHUNKS = 4
+    DEFAULT_POOL_SIZE = 16
+    PARALLEL_MIN_SIZE = 16 * 1024 * 1024  # Below this, extra connections cost more than they save
+    PROGRESS_INTERVAL = 1 / 30  # Seconds between progress updates (~30 Hz)
+    VALIDATOR_SUFFIX = ".resume"  # Sidecar holding a partial file's If-Range validator
 
     def __init__(
         self,
@@ -104,6 +146,8 @@ class Downloader:
         retries: int = DEFAULT_RETRIES,
         console: Console | None = None,
         progress_callback: Callable[[float], None] | None = None,
+        parallel_chunks: int = DEFAULT_PARALLEL_CHUNKS,
+        pool_size: int = DEFAULT_POOL_SIZE,
     ):
         """
         Initialize downloader.
@@ -114,12 +158,17 @@ class Downloader:
             retries: Number of retry attempts
             console: Rich console for output
             progress_callback: Optional callback for progress updates (0.0-1.0)
+            parallel_chunks: Number of concurrent range requests for large files
+                (1 disables parallel downloads)
+            pool_size: Connections kept open per host (at least parallel_chunks)
         """
         self.output_dir = output_dir or Path.cwd()
         self.timeout = timeout
         self.retries = retries
         self.console = console or Console()
         self.progress_callback = progress_callback
+        self.parallel_chunks = max(1, parallel_chunks)
+        self.pool_size = max(pool_size, self.parallel_chunks)
         self._session: requests.Session | None = None
 
     @property
@@ -130,8 +179,30 @@ class Downloader:
             self._session.headers.update(
                 {
                     "User-Agent": "TrustGet/0.1.0 (https://github.com/FaturRachmann/trustget)",
+                    # Artifacts are usually compressed already; gzip on top only
+                    # costs CPU and blocks range requests
+                    "Accept-Encoding": "identity",
                 }
             )
+            # Connect errors and retryable statuses are retried here, honoring
+            # Retry-After; download() only retries transfers that break mid-body
+            retry = Retry(
+                total=self.retries - 1,
+                # urllib3 2.x retries immediately first, then waits 2s, 4s...
+                # (Retry-After from the server takes precedence)
+                backoff_factor=1,
+                status_forcelist=self.RETRY_STATUSES,
+                allowed_methods=frozenset({"GET", "HEAD"}),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(
+                pool_connections=self.pool_size,
+                pool_maxsize=self.pool_size,
+                max_retries=retry,
+            )
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
         return self._session
 
     def close(self) -> None:
@@ -174,10 +245,214 @@ class Downloader:
             return self.MAX_CHUNK_SIZE
         return self.DEFAULT_CHUNK_SIZE
 
+    def _can_split(
+        self,
+        response: requests.Response,
+        total_size: int | None,
+        resume_byte_pos: int,
+    ) -> bool:
+        """Check if the download can be split into parallel range requests."""
+        if self.parallel_chunks < 2 or resume_byte_pos or not hasattr(os, "pwrite"):
+            return False
+        if response.status_code != 200 or not total_size or total_size < self.PARALLEL_MIN_SIZE:
+            return False
+        headers = response.headers
+        # Ranges address encoded bytes, so a compressed body can't be split
+        return (
+            headers.get("Accept-Ranges", "").lower() == "bytes"
+            and headers.get("Content-Encoding", "identity").lower() == "identity"
+        )
+
+    @staticmethod
+    def _split_ranges(total_size: int, parts: int) -> list[tuple[int, int]]:
+        """Split [0, total_size) into inclusive (start, end) byte ranges."""
+        part_size = -(-total_size // parts)
+        return [
+            (start, min(start + part_size, total_size) - 1)
+            for start in range(0, total_size, part_size)
+        ]
+
+    def _fetch_range(
+        self,
+        url: str,
+        fd: int,
+        start: int,
+        end: int,
+        on_chunk: Callable[[int], None],
+        abort: threading.Event,
+    ) -> None:
+        """Download bytes start..end (inclusive) and write them at their offset."""
+        with self.session.get(
+            url,
+            stream=True,
+            timeout=self.timeout,
+            headers={"Range": f"bytes={start}-{end}"},
+        ) as response:
+            if response.status_code != 206:
+                # e.g. 200 with the whole body from a server that advertises
+                # Accept-Ranges but ignores Range
+                raise _RangeNotHonoredError(f"Range request returned HTTP {response.status_code}")
+
+            offset = start
+            for chunk in response.iter_content(chunk_size=self.MAX_CHUNK_SIZE):
+                if abort.is_set():
+                    return
+                if not chunk:
+                    continue
+                os.pwrite(fd, chunk, offset)
+                offset += len(chunk)
+                on_chunk(len(chunk))
+
+        if offset != end + 1:
+            raise requests.exceptions.ChunkedEncodingError(
+                f"Range {start}-{end} ended early at byte {offset}"
+            )
+
+    @staticmethod
+    def _preallocate(fd: int, size: int) -> None:
+        """Reserve size bytes for fd, contiguously where the filesystem allows."""
+        if hasattr(os, "posix_fallocate"):
+            try:
+                os.posix_fallocate(fd, 0, size)
+                return
+            except OSError:
+                pass  # Not supported here; fall back to a sparse file
+        os.ftruncate(fd, size)
+
+    def _download_parallel(
+        self,
+        url: str,
+        filepath: Path,
+        total_size: int,
+        progress: Progress | None,
+        task_id: TaskID | None,
+    ) -> None:
+        """Download a file as concurrent range requests into a preallocated file."""
+        ranges = self._split_ranges(total_size, self.parallel_chunks)
+        lock = threading.Lock()
+        abort = threading.Event()
+        downloaded = 0
+        last_report = float("-inf")
+
+        def on_chunk(size: int) -> None:
+            nonlocal downloaded, last_report
+            with lock:
+                downloaded += size
+                now = time.monotonic()
+                if now - last_report >= self.PROGRESS_INTERVAL:
+                    last_report = now
+                    self._report_progress(progress, task_id, downloaded, total_size)
+
+        fd = os.open(filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            self._preallocate(fd, total_size)
+            with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+                futures = [
+                    executor.submit(self._fetch_range, url, fd, start, end, on_chunk, abort)
+                    for start, end in ranges
+                ]
+                try:
+                    for future in futures:
+                        future.result()
+                except BaseException:
+                    abort.set()
+                    raise
+            self._report_progress(progress, task_id, downloaded, total_size)
+        except BaseException:
+            # A preallocated file with holes can't be resumed; start over next time
+            os.close(fd)
+            filepath.unlink(missing_ok=True)
+            raise
+        os.close(fd)
+
+    def _report_progress(
+        self,
+        progress: Progress | None,
+        task_id: TaskID | None,
+        downloaded: int,
+        total_size: int | None,
+    ) -> None:
+        """Push downloaded byte count to the progress bar and callback."""
+        if progress and task_id is not None:
+            progress.update(task_id, completed=downloaded)
+        if self.progress_callback and total_size:
+            self.progress_callback(downloaded / total_size)
+
+    @staticmethod
+    def _validator(response: requests.Response) -> str | None:
+        """Get a validator usable in If-Range: a strong ETag, else Last-Modified."""
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            return etag
+        return response.headers.get("Last-Modified")
+
+    def _validator_path(self, filepath: Path) -> Path:
+        """Sidecar file remembering which remote version a partial file came from."""
+        return filepath.with_name(filepath.name + self.VALIDATOR_SUFFIX)
+
     def _resume_info(self, filepath: Path, resume_byte_pos: int) -> None:
         """Show resume information."""
         self.console.print(f"[yellow]⚠ Resuming from {format_size(resume_byte_pos)}[/]")
 
+    def _resume_response(
+        self,
+        url: str,
+        response: requests.Response,
+        filepath: Path,
+        resume_byte_pos: int,
+    ) -> tuple[requests.Response, int]:
+        """
+        Get a response continuing a partial download.
+
+        Args:
+            url: URL being downloaded
+            response: Initial full response (headers only consumed so far)
+            filepath: Partial file on disk
+            resume_byte_pos: Size of the partial file
+
+        Returns:
+            Tuple of (response to stream, byte position it starts at); the
+            position is 0 when the download has to restart from scratch
+        """
+        if response.headers.get("Accept-Ranges", "").lower() == "none":
+            # Server said it can't resume, so keep streaming the full body
+            return response, 0
+
+        response.close()
+        self._resume_info(filepath, resume_byte_pos)
+        headers = {"Range": f"bytes={resume_byte_pos}-"}
+        try:
+            validator = self._validator_path(filepath).read_text(encoding="utf-8").strip()
+        except OSError:
+            validator = ""  # Partial file from elsewhere; only the checksum can vouch for it
+        if validator:
+            # If the remote file changed since, the server sends all of it with 200
+            headers["If-Range"] = validator
+        ranged = self.session.get(url, stream=True, timeout=self.timeout, headers=headers)
+
+        if ranged.status_code == 206:
+            return ranged, resume_byte_pos
+        if ranged.status_code == 200:
+            # Range ignored or remote file changed: this is the whole file, not the missing tail
+            return ranged, 0
+
+        # 416 or similar: the partial file doesn't fit the remote one
+        ranged.close()
+        self.console.print("[yellow]⚠ Cannot resume, restarting download[/]")
+        return self._restart(url), 0
+
+    def _restart(self, url: str) -> requests.Response:
+        """Request the whole file again, as a fresh 200 stream."""
+        response = self.session.get(url, stream=True, timeout=self.timeout, allow_redirects=True)
+        if response.status_code != 200:
+            response.close()
+            raise DownloadError(
+                f"HTTP {response.status_code}: {response.reason}",
+                url=url,
+                status_code=response.status_code,
+            )
+        return response
+
     def download(
         self,
         url: str,
@@ -195,13 +470,19 @@ class Downloader:
         Returns:
             DownloadResult with success status and file info
         """
-        last_error: Exception | None = None
+        last_error: BaseException | None = None
 
         for attempt in range(1, self.retries + 1):
             try:
                 return self._download_single(url, filename, show_progress, attempt)
             except requests.RequestException as e:
-                last_error = e
+                # Already retried by the session's urllib3 Retry
+                raise DownloadError(
+                    f"Download failed after {self.retries} attempts: {e}",
+                    url=url,
+                ) from e
+            except _TransferInterruptedError as e:
+                last_error = e.__cause__
                 if attempt < self.retries:
                     wait_time = self.BACKOFF_FACTOR ** (attempt - 1)
                     self.console.print(f"[yellow]⚠ Download failed, retrying in {wait_time}s...[/]")
@@ -243,21 +524,18 @@ class Downloader:
         filepath = self.output_dir / final_filename
 
         # Check for partial file (resume support)
-        resume_byte_pos = 0
-        if filepath.exists():
+        try:
             resume_byte_pos = filepath.stat().st_size
-            if resume_byte_pos > 0:
-                self._resume_info(filepath, resume_byte_pos)
-                response = self.session.get(
-                    url,
-                    stream=True,
-                    timeout=self.timeout,
-                    headers={"Range": f"bytes={resume_byte_pos}-"},
-                )
+        except FileNotFoundError:
+            resume_byte_pos = 0
+        if resume_byte_pos > 0:
+            response, resume_byte_pos = self._resume_response(
+                url, response, filepath, resume_byte_pos
+            )
 
         # Get total size
-        total_size = response.headers.get("Content-Length")
-        total_size = int(total_size) if total_size else None
+        content_length = response.headers.get("Content-Length", "")
+        total_size = int(content_length) if content_length.isdigit() else None
         initial_size = resume_byte_pos
 
         if total_size:
@@ -290,25 +568,68 @@ class Downloader:
         # Download with streaming
         chunk_size = self._get_chunk_size(total_size)
         downloaded = resume_byte_pos
+        parallel = self._can_split(response, total_size, resume_byte_pos)
+        checksum: str | None
 
         try:
-            with open(filepath, "ab") as f:
-                for chunk in response.iter_content(chunk_size=chunk_size):
-                    if not chunk:
-                        continue
-
-                    f.write(chunk)
-                    downloaded += len(chunk)
-
-                    if progress and task_id is not None:
-                        progress.update(task_id, completed=downloaded)
-
-                    if self.progress_callback and total_size:
-                        self.progress_callback(downloaded / total_size)
-
+            if parallel and total_size:
+                response.close()
+                try:
+                    self._download_parallel(url, filepath, total_size, progress, task_id)
+                except _RangeNotHonoredError:
+                    # The server doesn't split after all; stream it in one piece
+                    parallel = False
+                    response = self._restart(url)
+
+            if parallel and total_size:
+                downloaded = total_size
+                checksum = None
+            else:
+                last_report = float("-inf")
+
+                # Hash while streaming so the file isn't read back afterwards
+                hasher = hashlib.sha256()
+                if resume_byte_pos:
+                    with open(filepath, "rb") as existing:
+                        hasher = hashlib.file_digest(existing, "sha256")
+
+                if not resume_byte_pos:
+                    # Remember the version being fetched, so a resume can't
+                    # append a newer file's bytes to this prefix
+                    validator = self._validator(response)
+                    validator_path = self._validator_path(filepath)
+                    if validator:
+                        validator_path.write_text(validator, encoding="utf-8")
+                    else:
+                        validator_path.unlink(missing_ok=True)
+
+                # A restarted download overwrites the stale partial file
+                with open(filepath, "ab" if resume_byte_pos else "wb") as f:
+                    for chunk in response.iter_content(chunk_size=chunk_size):
+                        if not chunk:
+                            continue
+
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        downloaded += len(chunk)
+
+                        # Rendering on every chunk costs more than the chunk itself
+                        # on fast links, so updates are rate-limited
+                        now = time.monotonic()
+                        if now - last_report >= self.PROGRESS_INTERVAL:
+                            last_report = now
+                            self._report_progress(progress, task_id, downloaded, total_size)
+
+                self._report_progress(progress, task_id, downloaded, total_size)
+                checksum = hasher.hexdigest()
+
+        except requests.RequestException as e:
+            # Whatever reached disk is kept, so the next attempt resumes from it
+            raise _TransferInterruptedError(str(e)) from e
         finally:
             if progress:
                 progress.stop()
+        self._validator_path(filepath).unlink(missing_ok=True)
 
         # Calculate download time and speed
         download_time = time.time() - start_time
@@ -321,8 +642,9 @@ class Downloader:
                 f"{format_duration(download_time)} ({speed})"
             )
 
-        # Compute checksum
-        checksum = compute_hash(filepath, "sha256")
+        if checksum is None:
+            # Parallel ranges arrive out of order, so hash the finished file
+            checksum = compute_hash(filepath, "sha256")
 
         # Create metadata
         metadata = DownloadMetadata(
@@ -10,17 +10,71 @@ Features:
 
 from __future__ import annotations
 
+import atexit
+import hashlib
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import Any
+from pathlib import Path
+from typing import Any, cast
+from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
+
+from trustget.utils import (
+    dumps_json,
+    get_cache_dir,
+    load_json_file,
+    loads_json,
+    parse_github_url,
+    write_text_atomic,
+)
+
+# [etag, data, fetched_at] as stored in the JSON cache file
+_CacheEntry = list[Any]
+
+# One keep-alive pool to api.github.com per process, shared by every
+# GitHubClient so short-lived clients don't each pay a TLS handshake.
+# Auth is sent per request, so tokens never leak between clients.
+_SHARED_SESSION: requests.Session | None = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_shared_session() -> requests.Session:
+    """Get or create the process-wide GitHub HTTP session."""
+    global _SHARED_SESSION
+    with _SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            session.headers.update(
+                {
+                    "User-Agent": "TrustGet/0.1.0 (https://github.com/FaturRachmann/trustget)",
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28",
+                }
+            )
+            adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _SHARED_SESSION = session
+            atexit.register(_close_shared_session)
+        return _SHARED_SESSION
 
-from trustget.utils import parse_github_url
 
+def _close_shared_session() -> None:
+    """Close the process-wide GitHub HTTP session."""
+    global _SHARED_SESSION
+    with _SESSION_LOCK:
+        if _SHARED_SESSION is not None:
+            _SHARED_SESSION.close()
+            _SHARED_SESSION = None
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class GitHubAsset:
     """GitHub Release asset."""
 
@@ -43,7 +97,7 @@ class GitHubAsset:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubRelease:
     """GitHub Release information."""
 
@@ -59,6 +113,21 @@ class GitHubRelease:
     assets: list[GitHubAsset] = field(default_factory=list)
     owner: str = ""
     repo: str = ""
+    _assets_by_name: dict[str, GitHubAsset] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
+    _published_date: datetime | None = field(default=None, init=False, repr=False, compare=False)
+
+    def get_asset(self, name: str) -> GitHubAsset | None:
+        """Get asset by case-insensitive name (first occurrence wins)."""
+        if self._indexed_count != len(self.assets):
+            index: dict[str, GitHubAsset] = {}
+            for asset in self.assets:
+                index.setdefault(asset.name.lower(), asset)
+            self._assets_by_name = index
+            self._indexed_count = len(self.assets)
+        return self._assets_by_name.get(name.lower())
 
     @property
     def is_draft(self) -> bool:
@@ -72,15 +141,16 @@ class GitHubRelease:
 
     @property
     def published_date(self) -> datetime:
-        """Get published date as datetime."""
-        return datetime.fromisoformat(self.published_at.replace("Z", "+00:00"))
+        """Get published date as datetime (parsed once)."""
+        if self._published_date is None:
+            # fromisoformat accepts the trailing "Z" since Python 3.11
+            self._published_date = datetime.fromisoformat(self.published_at)
+        return self._published_date
 
     @property
     def age_days(self) -> int:
         """Calculate release age in days."""
-        now = datetime.now(UTC)
-        published = self.published_date
-        return (now - published).days
+        return (datetime.now(UTC) - self.published_date).days
 
     @property
     def is_recent(self) -> bool:
@@ -122,7 +192,7 @@ class GitHubRelease:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class GitHubRepo:
     """GitHub Repository information."""
 
@@ -137,13 +207,19 @@ class GitHubRepo:
     default_branch: str
     private: bool
     archived: bool
+    _created_date: datetime | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def created_date(self) -> datetime:
+        """Get creation date as datetime (parsed once)."""
+        if self._created_date is None:
+            self._created_date = datetime.fromisoformat(self.created_at)
+        return self._created_date
 
     @property
     def age_days(self) -> int:
         """Calculate repo age in days."""
-        now = datetime.now(UTC)
-        created = datetime.fromisoformat(self.created_at.replace("Z", "+00:00"))
-        return (now - created).days
+        return (datetime.now(UTC) - self.created_date).days
 
     @property
     def is_new(self) -> bool:
@@ -182,6 +258,39 @@ class GitHubError(Exception):
         super().__init__(self.message)
 
 
+RELEASE_AND_REPO_QUERY = """
+query($owner: String!, $repo: String!, $tag: String!) {
+  repository(owner: $owner, name: $repo) {
+    owner { login }
+    name
+    description
+    createdAt
+    updatedAt
+    stargazerCount
+    primaryLanguage { name }
+    defaultBranchRef { name }
+    isPrivate
+    isArchived
+    release(tagName: $tag) {
+      tagName
+      name
+      description
+      url
+      publishedAt
+      createdAt
+      isDraft
+      isPrerelease
+      author { login }
+      releaseAssets(first: 100) {
+        nodes { name downloadUrl size downloadCount contentType createdAt }
+        pageInfo { hasNextPage }
+      }
+    }
+  }
+}
+"""
+
+
 class GitHubClient:
     """
     GitHub API client for TrustGet.
@@ -191,46 +300,119 @@ class GitHubClient:
     - Get repository information
     - Scan assets for checksum files
     - Token-based authentication for higher rate limits
+    - Conditional requests (ETag) so unchanged responses skip the rate limit
+    - Responses younger than CACHE_MAX_AGE are served from disk without a request
     """
 
     API_BASE = "https://api.github.com"
     DEFAULT_TIMEOUT = 10
     RATE_LIMIT_UNAUTHENTICATED = 60  # requests per hour
     RATE_LIMIT_AUTHENTICATED = 5000  # requests per hour
-
-    def __init__(self, token: str | None = None, timeout: int = DEFAULT_TIMEOUT):
+    CHECKSUM_SUFFIXES = (".sha256", ".sha512", ".md5")
+    CHECKSUM_FILENAMES = ("sha256sums", "sha512sums", "md5sums", "checksums.txt")
+    SIGNATURE_SUFFIXES = (".asc", ".sig")
+    MAX_FETCH_WORKERS = 8
+    ETAG_CACHE_FILENAME = "gh_etags.json"
+    ETAG_CACHE_MAX_ENTRIES = 64
+    CACHE_MAX_AGE = 600  # seconds a cached response is reused without revalidating
+
+    def __init__(
+        self,
+        token: str | None = None,
+        timeout: int = DEFAULT_TIMEOUT,
+        etag_cache_path: Path | None = None,
+    ):
         """
         Initialize GitHub client.
 
         Args:
             token: GitHub personal access token (optional, from env if not provided)
             timeout: HTTP request timeout
+            etag_cache_path: JSON file for cached API responses (default: user cache dir)
         """
         self.timeout = timeout
         self.token = token or os.getenv("TRUSTGET_GITHUB_TOKEN")
+        self.etag_cache_path = etag_cache_path or get_cache_dir() / self.ETAG_CACHE_FILENAME
         self._session: requests.Session | None = None
+        self._etag_cache: dict[str, _CacheEntry] | None = None
+        self._etag_cache_dirty = False
+        # get_release_and_repo stores responses from two threads
+        self._etag_lock = threading.Lock()
 
     @property
     def session(self) -> requests.Session:
-        """Get or create HTTP session with auth."""
+        """Get the shared HTTP session (see _get_shared_session)."""
         if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update(
-                {
-                    "User-Agent": "TrustGet/0.1.0 (https://github.com/FaturRachmann/trustget)",
-                    "Accept": "application/vnd.github+json",
-                    "X-GitHub-Api-Version": "2022-11-28",
-                }
-            )
-            if self.token:
-                self._session.headers["Authorization"] = f"Bearer {self.token}"
+            self._session = _get_shared_session()
         return self._session
 
+    @property
+    def auth_headers(self) -> dict[str, str]:
+        """Per-request auth headers for this client's token."""
+        return {"Authorization": f"Bearer {self.token}"} if self.token else {}
+
+    @property
+    def etag_cache(self) -> dict[str, _CacheEntry]:
+        """Get cached [etag, data, fetched_at] entries by request key, loading them on first use."""
+        with self._etag_lock:
+            if self._etag_cache is None:
+                try:
+                    cache = load_json_file(self.etag_cache_path)
+                except (OSError, ValueError):
+                    cache = {}
+                if not isinstance(cache, dict):
+                    cache = {}
+                # Drop entries a crash or another version left malformed
+                self._etag_cache = {
+                    key: entry for key, entry in cache.items() if self._valid_entry(entry)
+                }
+            return self._etag_cache
+
+    @staticmethod
+    def _valid_entry(entry: Any) -> bool:
+        """Check that a loaded cache entry is a well-formed [etag, data, fetched_at]."""
+        return (
+            isinstance(entry, list)
+            and len(entry) == 3
+            and (entry[0] is None or isinstance(entry[0], str))
+            and isinstance(entry[2], (int, float))
+        )
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache, keeping only the most recent entries."""
+        if not self._etag_cache_dirty or self._etag_cache is None:
+            return
+        entries = list(self._etag_cache.items())[-self.ETAG_CACHE_MAX_ENTRIES :]
+        try:
+            write_text_atomic(self.etag_cache_path, dumps_json(dict(entries), indent=False))
+        except OSError:
+            return
+        self._etag_cache_dirty = False
+
+    def _etag_key(self, url: str, params: dict[str, Any] | None) -> str:
+        """Cache key for a request; responses vary by token, so it's part of the key."""
+        identity = hashlib.sha256(self.token.encode()).hexdigest()[:16] if self.token else "anon"
+        query = f"?{urlencode(sorted(params.items()))}" if params else ""
+        return f"{identity} {url}{query}"
+
+    def _cached_fresh(self, cached: _CacheEntry, max_age: float | None = None) -> bool:
+        """Check if a cache entry is recent enough to use without a request."""
+        if max_age is None:
+            max_age = self.CACHE_MAX_AGE
+        return bool(time.time() - cached[2] < max_age)
+
+    def _cache_store(self, key: str, etag: str | None, data: Any) -> None:
+        """Store a response; re-inserting keeps the newest entries through trimming."""
+        cache = self.etag_cache
+        with self._etag_lock:
+            cache.pop(key, None)
+            cache[key] = [etag, data, time.time()]
+            self._etag_cache_dirty = True
+
     def close(self) -> None:
-        """Close HTTP session."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        """Save cached responses and release the HTTP session (the pool stays open)."""
+        self._save_etag_cache()
+        self._session = None
 
     def __enter__(self) -> GitHubClient:
         return self
@@ -238,12 +420,33 @@ class GitHubClient:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
-    def _request(self, endpoint: str, params: dict | None = None) -> dict | list:
-        """Make authenticated request to GitHub API."""
+    def _request(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        max_age: float | None = None,
+    ) -> dict[str, Any] | list[Any]:
+        """Make authenticated request to GitHub API (max_age defaults to CACHE_MAX_AGE)."""
         url = f"{self.API_BASE}{endpoint}"
+        key = self._etag_key(url, params)
+        cached = self.etag_cache.get(key)
+        if cached is not None and self._cached_fresh(cached, max_age):
+            return cast("dict[str, Any] | list[Any]", cached[1])
+        headers = dict(self.auth_headers)
+        if cached and cached[0]:
+            headers["If-None-Match"] = cached[0]
 
         try:
-            response = self.session.get(url, params=params, timeout=self.timeout)
+            response = self.session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+
+            if response.status_code == 304 and cached:
+                self._cache_store(key, cached[0], cached[1])
+                return cast("dict[str, Any] | list[Any]", cached[1])
 
             if response.status_code == 403:
                 # Check rate limit
@@ -256,7 +459,9 @@ class GitHubClient:
                     )
 
             response.raise_for_status()
-            return response.json()
+            data: dict[str, Any] | list[Any] = loads_json(response.content)
+            self._cache_store(key, response.headers.get("ETag"), data)
+            return data
 
         except requests.HTTPError as e:
             if e.response is not None:
@@ -265,6 +470,150 @@ class GitHubClient:
                     status_code=e.response.status_code,
                 ) from e
             raise GitHubError(f"GitHub API error: {e}") from e
+        except requests.RequestException as e:
+            raise GitHubError(f"GitHub API error: {e}") from e
+        except ValueError as e:
+            raise GitHubError(f"GitHub API error: invalid JSON response ({e})") from e
+
+    def _graphql(self, query: str, variables: dict[str, Any]) -> dict[str, Any]:
+        """Make authenticated request to GitHub GraphQL API."""
+        url = f"{self.API_BASE}/graphql"
+        query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
+        key = self._etag_key(url, {"query": query_hash, **variables})
+        cached = self.etag_cache.get(key)
+        if cached is not None and self._cached_fresh(cached):
+            return cast("dict[str, Any]", cached[1])
+
+        try:
+            response = self.session.post(
+                url,
+                json={"query": query, "variables": variables},
+                headers=self.auth_headers,
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            payload = loads_json(response.content)
+        except requests.HTTPError as e:
+            status_code = e.response.status_code if e.response is not None else None
+            raise GitHubError(
+                f"GitHub GraphQL error: {status_code}", status_code=status_code
+            ) from e
+        except requests.RequestException as e:
+            raise GitHubError(f"GitHub GraphQL error: {e}") from e
+        except ValueError as e:
+            raise GitHubError(f"GitHub GraphQL error: invalid JSON response ({e})") from e
+        if not isinstance(payload, dict):
+            raise GitHubError("GitHub GraphQL error: unexpected response")
+
+        errors = payload.get("errors")
+        if errors:
+            not_found = any(error.get("type") == "NOT_FOUND" for error in errors)
+            raise GitHubError(
+                f"GitHub GraphQL error: {errors[0].get('message', 'unknown error')}",
+                status_code=404 if not_found else None,
+            )
+        # GraphQL has no conditional requests, so entries are only reused while fresh
+        data: dict[str, Any] = payload["data"]
+        self._cache_store(key, None, data)
+        return data
+
+    def get_release_and_repo(
+        self,
+        owner: str,
+        repo: str,
+        tag: str,
+    ) -> tuple[GitHubRelease, GitHubRepo]:
+        """
+        Get release and repository information together.
+
+        With a token this is a single GraphQL round-trip. GraphQL needs
+        authentication and tokens may lack GraphQL scopes, so anonymous
+        clients and any GraphQL failure other than "not found" fall back to
+        the two REST calls, made concurrently. Releases with more assets
+        than one GraphQL page take their release data from REST.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            tag: Release tag name
+
+        Returns:
+            Tuple of (GitHubRelease, GitHubRepo)
+        """
+        if self.token:
+            try:
+                data = self._graphql(
+                    RELEASE_AND_REPO_QUERY,
+                    {"owner": owner, "repo": repo, "tag": tag},
+                )
+            except GitHubError as e:
+                # FORBIDDEN/SAML/scope errors arrive as HTTP 200; REST may still work
+                if e.status_code == 404:
+                    raise
+            else:
+                repository = data["repository"]
+                if repository["release"] is None:
+                    raise GitHubError(f"GitHub API error: release {tag} not found", 404)
+                release_node = repository["release"]
+                if release_node["releaseAssets"].get("pageInfo", {}).get("hasNextPage"):
+                    # REST lists every asset; a truncated list could miss checksums
+                    release = self.get_release(owner, repo, tag)
+                else:
+                    release = self._release_from_graphql(release_node, owner, repo)
+                return release, self._repo_from_graphql(repository)
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            release_future = executor.submit(self.get_release, owner, repo, tag)
+            repo_future = executor.submit(self.get_repo, owner, repo)
+            return release_future.result(), repo_future.result()
+
+    @staticmethod
+    def _release_from_graphql(data: dict[str, Any], owner: str, repo: str) -> GitHubRelease:
+        """Build GitHubRelease from a GraphQL release node."""
+        assets = [
+            GitHubAsset(
+                name=asset["name"],
+                url=asset["downloadUrl"],
+                size=asset["size"],
+                download_count=asset["downloadCount"],
+                content_type=asset["contentType"],
+                created_at=asset["createdAt"],
+            )
+            for asset in data["releaseAssets"]["nodes"]
+        ]
+
+        return GitHubRelease(
+            tag_name=data["tagName"],
+            name=data["name"] or data["tagName"],
+            body=data["description"] or "",
+            html_url=data["url"],
+            published_at=data["publishedAt"],
+            created_at=data["createdAt"],
+            draft=data["isDraft"],
+            prerelease=data["isPrerelease"],
+            author=data["author"] or {},
+            assets=assets,
+            owner=owner,
+            repo=repo,
+        )
+
+    @staticmethod
+    def _repo_from_graphql(data: dict[str, Any]) -> GitHubRepo:
+        """Build GitHubRepo from a GraphQL repository node."""
+        return GitHubRepo(
+            owner=data["owner"]["login"],
+            name=data["name"],
+            description=data["description"] or "",
+            created_at=data["createdAt"],
+            updated_at=data["updatedAt"],
+            stargazers_count=data["stargazerCount"],
+            # REST watchers_count is the star count too
+            watchers_count=data["stargazerCount"],
+            language=(data["primaryLanguage"] or {}).get("name"),
+            default_branch=(data["defaultBranchRef"] or {}).get("name", ""),
+            private=data["isPrivate"],
+            archived=data["isArchived"],
+        )
 
     def get_release(
         self,
@@ -435,26 +784,14 @@ class GitHubClient:
         Returns:
             GitHubAsset for checksum file or None
         """
-        target_lower = target_filename.lower()
-
-        # Patterns to look for
-        patterns = [
-            f"{target_lower}.sha256",
-            f"{target_lower}.sha512",
-            f"{target_lower}.md5",
-            f"{target_lower}.asc",
-            f"{target_lower}.sig",
-        ]
-
-        for asset in release.assets:
-            asset_name = asset.name.lower()
-
-            # Direct match
-            if asset_name in patterns:
-                return asset
-
-            # Checksum file containing multiple entries
-            if asset_name in ["sha256sums", "sha512sums", "md5sums", "checksums.txt"]:
+        # Per-file checksums, then release-wide checksum files, then signatures
+        candidates = [f"{target_filename}{suffix}" for suffix in self.CHECKSUM_SUFFIXES]
+        candidates += list(self.CHECKSUM_FILENAMES)
+        candidates += [f"{target_filename}{suffix}" for suffix in self.SIGNATURE_SUFFIXES]
+
+        for name in candidates:
+            asset = release.get_asset(name)
+            if asset is not None:
                 return asset
 
         return None
@@ -470,12 +807,31 @@ class GitHubClient:
             Checksum file content or None
         """
         try:
-            response = self.session.get(asset.url, timeout=self.timeout)
+            response = self.session.get(asset.url, headers=self.auth_headers, timeout=self.timeout)
             response.raise_for_status()
+            if response.encoding is None:
+                # Checksum files are ASCII; skip charset detection over the body
+                response.encoding = "utf-8"
             return response.text
         except requests.RequestException:
             return None
 
+    def get_checksum_contents(self, assets: list[GitHubAsset]) -> list[str | None]:
+        """
+        Download several checksum assets concurrently.
+
+        Args:
+            assets: GitHubAssets for checksum files
+
+        Returns:
+            Content (or None on failure) for each asset, in input order
+        """
+        if len(assets) <= 1:
+            return [self.get_checksum_content(asset) for asset in assets]
+        max_workers = min(self.MAX_FETCH_WORKERS, len(assets))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.get_checksum_content, assets))
+
     def get_rate_limit_info(self) -> dict:
         """
         Get current rate limit information.
@@ -485,7 +841,8 @@ class GitHubClient:
         """
         try:
             endpoint = "/rate_limit"
-            data = self._request(endpoint)
+            # Always revalidate; a cached quota would be misleading
+            data = self._request(endpoint, max_age=0)
             return data.get("resources", {}).get("core", {})
         except GitHubError:
             return {}
@@ -509,8 +866,9 @@ class GitHubClient:
             return {}
 
         try:
-            release = self.get_release(parsed["owner"], parsed["repo"], parsed["tag"])
-            repo = self.get_repo(parsed["owner"], parsed["repo"])
+            release, repo = self.get_release_and_repo(
+                parsed["owner"], parsed["repo"], parsed["tag"]
+            )
 
             return {
                 "release": release.to_dict(),
@@ -0,0 +1,153 @@
+"""
+Persistent file hash cache for TrustGet.
+
+Remembers computed file hashes in a small SQLite database so repeated
+verification of an unchanged file skips rehashing. An entry is only
+reused while the file's size, mtime, ctime and inode all still match;
+ctime can't be set from userspace, so restoring an old mtime after
+editing a file does not revive a stale hash. Entries for files modified
+within RACY_WINDOW_NS of being hashed are never reused, since a second
+write inside the same timestamp granularity would leave mtime unchanged.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from types import TracebackType
+
+from trustget.utils import get_cache_dir
+
+# (resolved path, size, mtime_ns, ctime_ns, inode)
+FileKey = tuple[str, int, int, int, int]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    hashed_at INTEGER NOT NULL,
+    PRIMARY KEY (path, algorithm)
+)
+"""
+
+
+class HashCache:
+    """
+    SQLite-backed (path, algorithm) -> digest cache.
+
+    Cache errors (unwritable cache dir, locked database) never fail a
+    verification; they just behave like a cache miss.
+    """
+
+    DEFAULT_FILENAME = "hashes.sqlite"
+    RACY_WINDOW_NS = 2_000_000_000
+
+    def __init__(self, db_path: Path | None = None):
+        """
+        Initialize hash cache.
+
+        Args:
+            db_path: Path to SQLite database (default: user cache dir)
+        """
+        self.db_path = db_path or get_cache_dir() / self.DEFAULT_FILENAME
+        self._conn: sqlite3.Connection | None = None
+        # Verifier.verify_batch hashes on several threads
+        self._lock = threading.Lock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Get or open the database connection."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+    def __enter__(self) -> HashCache:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @staticmethod
+    def file_key(filepath: Path) -> FileKey:
+        """Get (resolved path, size, mtime_ns, ctime_ns, inode) for a file."""
+        stat = filepath.stat()
+        return (
+            str(filepath.resolve()),
+            stat.st_size,
+            stat.st_mtime_ns,
+            stat.st_ctime_ns,
+            stat.st_ino,
+        )
+
+    @staticmethod
+    def unchanged_since(filepath: Path, key: FileKey) -> bool:
+        """Check that a file still has the size, times and inode recorded in key."""
+        try:
+            stat = filepath.stat()
+        except OSError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino) == key[1:]
+
+    def get(self, filepath: Path, algorithm: str, key: FileKey | None = None) -> str | None:
+        """
+        Get cached digest if the file is unchanged since it was hashed.
+
+        Args:
+            filepath: File to look up
+            algorithm: Hash algorithm
+            key: file_key() taken before hashing, to save a stat
+        """
+        try:
+            path, size, mtime_ns, ctime_ns, inode = key or self.file_key(filepath)
+            with self._lock:
+                row = self.conn.execute(
+                    "SELECT digest FROM hashes WHERE path = ? AND algorithm = ? "
+                    "AND size = ? AND mtime_ns = ? AND ctime_ns = ? AND inode = ? "
+                    "AND mtime_ns + ? <= hashed_at * 1000000000",
+                    (path, algorithm, size, mtime_ns, ctime_ns, inode, self.RACY_WINDOW_NS),
+                ).fetchone()
+        except (OSError, sqlite3.Error):
+            return None
+        return row[0] if row else None
+
+    def put(self, filepath: Path, algorithm: str, digest: str, key: FileKey | None = None) -> None:
+        """
+        Store digest for a file.
+
+        Args:
+            filepath: File that was hashed
+            algorithm: Hash algorithm
+            digest: Hex digest
+            key: file_key() taken before hashing; pass it so a file changed
+                while it was hashed isn't stored under its new state
+        """
+        try:
+            path, size, mtime_ns, ctime_ns, inode = key or self.file_key(filepath)
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (path, algorithm, size, mtime_ns, ctime_ns, inode, digest, int(time.time())),
+                )
+        except (OSError, sqlite3.Error):
+            pass
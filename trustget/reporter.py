@@ -9,16 +9,15 @@ Provides:
 
 from __future__ import annotations
 
-import json
-from dataclasses import asdict
 from typing import Any
 
 from rich.console import Console
-from rich.table import Table
+from rich.text import Text
 
 from trustget.downloader import DownloadResult
 from trustget.github import GitHubRelease
 from trustget.trust import TrustReport
+from trustget.utils import dumps_json
 from trustget.verifier import BatchVerificationResult, VerificationResult, VerificationStatus
 
 
@@ -51,6 +50,9 @@ class Reporter:
         """
         self.json_output = json_output
         self.quiet = quiet
+        # Whether human-readable text is printed; callers can check this to
+        # skip building messages that would be discarded
+        self.emits_text = not (json_output or quiet)
 
         if console is None:
             self.console = Console(color_system=None if no_color else "auto")
@@ -59,29 +61,30 @@ class Reporter:
 
     def _output_json(self, data: dict) -> None:
         """Output data as JSON."""
-        self.console.print(json.dumps(data, indent=2, default=str))
+        # Write straight to the console's file: console.print would parse
+        # "[...]" in values as markup and wrap long lines at terminal width
+        self.console.file.write(dumps_json(data) + "\n")
 
     def output_download_start(self, url: str, filename: str) -> None:
         """Output download start message."""
-        if self.json_output or self.quiet:
+        if not self.emits_text:
             return
 
-        self.console.print(f"\n[bold blue]Downloading[/] {filename}")
-        self.console.print(f"[dim]From: {url}[/]")
+        self.console.print(
+            Text.assemble("\n", ("Downloading", "bold blue"), f" {filename}\n", (f"From: {url}", "dim"))
+        )
 
     def output_download_complete(self, result: DownloadResult) -> None:
         """Output download completion message."""
         if self.json_output:
-            self._output_json(
-                {"download": result.to_dict() if hasattr(result, "to_dict") else asdict(result)}
-            )
+            self._output_json({"download": result.to_dict()})
             return
 
         if self.quiet:
             return
 
         if result.success and result.filepath:
-            self.console.print(f"\n[green]✓ File saved →[/] {result.filepath}")
+            self.console.print(Text.assemble("\n", ("✓ File saved →", "green"), f" {result.filepath}"))
 
     def output_verification(self, result: VerificationResult) -> None:
         """Output verification result."""
@@ -92,24 +95,35 @@ class Reporter:
         if self.quiet:
             return
 
+        # Built as Text so hashes, sources and error messages are never
+        # parsed as markup
         if result.status == VerificationStatus.VERIFIED:
-            source = f" (from {result.source})" if result.source else ""
-            self.console.print(f"\n[green]✓ {result.algorithm.upper()} matched[/]{source}")
+            text = Text.assemble("\n", (f"✓ {result.algorithm.upper()} matched", "green"))
+            if result.source:
+                text.append(f" (from {result.source})")
 
             if result.expected_hash and result.actual_hash:
-                self.console.print(f"  [dim]Expected : {result.expected_hash}[/]")
-                self.console.print(f"  [dim]Got      : {result.actual_hash}[/]")
+                text.append(f"\n  Expected : {result.expected_hash}", style="dim")
+                text.append(f"\n  Got      : {result.actual_hash}", style="dim")
+            self.console.print(text)
 
         elif result.status == VerificationStatus.MISMATCH:
-            self.console.print(f"\n[red]✗ {result.algorithm.upper()} MISMATCH[/]")
-            self.console.print(f"  [red]Expected : {result.expected_hash}[/]")
-            self.console.print(f"  [red]Got      : {result.actual_hash}[/]")
+            self.console.print(
+                Text.assemble(
+                    "\n",
+                    (f"✗ {result.algorithm.upper()} MISMATCH", "red"),
+                    (f"\n  Expected : {result.expected_hash}", "red"),
+                    (f"\n  Got      : {result.actual_hash}", "red"),
+                )
+            )
 
         elif result.status == VerificationStatus.NOT_FOUND:
-            self.console.print("\n[yellow]⚠ No checksum found[/]")
+            self.console.print(Text.assemble("\n", ("⚠ No checksum found", "yellow")))
 
         elif result.status == VerificationStatus.ERROR:
-            self.console.print(f"\n[red]✗ Verification error: {result.error}[/]")
+            self.console.print(
+                Text.assemble("\n", (f"✗ Verification error: {result.error}", "red"))
+            )
 
     def output_trust_report(self, report: TrustReport) -> None:
         """Output trust analysis report."""
@@ -120,62 +134,50 @@ class Reporter:
         if self.quiet:
             return
 
-        # Build the trust score panel
+        # Build the whole report and print it once; each console.print
+        # re-parses markup and measures the terminal
         score_text = f"{report.score} / 100"
         risk_text = f"{report.risk_level.emoji} {report.risk_level.value}"
+        lines: list[str] = []
 
         # Display GitHub info if available
         if "github" in report.metadata:
             gh_info = report.metadata["github"]
-            self.console.print("\n[bold cyan]🐙 GitHub Repository[/]")
-            self.console.print(f"  [bold]{gh_info.get('owner', 'N/A')}/{gh_info.get('repo', 'N/A')}[/]")
+            lines.append("\n[bold cyan]🐙 GitHub Repository[/]")
+            lines.append(f"  [bold]{gh_info.get('owner', 'N/A')}/{gh_info.get('repo', 'N/A')}[/]")
 
             if gh_info.get('description'):
-                self.console.print(f"  [dim]{gh_info['description'][:80]}[/]")
+                lines.append(f"  [dim]{gh_info['description'][:80]}[/]")
 
             stars = gh_info.get('stars', 0)
             age_days = gh_info.get('repo_age_days', 0)
-            self.console.print(f"  ⭐ {stars} stars  •  📅 {age_days} days old")
+            lines.append(f"  ⭐ {stars} stars  •  📅 {age_days} days old")
 
             if 'tag' in gh_info:
-                self.console.print(f"  🏷️  Release: [bold]{gh_info['tag']}[/]")
+                lines.append(f"  🏷️  Release: [bold]{gh_info['tag']}[/]")
 
-            self.console.print()
+            lines.append("")
 
-        # Build factors table
-        factors_table = Table(show_header=False, box=None, padding=(0, 1))
-        factors_table.add_column("Factor", style="white")
-        factors_table.add_column("Points", justify="right")
+        lines.append("\n[bold]Security Analysis[/]")
+        lines.append(f"┌{'─' * 50}┐")
+        lines.append(f"│  [bold]Trust Score[/]    {score_text}    {risk_text}  │")
+        lines.append(f"├{'─' * 50}┤")
 
         for factor in report.factors:
             if factor.applied:
-                points_style = "green" if factor.weight > 0 else "red"
-                factors_table.add_row(
-                    f"{'✓' if factor.weight > 0 else '⚠'} {factor.name}",
-                    f"[{points_style}]{factor.display_weight}[/]",
-                )
-
-        self.console.print("\n[bold]Security Analysis[/]")
-        self.console.print(f"┌{'─' * 50}┐")
-        self.console.print(f"│  [bold]Trust Score[/]    {score_text}    {risk_text}  │")
-        self.console.print(f"├{'─' * 50}┤")
-
-        for factor in report.factors:
-            if factor.applied:
-                points_style = "green" if factor.weight > 0 else "red"
                 symbol = "✓" if factor.weight > 0 else "⚠"
                 # Truncate long factor names
                 factor_name = factor.name[:35].ljust(35)
-                line = f"  {symbol} {factor_name} {factor.display_weight}"
-                self.console.print(f"│  {line}    │")
+                lines.append(f"│    {symbol} {factor_name} {factor.display_weight}    │")
 
-        self.console.print(f"└{'─' * 50}┘")
+        lines.append(f"└{'─' * 50}┘")
 
         # Add recommendation based on risk level
-        self._output_recommendation(report)
+        lines.extend(self._recommendation_lines(report))
+        self.console.print("\n".join(lines))
 
-    def _output_recommendation(self, report: TrustReport) -> None:
-        """Output recommendation based on trust score."""
+    def _recommendation_lines(self, report: TrustReport) -> list[str]:
+        """Build recommendation lines based on trust score."""
         recommendations = {
             "LOW": "[green]✓ Safe to download[/] • No security concerns detected",
             "MEDIUM": "[yellow]⚠ Proceed with caution[/] • Consider verifying checksum manually",
@@ -183,16 +185,18 @@ class Reporter:
             "CRITICAL": "[red]✗ NOT RECOMMENDED[/] • Do not download unless you trust the source",
         }
 
+        lines = []
         recommendation = recommendations.get(report.risk_level.value, "")
         if recommendation:
-            self.console.print(f"\n{recommendation}")
+            lines.append(f"\n{recommendation}")
 
         # Add quick tips
         if report.score < 60:
-            self.console.print("\n[dim]💡 Tips to improve trust:[/]")
-            self.console.print("  • Look for official checksums on the project website")
-            self.console.print("  • Check if the repository has active maintainers")
-            self.console.print("  • Verify GPG signatures if available")
+            lines.append("\n[dim]💡 Tips to improve trust:[/]")
+            lines.append("  • Look for official checksums on the project website")
+            lines.append("  • Check if the repository has active maintainers")
+            lines.append("  • Verify GPG signatures if available")
+        return lines
 
     def output_github_info(self, release: GitHubRelease) -> None:
         """Output GitHub Release information."""
@@ -236,14 +240,14 @@ class Reporter:
         if self.quiet:
             return
 
-        self.console.print("\n[bold]Batch Verification Results[/]")
         self.console.print(
+            "\n[bold]Batch Verification Results[/]\n"
             f"Total: {result.total} | "
             f"[green]Verified: {result.verified}[/] | "
             f"[red]Failed: {result.failed}[/] | "
-            f"[dim]Skipped: {result.skipped}[/]"
+            f"[dim]Skipped: {result.skipped}[/]\n"
+            f"Success Rate: {result.success_rate:.1f}%"
         )
-        self.console.print(f"Success Rate: {result.success_rate:.1f}%")
 
     def output_error(self, message: str, title: str = "Error") -> None:
         """Output error message."""
@@ -251,21 +255,21 @@ class Reporter:
             self._output_json({"error": message})
             return
 
-        self.console.print(f"\n[red bold]{title}:[/] {message}")
+        self.console.print(Text.assemble("\n", (f"{title}:", "red bold"), f" {message}"))
 
     def output_warning(self, message: str) -> None:
         """Output warning message."""
-        if self.json_output or self.quiet:
+        if not self.emits_text:
             return
 
-        self.console.print(f"\n[yellow]⚠ Warning:[/] {message}")
+        self.console.print(Text.assemble("\n", ("⚠ Warning:", "yellow"), f" {message}"))
 
     def output_info(self, message: str) -> None:
         """Output info message."""
-        if self.json_output or self.quiet:
+        if not self.emits_text:
             return
 
-        self.console.print(f"\n[dim]{message}[/]")
+        self.console.print(Text.assemble("\n", (message, "dim")))
 
     def output_success(self, message: str) -> None:
         """Output success message."""
@@ -276,7 +280,7 @@ class Reporter:
         if self.quiet:
             return
 
-        self.console.print(f"\n[green]✓[/] {message}")
+        self.console.print(Text.assemble("\n", ("✓", "green"), f" {message}"))
 
     def output_full_result(
         self,
@@ -297,11 +301,7 @@ class Reporter:
         if self.json_output:
             data: dict[str, Any] = {}
             if download_result:
-                data["download"] = (
-                    download_result.to_dict()
-                    if hasattr(download_result, "to_dict")
-                    else asdict(download_result)
-                )
+                data["download"] = download_result.to_dict()
             if verification_result:
                 data["verification"] = verification_result.to_dict()
             if trust_report:
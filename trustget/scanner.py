@@ -10,13 +10,40 @@ Scans directory URLs for checksum files like:
 from __future__ import annotations
 
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from functools import lru_cache
+from pathlib import Path
 from urllib.parse import urljoin, urlparse
 
 import requests
-
-from trustget.utils import detect_hash_algorithm
+from requests.adapters import HTTPAdapter
+
+from trustget.utils import (
+    detect_hash_algorithm,
+    dumps_json,
+    get_cache_dir,
+    load_json_file,
+    loads_json,
+    write_text_atomic,
+)
+
+# Checksum line formats, tried in order:
+# - GNU coreutils: "hash  filename" or "hash *filename"
+# - "filename: hash"
+_CHECKSUM_LINE_RE = re.compile(
+    r"^(?:(?P<hash>[a-fA-F0-9]+)\s+\*?(?P<filename>.+)"
+    r"|(?P<filename_alt>.+):\s*(?P<hash_alt>[a-fA-F0-9]+))$"
+)
+
+# href attribute values in directory listings: double-quoted, single-quoted
+# or unquoted (some autoindex pages emit bare href=file.sha256)
+_HREF_RE = re.compile(
+    r"""href\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s"'>]+))""",
+    re.IGNORECASE,
+)
 
 
 class ChecksumFileType(Enum):
@@ -30,7 +57,7 @@ class ChecksumFileType(Enum):
     SIGNATURE = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ChecksumEntry:
     """A single checksum entry from a checksum file."""
 
@@ -49,7 +76,7 @@ class ChecksumEntry:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ChecksumFile:
     """A checksum file found during scanning."""
 
@@ -58,26 +85,42 @@ class ChecksumFile:
     file_type: ChecksumFileType
     content: str
     entries: list[ChecksumEntry] = field(default_factory=list)
+    _by_lower: dict[str, ChecksumEntry] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
 
-    def to_dict(self) -> dict:
-        """Convert to dictionary."""
-        return {
+    def to_dict(self, include_content: bool = False) -> dict:
+        """
+        Convert to dictionary.
+
+        Args:
+            include_content: Also include the raw file content, which the
+                parsed entries already cover and can be large
+        """
+        data = {
             "url": self.url,
             "filename": self.filename,
             "file_type": self.file_type.name,
-            "entries": [e.to_dict() for e in self.entries],
+            "entries": list(map(ChecksumEntry.to_dict, self.entries)),
         }
+        if include_content:
+            data["content"] = self.content
+        return data
 
     def get_entry_for_file(self, target_filename: str) -> ChecksumEntry | None:
-        """Get checksum entry for a specific filename."""
-        target_lower = target_filename.lower()
-        for entry in self.entries:
-            if entry.filename.lower() == target_lower:
-                return entry
-        return None
-
-
-@dataclass
+        """Get checksum entry for a specific filename (case-insensitive)."""
+        if self._indexed_count != len(self.entries):
+            # Index entries by lowercased filename; first occurrence wins
+            by_lower: dict[str, ChecksumEntry] = {}
+            for entry in self.entries:
+                by_lower.setdefault(entry.filename.lower(), entry)
+            self._by_lower = by_lower
+            self._indexed_count = len(self.entries)
+        return self._by_lower.get(target_filename.lower())
+
+
+@dataclass(slots=True)
 class ScanResult:
     """Result of scanning a URL directory."""
 
@@ -85,6 +128,19 @@ class ScanResult:
     checksum_files: list[ChecksumFile] = field(default_factory=list)
     signature_files: list[str] = field(default_factory=list)
     scanned_urls: list[str] = field(default_factory=list)
+    _index: dict[str, ChecksumEntry] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed_count: int = field(default=-1, init=False, repr=False, compare=False)
+
+    # Lookup priority for get_checksum_for
+    PRIORITY = (
+        ChecksumFileType.SHA256,
+        ChecksumFileType.SHA512,
+        ChecksumFileType.SHA1,
+        ChecksumFileType.MD5,
+        ChecksumFileType.GENERIC,
+    )
 
     def to_dict(self) -> dict:
         """Convert to dictionary."""
@@ -95,31 +151,26 @@ class ScanResult:
             "scanned_urls": self.scanned_urls,
         }
 
+    def _entry_index(self) -> dict[str, ChecksumEntry]:
+        """Get filename -> best entry index, rebuilt when checksum files are added."""
+        if self._indexed_count != len(self.checksum_files):
+            index: dict[str, ChecksumEntry] = {}
+            for file_type in self.PRIORITY:
+                for cf in self.checksum_files:
+                    if cf.file_type == file_type:
+                        for entry in cf.entries:
+                            index.setdefault(entry.filename.lower(), entry)
+            self._index = index
+            self._indexed_count = len(self.checksum_files)
+        return self._index
+
     def has_checksum_for(self, filename: str) -> bool:
         """Check if any checksum file contains entry for filename."""
-        for cf in self.checksum_files:
-            if cf.get_entry_for_file(filename):
-                return True
-        return False
+        return filename.lower() in self._entry_index()
 
     def get_checksum_for(self, filename: str) -> ChecksumEntry | None:
         """Get checksum entry for filename (priority: SHA256 > SHA512 > others)."""
-        # Priority order
-        priority = [
-            ChecksumFileType.SHA256,
-            ChecksumFileType.SHA512,
-            ChecksumFileType.SHA1,
-            ChecksumFileType.MD5,
-            ChecksumFileType.GENERIC,
-        ]
-
-        for file_type in priority:
-            for cf in self.checksum_files:
-                if cf.file_type == file_type:
-                    entry = cf.get_entry_for_file(filename)
-                    if entry:
-                        return entry
-        return None
+        return self._entry_index().get(filename.lower())
 
 
 class Scanner:
@@ -160,29 +211,92 @@ class Scanner:
         r"^#",  # Comments in listings
     ]
 
+    # Both pattern lists fused into one regex each, so a filename is
+    # classified in a single match. Unanchored patterns get a lazy ".*?"
+    # prefix and re.match tries alternatives left to right, so the first
+    # matching entry in CHECKSUM_PATTERNS still wins.
+    _CHECKSUM_RE = re.compile(
+        "|".join(
+            f"(?P<p{i}>{pattern if pattern.startswith('^') else '.*?' + pattern})"
+            for i, (pattern, _) in enumerate(CHECKSUM_PATTERNS)
+        ),
+        re.IGNORECASE,
+    )
+    _CHECKSUM_TYPES = {f"p{i}": file_type for i, (_, file_type) in enumerate(CHECKSUM_PATTERNS)}
+    _SKIP_RE = re.compile("|".join(f"(?:{pattern})" for pattern in SKIP_PATTERNS), re.IGNORECASE)
+
     DEFAULT_TIMEOUT = 10
+    MAX_FETCH_WORKERS = 8
+    ETAG_CACHE_FILENAME = "scan_etags.json"
+    ETAG_CACHE_MAX_ENTRIES = 64
     USER_AGENT = "TrustGet/0.1.0 (https://github.com/FaturRachmann/trustget)"
 
-    def __init__(self, timeout: int = DEFAULT_TIMEOUT):
+    def __init__(self, timeout: int = DEFAULT_TIMEOUT, etag_cache_path: Path | None = None):
         """
         Initialize scanner.
 
         Args:
             timeout: HTTP request timeout
+            etag_cache_path: JSON file for cached checksum files (default: user cache dir)
         """
         self.timeout = timeout
+        self.etag_cache_path = etag_cache_path or get_cache_dir() / self.ETAG_CACHE_FILENAME
         self._session: requests.Session | None = None
+        self._etag_cache: dict[str, list[str]] | None = None
+        self._etag_cache_dirty = False
+        # _fetch_many and scan() fetch on several threads
+        self._etag_lock = threading.Lock()
+        self._session_lock = threading.Lock()
 
     @property
     def session(self) -> requests.Session:
-        """Get or create HTTP session."""
+        """Get or create HTTP session (safe to call from several threads)."""
         if self._session is None:
-            self._session = requests.Session()
-            self._session.headers.update({"User-Agent": self.USER_AGENT})
+            with self._session_lock:
+                if self._session is None:
+                    session = requests.Session()
+                    session.headers.update({"User-Agent": self.USER_AGENT})
+                    # One pooled connection per concurrent _fetch_many worker
+                    adapter = HTTPAdapter(pool_maxsize=self.MAX_FETCH_WORKERS)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
         return self._session
 
+    @property
+    def etag_cache(self) -> dict[str, list[str]]:
+        """Get cached [etag, content] pairs by URL, loading them on first use."""
+        if self._etag_cache is None:
+            try:
+                cache = load_json_file(self.etag_cache_path)
+            except (OSError, ValueError):
+                cache = {}
+            if not isinstance(cache, dict):
+                cache = {}
+            # Drop entries a crash or another version left malformed
+            self._etag_cache = {
+                url: entry
+                for url, entry in cache.items()
+                if isinstance(entry, list)
+                and len(entry) == 2
+                and all(isinstance(value, str) for value in entry)
+            }
+        return self._etag_cache
+
+    def _save_etag_cache(self) -> None:
+        """Persist the ETag cache, keeping only the most recent entries."""
+        if not self._etag_cache_dirty or self._etag_cache is None:
+            return
+        entries = list(self._etag_cache.items())[-self.ETAG_CACHE_MAX_ENTRIES :]
+        try:
+            write_text_atomic(self.etag_cache_path, dumps_json(dict(entries), indent=False))
+        except OSError:
+            return
+        self._etag_cache_dirty = False
+
     def close(self) -> None:
-        """Close HTTP session."""
+        """Save cached checksum files and close HTTP session."""
+        self._save_etag_cache()
         if self._session:
             self._session.close()
             self._session = None
@@ -193,23 +307,28 @@ class Scanner:
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
 
-    def _get_checksum_file_type(self, filename: str) -> ChecksumFileType | None:
+    # Listings and release assets repeat the same names across scans, and a
+    # non-matching name has to fail every alternative, so results are cached
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _get_checksum_file_type(filename: str) -> ChecksumFileType | None:
         """Determine checksum file type from filename."""
-        filename_lower = filename.lower()
-
-        for pattern, file_type in self.CHECKSUM_PATTERNS:
-            if re.search(pattern, filename_lower, re.IGNORECASE):
-                return file_type
-        return None
-
-    def _should_skip(self, filename: str) -> bool:
+        match = Scanner._CHECKSUM_RE.match(filename)
+        if match is None:
+            return None
+        # Every alternative is a named group, so a match always sets lastgroup
+        assert match.lastgroup is not None
+        return Scanner._CHECKSUM_TYPES[match.lastgroup]
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _should_skip(filename: str) -> bool:
         """Check if file should be skipped."""
-        for pattern in self.SKIP_PATTERNS:
-            if re.search(pattern, filename, re.IGNORECASE):
-                return True
-        return False
+        return Scanner._SKIP_RE.search(filename) is not None
 
-    def _parse_checksum_content(self, content: str, url: str) -> list[ChecksumEntry]:
+    def _parse_checksum_content(
+        self, content: str, url: str, target_filename: str | None = None
+    ) -> list[ChecksumEntry]:
         """
         Parse checksum file content.
 
@@ -217,11 +336,17 @@ class Scanner:
         - GNU coreutils: hash  filename
         - hash filename
         - filename: hash
+
+        When target_filename is given only its entry (if any) is parsed and
+        returned, skipping the rest of large release-wide checksum files.
         """
+        if target_filename is not None:
+            entry = self._find_checksum_entry(content, target_filename)
+            return [entry] if entry else []
+
         entries = []
-        lines = content.splitlines()
 
-        for line_num, line in enumerate(lines, 1):
+        for line_num, line in enumerate(content.splitlines(), 1):
             line = line.strip()
             if not line or line.startswith("#"):
                 continue
@@ -234,54 +359,109 @@ class Scanner:
         return entries
 
     def _parse_checksum_line(self, line: str, line_num: int) -> ChecksumEntry | None:
-        """Parse a single checksum line."""
-        line = line.strip()
-
-        # Format 1: GNU coreutils (hash  filename) or (hash *filename)
-        # The space after hash can be single or double
-        match = re.match(r"^([a-fA-F0-9]+)\s+[\*]?(.+)$", line)
-        if match:
-            hash_value = match.group(1).lower()
-            filename = match.group(2).strip()
-            algorithm = detect_hash_algorithm(hash_value) or "unknown"
-            return ChecksumEntry(
-                hash_value=hash_value,
-                filename=filename,
-                algorithm=algorithm,
-                line_number=line_num,
-            )
+        """Parse a single checksum line (already stripped by the caller)."""
+        match = _CHECKSUM_LINE_RE.match(line)
+        if not match:
+            return None
+
+        if match.group("hash") is not None:
+            hash_value = match.group("hash")
+            filename = match.group("filename")
+        else:
+            hash_value = match.group("hash_alt")
+            filename = match.group("filename_alt")
+
+        hash_value = hash_value.lower()
+        return ChecksumEntry(
+            hash_value=hash_value,
+            filename=filename.strip(),
+            algorithm=detect_hash_algorithm(hash_value) or "unknown",
+            line_number=line_num,
+        )
+
+    def _find_checksum_entry(self, content: str, filename: str) -> ChecksumEntry | None:
+        """
+        Find the checksum entry for a single file.
 
-        # Format 2: filename: hash
-        match = re.match(r"^(.+):\s*([a-fA-F0-9]+)$", line)
-        if match:
-            filename = match.group(1).strip()
-            hash_value = match.group(2).lower()
-            algorithm = detect_hash_algorithm(hash_value) or "unknown"
-            return ChecksumEntry(
-                hash_value=hash_value,
-                filename=filename,
-                algorithm=algorithm,
-                line_number=line_num,
-            )
+        Scans the whole content once for the filename and parses only the
+        lines it occurs on, instead of parsing every line of large
+        release-wide checksum files.
+
+        Args:
+            content: Checksum file content
+            filename: Filename to look up (case-insensitive)
 
+        Returns:
+            First matching ChecksumEntry, or None
+        """
+        target_lower = filename.lower()
+        line_end = -1
+        for match in re.finditer(re.escape(filename), content, re.IGNORECASE):
+            if match.start() <= line_end:
+                continue  # Another occurrence on an already-checked line
+            line_start = content.rfind("\n", 0, match.start()) + 1
+            line_end = content.find("\n", match.end())
+            if line_end == -1:
+                line_end = len(content)
+            line = content[line_start:line_end].strip()
+            if line.startswith("#"):
+                continue
+            line_num = content.count("\n", 0, line_start) + 1
+            entry = self._parse_checksum_line(line, line_num)
+            if entry and entry.filename.lower() == target_lower:
+                return entry
         return None
 
     def _fetch_url(self, url: str) -> tuple[str | None, int]:
         """
         Fetch URL content.
 
+        Checksum files seen before are revalidated with If-None-Match, so
+        an unchanged file costs a 304 instead of a full download.
+
         Returns:
             Tuple of (content, status_code)
         """
+        with self._etag_lock:
+            cached = self.etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
         try:
-            response = self.session.get(url, timeout=self.timeout)
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+            if response.status_code == 304 and cached:
+                return cached[1], 200
             if response.status_code == 200:
-                return response.text, response.status_code
+                if response.encoding is None:
+                    # Checksum files are ASCII; skip charset detection over the body
+                    response.encoding = "utf-8"
+                content = response.text
+                etag = response.headers.get("ETag")
+                if etag:
+                    with self._etag_lock:
+                        # Re-insert so the most recently used entries survive trimming
+                        self.etag_cache.pop(url, None)
+                        self.etag_cache[url] = [etag, content]
+                        self._etag_cache_dirty = True
+                return content, response.status_code
             return None, response.status_code
         except requests.RequestException:
             return None, 0
 
-    def _scan_github_release(self, base_url: str, owner: str, repo: str, tag: str) -> ScanResult:
+    def _fetch_many(self, urls: list[str]) -> list[tuple[str | None, int]]:
+        """Fetch several URLs concurrently, returning results in input order."""
+        if len(urls) <= 1:
+            return [self._fetch_url(url) for url in urls]
+        with ThreadPoolExecutor(max_workers=min(self.MAX_FETCH_WORKERS, len(urls))) as executor:
+            return list(executor.map(self._fetch_url, urls))
+
+    def _scan_github_release(
+        self,
+        base_url: str,
+        owner: str,
+        repo: str,
+        tag: str,
+        target_filename: str | None = None,
+    ) -> ScanResult:
         """Scan GitHub Release assets for checksum files."""
         result = ScanResult(base_url=base_url)
 
@@ -293,9 +473,10 @@ class Scanner:
             if response.status_code != 200:
                 return result
 
-            release_data = response.json()
+            release_data = loads_json(response.content)
             assets = release_data.get("assets", [])
 
+            candidates: list[tuple[str, str, ChecksumFileType]] = []
             for asset in assets:
                 asset_name = asset.get("name", "")
                 asset_url = asset.get("browser_download_url", "")
@@ -310,26 +491,33 @@ class Scanner:
                 if file_type == ChecksumFileType.SIGNATURE:
                     result.signature_files.append(asset_url)
                 else:
-                    # Fetch checksum file content
-                    content, status = self._fetch_url(asset_url)
-                    if content:
-                        entries = self._parse_checksum_content(content, asset_url)
-                        checksum_file = ChecksumFile(
-                            url=asset_url,
-                            filename=asset_name,
-                            file_type=file_type,
-                            content=content,
-                            entries=entries,
-                        )
-                        result.checksum_files.append(checksum_file)
-                        result.scanned_urls.append(asset_url)
-
-        except requests.RequestException:
+                    candidates.append((asset_url, asset_name, file_type))
+
+            # Fetch checksum file contents
+            fetched = self._fetch_many([asset_url for asset_url, _, _ in candidates])
+            for (asset_url, asset_name, file_type), (content, _status) in zip(
+                candidates, fetched, strict=True
+            ):
+                if content:
+                    entries = self._parse_checksum_content(content, asset_url, target_filename)
+                    checksum_file = ChecksumFile(
+                        url=asset_url,
+                        filename=asset_name,
+                        file_type=file_type,
+                        content=content,
+                        entries=entries,
+                    )
+                    result.checksum_files.append(checksum_file)
+                    result.scanned_urls.append(asset_url)
+
+        except (requests.RequestException, ValueError):
             pass
 
         return result
 
-    def _scan_directory_listing(self, base_url: str) -> ScanResult:
+    def _scan_directory_listing(
+        self, base_url: str, target_filename: str | None = None
+    ) -> ScanResult:
         """Scan HTML directory listing for checksum files."""
         result = ScanResult(base_url=base_url)
 
@@ -346,12 +534,13 @@ class Scanner:
 
             # Extract links from HTML
             # Common patterns: Apache, Nginx directory listings
-            link_pattern = r'href=["\']([^"\']+)[\"\']'
-            links = re.findall(link_pattern, html)
-
-            for link in links:
-                # Skip parent directory links
-                if link.startswith("?") or link == "../" or link == "/":
+            candidates: list[tuple[str, str, ChecksumFileType]] = []
+            for match in _HREF_RE.finditer(html):
+                # Each quoting style is its own group and exactly one matches
+                assert match.lastindex is not None
+                link = match.group(match.lastindex)
+                # Skip empty and parent directory links
+                if not link or link.startswith("?") or link == "../" or link == "/":
                     continue
 
                 # Build absolute URL
@@ -370,25 +559,30 @@ class Scanner:
                 if file_type == ChecksumFileType.SIGNATURE:
                     result.signature_files.append(full_url)
                 else:
-                    # Fetch and parse checksum file
-                    content, status = self._fetch_url(full_url)
-                    if content:
-                        entries = self._parse_checksum_content(content, full_url)
-                        checksum_file = ChecksumFile(
-                            url=full_url,
-                            filename=filename,
-                            file_type=file_type,
-                            content=content,
-                            entries=entries,
-                        )
-                        result.checksum_files.append(checksum_file)
+                    candidates.append((full_url, filename, file_type))
+
+            # Fetch and parse checksum files
+            fetched = self._fetch_many([full_url for full_url, _, _ in candidates])
+            for (full_url, filename, file_type), (content, _status) in zip(
+                candidates, fetched, strict=True
+            ):
+                if content:
+                    entries = self._parse_checksum_content(content, full_url, target_filename)
+                    checksum_file = ChecksumFile(
+                        url=full_url,
+                        filename=filename,
+                        file_type=file_type,
+                        content=content,
+                        entries=entries,
+                    )
+                    result.checksum_files.append(checksum_file)
 
         except requests.RequestException:
             pass
 
         return result
 
-    def _scan_inline_checksum(self, url: str) -> ScanResult:
+    def _scan_inline_checksum(self, url: str, target_filename: str | None = None) -> ScanResult:
         """Check for inline checksum file (e.g., file.tar.gz.sha256)."""
         result = ScanResult(base_url=url)
 
@@ -398,7 +592,7 @@ class Scanner:
 
         content, status = self._fetch_url(url)
         if content:
-            entries = self._parse_checksum_content(content, url)
+            entries = self._parse_checksum_content(content, url, target_filename)
             filename = urlparse(url).path.split("/")[-1]
             checksum_file = ChecksumFile(
                 url=url,
@@ -418,37 +612,39 @@ class Scanner:
 
         Args:
             url: URL to scan (can be file URL or directory URL)
-            target_filename: Optional target filename to optimize search
+            target_filename: Only parse checksum entries for this file
 
         Returns:
             ScanResult with found checksum files
         """
-        from trustget.utils import is_github_releases_url, parse_github_url
-
-        # Strategy 1: Check for inline checksum (file.ext.sha256)
-        inline_url = f"{url}.sha256"
-        inline_result = self._scan_inline_checksum(inline_url)
-        if inline_result.checksum_files:
-            return inline_result
-
-        # Also try .sha512
-        inline_url = f"{url}.sha512"
-        inline_result = self._scan_inline_checksum(inline_url)
-        if inline_result.checksum_files:
-            return inline_result
+        from trustget.utils import match_github_release
+
+        # Strategy 1: Check for inline checksum (file.ext.sha256, then .sha512).
+        # Both are probed at once; .sha256 still wins when both exist
+        inline_urls = (f"{url}.sha256", f"{url}.sha512")
+        with ThreadPoolExecutor(max_workers=len(inline_urls)) as executor:
+            inline_results = list(
+                executor.map(
+                    lambda inline_url: self._scan_inline_checksum(inline_url, target_filename),
+                    inline_urls,
+                )
+            )
+        for inline_result in inline_results:
+            if inline_result.checksum_files:
+                return inline_result
 
         # Strategy 2: GitHub Releases
-        if is_github_releases_url(url):
-            parsed = parse_github_url(url)
-            if parsed:
-                # Get base releases URL
-                base_url = f"https://github.com/{parsed['owner']}/{parsed['repo']}/releases"
-                return self._scan_github_release(
-                    base_url,
-                    parsed["owner"],
-                    parsed["repo"],
-                    parsed["tag"],
-                )
+        release = match_github_release(url)
+        if release and release["asset"]:
+            # Get base releases URL
+            base_url = f"https://github.com/{release['owner']}/{release['repo']}/releases"
+            return self._scan_github_release(
+                base_url,
+                release["owner"],
+                release["repo"],
+                release["tag"],
+                target_filename,
+            )
 
         # Strategy 3: Directory listing
         # Get directory URL from file URL
@@ -457,7 +653,7 @@ class Scanner:
         if "/" in path:
             dir_path = path.rsplit("/", 1)[0] + "/"
             dir_url = f"{parsed.scheme}://{parsed.netloc}{dir_path}"
-            return self._scan_directory_listing(dir_url)
+            return self._scan_directory_listing(dir_url, target_filename)
 
         return ScanResult(base_url=url)
 
@@ -14,15 +14,18 @@ Risk Levels:
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 from urllib.parse import urlparse
 
-from trustget.github import GitHubClient
-from trustget.utils import is_github_url, parse_github_url
+from trustget.github import GitHubClient, GitHubError, GitHubRelease
+from trustget.utils import is_github_url, load_json_file, parse_github_url, save_json_file
 
 
 class RiskLevel(Enum):
@@ -68,7 +71,7 @@ class RiskLevel(Enum):
         return colors.get(self, "white")
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustFactor:
     """A single factor contributing to trust score."""
 
@@ -102,7 +105,7 @@ class TrustFactor:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TrustReport:
     """Complete trust analysis report."""
 
@@ -111,7 +114,22 @@ class TrustReport:
     risk_level: RiskLevel = RiskLevel.MEDIUM
     factors: list[TrustFactor] = field(default_factory=list)
     metadata: dict[str, Any] = field(default_factory=dict)
-    timestamp: str = field(default_factory=lambda: datetime.now(UTC).isoformat())
+    # Release fetched during analysis, so callers can show it without refetching
+    github_release: GitHubRelease | None = field(default=None, repr=False, compare=False)
+    # Formatting the ISO timestamp is deferred until it's read
+    _created_at: float = field(default_factory=time.time, init=False, repr=False, compare=False)
+    _timestamp: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> str:
+        """Get creation time as an ISO 8601 UTC string (formatted once)."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(self._created_at, UTC).isoformat()
+        return self._timestamp
+
+    @timestamp.setter
+    def timestamp(self, value: str) -> None:
+        self._timestamp = value
 
     @property
     def max_score(self) -> int:
@@ -194,6 +212,25 @@ KNOWN_DOMAINS = {
 }
 
 
+FACTOR_DESCRIPTIONS = {
+    "https": "Secure HTTPS connection",
+    "checksum_available": "Checksum file available",
+    "checksum_verified": "Checksum verified successfully",
+    "gpg_signed": "GPG signature verified",
+    "known_domain": "Known/trusted domain",
+    "maintainer_verified": "Release by repository maintainer",
+    "repo_age_established": "Repository age > 1 year",
+    "release_recent": "Release published < 30 days ago",
+    "http_redirect": "HTTP redirect to different domain",
+    "unknown_domain": "Unknown domain",
+    "no_checksum": "No checksum file found",
+    "repo_new": "Repository < 3 months old",
+    "prerelease": "Pre-release or draft version",
+}
+
+_FACTOR_DISPLAY_NAMES = {name: name.replace("_", " ").title() for name in FACTOR_DESCRIPTIONS}
+
+
 class TrustEngine:
     """
     Trust Score calculation engine.
@@ -206,24 +243,28 @@ class TrustEngine:
     - JSON export for CI/CD integration
     """
 
-    # Default scoring weights (matching blueprint)
-    DEFAULT_WEIGHTS = {
-        # Positive factors
-        "https": 20,
-        "checksum_available": 10,
-        "checksum_verified": 25,
-        "gpg_signed": 25,
-        "known_domain": 10,
-        "maintainer_verified": 20,
-        "repo_age_established": 7,
-        "release_recent": 10,
-        # Negative factors
-        "http_redirect": -10,
-        "unknown_domain": -20,
-        "no_checksum": -15,
-        "repo_new": -20,
-        "prerelease": -10,
-    }
+    # Default scoring weights (matching blueprint); read-only, engines copy them
+    DEFAULT_WEIGHTS = MappingProxyType(
+        {
+            # Positive factors
+            "https": 20,
+            "checksum_available": 10,
+            "checksum_verified": 25,
+            "gpg_signed": 25,
+            "known_domain": 10,
+            "maintainer_verified": 20,
+            "repo_age_established": 7,
+            "release_recent": 10,
+            # Negative factors
+            "http_redirect": -10,
+            "unknown_domain": -20,
+            "no_checksum": -15,
+            "repo_new": -20,
+            "prerelease": -10,
+        }
+    )
+
+    MAX_ANALYZE_WORKERS = 16
 
     def __init__(self, weights: dict[str, int] | None = None):
         """
@@ -262,25 +303,13 @@ class TrustEngine:
         reason: str = "",
     ) -> TrustFactor:
         """Create a trust factor."""
-        descriptions = {
-            "https": "Secure HTTPS connection",
-            "checksum_available": "Checksum file available",
-            "checksum_verified": "Checksum verified successfully",
-            "gpg_signed": "GPG signature verified",
-            "known_domain": "Known/trusted domain",
-            "maintainer_verified": "Release by repository maintainer",
-            "repo_age_established": "Repository age > 1 year",
-            "release_recent": "Release published < 30 days ago",
-            "http_redirect": "HTTP redirect to different domain",
-            "unknown_domain": "Unknown domain",
-            "no_checksum": "No checksum file found",
-            "repo_new": "Repository < 3 months old",
-            "prerelease": "Pre-release or draft version",
-        }
+        display_name = _FACTOR_DISPLAY_NAMES.get(name)
+        if display_name is None:
+            display_name = name.replace("_", " ").title()
 
         return TrustFactor(
-            name=name.replace("_", " ").title(),
-            description=descriptions.get(name, name),
+            name=display_name,
+            description=FACTOR_DESCRIPTIONS.get(name, name),
             weight=weight,
             applied=applied,
             reason=reason,
@@ -291,24 +320,48 @@ class TrustEngine:
         parsed = urlparse(url)
         return parsed.netloc.lower()
 
-    def _is_https(self, url: str) -> bool:
-        """Check if URL uses HTTPS."""
-        parsed = urlparse(url)
-        return parsed.scheme == "https"
+    def _lookup_domain(self, domain: str) -> int | None:
+        """
+        Get the known-domain score for a domain or any parent domain.
+
+        The most specific entry wins, so "dl.example.org" can override
+        "example.org". Costs one dict lookup per label.
+        """
+        labels = domain.split(".")
+        for i in range(len(labels) - 1):
+            score = self._known_domains.get(".".join(labels[i:]))
+            if score is not None:
+                return score
+        return None
 
     def _analyze_github_resource(
         self,
-        url: str,
+        parsed: dict[str, str],
         report: TrustReport,
     ) -> None:
-        """Analyze GitHub resource (release or repo) and add factors."""
-        parsed = parse_github_url(url)
-        if not parsed:
-            return
+        """
+        Analyze GitHub resource (release or repo) and add factors.
 
+        Args:
+            parsed: parse_github_url() result for the URL being analyzed
+            report: TrustReport to add factors and metadata to
+        """
         try:
             client = self.github_client
-            repo = client.get_repo(parsed["owner"], parsed["repo"])
+            release: GitHubRelease | None = None
+            release_error: GitHubError | None = None
+            if parsed.get("type") == "release":
+                try:
+                    release, repo = client.get_release_and_repo(
+                        parsed["owner"], parsed["repo"], parsed["tag"]
+                    )
+                except GitHubError as e:
+                    # Only the release may have failed (e.g. an unknown tag);
+                    # keep the repo factors rather than dropping everything
+                    release_error = e
+                    repo = client.get_repo(parsed["owner"], parsed["repo"])
+            else:
+                repo = client.get_repo(parsed["owner"], parsed["repo"])
 
             # Repo age - always check for any GitHub URL
             if repo.is_established:
@@ -331,9 +384,7 @@ class TrustEngine:
                 )
 
             # Additional factors for releases
-            if parsed.get("type") == "release":
-                release = client.get_release(parsed["owner"], parsed["repo"], parsed["tag"])
-
+            if release is not None:
                 # Maintainer verification
                 if client.is_maintainer(release):
                     report.factors.append(
@@ -380,6 +431,9 @@ class TrustEngine:
 
             if parsed.get("type") == "release":
                 report.metadata["github"]["tag"] = parsed.get("tag")
+            report.github_release = release
+            if release_error is not None:
+                report.metadata["github_error"] = str(release_error)
 
         except Exception as e:
             # GitHub API failed, but don't fail the whole analysis
@@ -407,9 +461,10 @@ class TrustEngine:
             TrustReport with score and factors
         """
         report = TrustReport(url=url)
+        parsed = urlparse(url)
 
         # Factor 1: HTTPS connection
-        is_https = self._is_https(url)
+        is_https = parsed.scheme == "https"
         report.factors.append(
             self._create_factor(
                 "https",
@@ -420,8 +475,8 @@ class TrustEngine:
         )
 
         # Factor 2: Domain reputation
-        domain = self._get_domain(url)
-        domain_score = self._known_domains.get(domain)
+        domain = parsed.netloc.lower()
+        domain_score = self._lookup_domain(domain)
 
         if domain_score:
             report.factors.append(
@@ -485,10 +540,9 @@ class TrustEngine:
         # Factor 5: Redirect chain
         if redirect_history and len(redirect_history) > 0:
             # Check if any redirect goes to different domain
-            base_domain = self._get_domain(url)
             for redirect_url in redirect_history:
                 redirect_domain = self._get_domain(redirect_url)
-                if redirect_domain != base_domain:
+                if redirect_domain != domain:
                     report.factors.append(
                         self._create_factor(
                             "http_redirect",
@@ -499,16 +553,53 @@ class TrustEngine:
                     )
                     break
 
-        # Factor 6: GitHub analysis (for any GitHub URL)
-        if is_github_url(url):
-            self._analyze_github_resource(url, report)
+        # Factor 6: GitHub analysis (for any GitHub release or repo URL)
+        github = parse_github_url(url)
+        if github:
+            self._analyze_github_resource(github, report)
+
+        self._update_score(report)
+        return report
 
-        # Calculate total score
+    def _update_score(self, report: TrustReport) -> None:
+        """Recalculate score and risk level from the report's factors."""
         score = sum(f.points for f in report.factors)
         # Clamp to 0-100
         report.score = max(0, min(100, score))
         report.risk_level = RiskLevel.from_score(report.score)
 
+    def mark_checksum_verified(self, report: TrustReport) -> TrustReport:
+        """
+        Update a report in place after its checksum was verified.
+
+        Swaps the checksum factor for "checksum_verified" and rescores,
+        without re-running the rest of the analysis (no GitHub API calls).
+
+        Args:
+            report: TrustReport from analyze() or analyze_minimal()
+
+        Returns:
+            The same report, updated
+        """
+        verified = self._create_factor(
+            "checksum_verified",
+            self.weights["checksum_verified"],
+            applied=True,
+            reason="Checksum verified successfully",
+        )
+        checksum_names = {
+            _FACTOR_DISPLAY_NAMES[name]
+            for name in ("checksum_verified", "checksum_available", "no_checksum")
+        }
+
+        for i, factor in enumerate(report.factors):
+            if factor.name in checksum_names:
+                report.factors[i] = verified
+                break
+        else:
+            report.factors.append(verified)
+
+        self._update_score(report)
         return report
 
     def analyze_minimal(self, url: str) -> TrustReport:
@@ -525,6 +616,35 @@ class TrustEngine:
         """
         return self.analyze(url)
 
+    def analyze_many(
+        self,
+        urls: list[str],
+        max_workers: int = MAX_ANALYZE_WORKERS,
+        **kwargs: Any,
+    ) -> list[TrustReport]:
+        """
+        Analyze several URLs concurrently.
+
+        Analysis is dominated by GitHub API round-trips, so URLs are
+        analyzed on a thread pool sharing one GitHub client.
+
+        Args:
+            urls: URLs to analyze
+            max_workers: Maximum number of analysis threads
+            **kwargs: Passed to analyze() for every URL
+
+        Returns:
+            TrustReports in the same order as urls
+        """
+        if len(urls) <= 1 or max_workers <= 1:
+            return [self.analyze(url, **kwargs) for url in urls]
+
+        # Create the shared client up front so worker threads don't race to do it
+        if any(is_github_url(url) for url in urls):
+            _ = self.github_client
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(urls))) as executor:
+            return list(executor.map(lambda url: self.analyze(url, **kwargs), urls))
+
     def add_known_domain(self, domain: str, score: int) -> None:
         """Add domain to known domains database."""
         self._known_domains[domain.lower()] = score
@@ -545,10 +665,7 @@ class TrustEngine:
             report: TrustReport to export
             filepath: Path to save JSON file
         """
-        import json
-
-        with open(filepath, "w", encoding="utf-8") as f:
-            json.dump(report.to_dict(), f, indent=2)
+        save_json_file(filepath, report.to_dict())
 
     def import_policy(self, filepath: Path) -> None:
         """
@@ -557,10 +674,7 @@ class TrustEngine:
         Args:
             filepath: Path to policy JSON file
         """
-        import json
-
-        with open(filepath, encoding="utf-8") as f:
-            data = json.load(f)
+        data = load_json_file(filepath)
 
         if "weights" in data:
             self.weights.update(data["weights"])
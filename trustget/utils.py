@@ -4,24 +4,78 @@ Shared utility functions for TrustGet.
 
 from __future__ import annotations
 
+import contextlib
+import dataclasses
 import hashlib
 import json
+import math
 import os
 import re
 import sys
-from datetime import datetime
-from pathlib import Path
-from typing import Any
+import tempfile
+from datetime import date, datetime, time
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from types import ModuleType
+from typing import Any, TypedDict
 from urllib.parse import unquote, urlparse
 
 from platformdirs import user_cache_dir, user_config_dir
 
+orjson: ModuleType | None
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+else:
+    orjson = _orjson
+
+_HASH_ALGORITHMS_BY_LENGTH = {
+    32: "md5",
+    40: "sha1",
+    64: "sha256",
+    128: "sha512",
+}
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+_GITHUB_PREFIX_RE = re.compile(r"^https?://github\.com/[^/]+/[^/]+")
+_GITHUB_RELEASES_PREFIX_RE = re.compile(r"^https?://github\.com/[^/]+/[^/]+/releases/download/")
+_GITHUB_RELEASE_RE = re.compile(
+    r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+    r"/releases/download/(?P<tag>[^/]+)/(?P<filename>.+)$"
+)
+_GITHUB_RELEASE_PAGE_RE = re.compile(
+    r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+    r"/releases/(?:tag|download)/(?P<tag>[^/]+)(?:/(?P<asset>.+))?$"
+)
+_GITHUB_REPO_RE = re.compile(
+    r"^https?://github\.com/(?P<owner>[^/]+)/(?P<repo>[^/]+)"
+    r"(?:/(?P<type>tree|blob)/(?P<ref>[^/]+)(?:/(?P<path>.+))?)?$"
+)
+
+# RFC 6266: filename*=UTF-8''filename or filename="value"
+_CD_FILENAME_UTF8_RE = re.compile(r"filename\*=UTF-8\'\'([^;]+)")
+_CD_FILENAME_RE = re.compile(r'filename=["\']?([^"\';]+)["\']?')
+
+# Unsafe filesystem characters become "_", control characters are removed
+_SAFE_FILENAME_TABLE = str.maketrans(
+    {**dict.fromkeys(map(ord, '<>:"/\\|?*'), "_"), **dict.fromkeys(range(32))}
+)
+
+
+@lru_cache(maxsize=2048)
+def _url_path_name(url: str) -> str:
+    """Get the unquoted last path component of a URL (cached)."""
+    # URL paths are always "/"-separated, whatever the host OS. unquote
+    # returns its input untouched when there is no "%".
+    return PurePosixPath(unquote(urlparse(url).path)).name
+
 
 def get_filename_from_url(url: str) -> str:
     """Extract filename from URL."""
-    parsed = urlparse(url)
-    path = unquote(parsed.path)
-    filename = Path(path).name
+    filename = _url_path_name(url)
 
     if not filename:
         filename = f"download_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -34,12 +88,11 @@ def get_filename_from_content_disposition(content_disposition: str) -> str | Non
     if not content_disposition:
         return None
 
-    # RFC 6266: filename*=UTF-8''filename or filename="value"
-    match = re.search(r"filename\*=UTF-8\'\'([^;]+)", content_disposition)
+    match = _CD_FILENAME_UTF8_RE.search(content_disposition)
     if match:
         return unquote(match.group(1))
 
-    match = re.search(r'filename=["\']?([^"\';]+)["\']?', content_disposition)
+    match = _CD_FILENAME_RE.search(content_disposition)
     if match:
         return match.group(1)
 
@@ -48,20 +101,12 @@ def get_filename_from_content_disposition(content_disposition: str) -> str | Non
 
 def format_size(size_bytes: int) -> str:
     """Format byte size to human-readable string."""
-    if size_bytes == 0:
-        return "0 B"
-
-    units = ["B", "KB", "MB", "GB", "TB"]
-    unit_index = 0
-    size = float(size_bytes)
+    if size_bytes < 1024:
+        return f"{size_bytes} B"
 
-    while size >= 1024 and unit_index < len(units) - 1:
-        size /= 1024
-        unit_index += 1
-
-    if unit_index == 0:
-        return f"{int(size)} {units[unit_index]}"
-    return f"{size:.1f} {units[unit_index]}"
+    # Each unit step is 2**10, so the unit index falls out of the bit length
+    unit_index = min(len(_SIZE_UNITS) - 1, (size_bytes.bit_length() - 1) // 10)
+    return f"{size_bytes / (1 << (unit_index * 10)):.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def format_speed(bytes_per_second: float) -> str:
@@ -84,99 +129,229 @@ def format_duration(seconds: float) -> str:
     return f"{hours}h {mins}m"
 
 
-def compute_hash(filepath: Path, algorithm: str = "sha256", chunk_size: int = 8192) -> str:
+def compute_hash(filepath: Path, algorithm: str = "sha256") -> str:
     """Compute hash of a file using specified algorithm."""
-    hash_func = hashlib.new(algorithm)
-
+    # file_digest reads into a reused buffer and hashes in C (OpenSSL). Not
+    # mmap: a file truncated while mapped kills the process with SIGBUS.
     with open(filepath, "rb") as f:
-        while chunk := f.read(chunk_size):
-            hash_func.update(chunk)
-
-    return hash_func.hexdigest()
+        if hasattr(os, "posix_fadvise"):
+            # Hint the kernel to read ahead aggressively; it's a single linear pass
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        return hashlib.file_digest(f, algorithm).hexdigest()
 
 
 def detect_hash_algorithm(hash_value: str) -> str | None:
     """Detect hash algorithm from hash value length."""
-    hash_lengths = {
-        32: "md5",
-        40: "sha1",
-        64: "sha256",
-        128: "sha512",
-    }
     # Remove any whitespace and check length
     clean_hash = hash_value.strip()
-    return hash_lengths.get(len(clean_hash))
+    algorithm = _HASH_ALGORITHMS_BY_LENGTH.get(len(clean_hash))
+    if algorithm is None:
+        return None
+
+    # Must be hex; fromhex skips inner whitespace, so compare the decoded length
+    try:
+        if len(bytes.fromhex(clean_hash)) * 2 != len(clean_hash):
+            return None
+    except ValueError:
+        return None
+    return algorithm
 
 
 def is_github_releases_url(url: str) -> bool:
     """Check if URL is a GitHub Releases download URL."""
-    pattern = r"^https?://github\.com/[^/]+/[^/]+/releases/download/"
-    return bool(re.match(pattern, url))
+    return _GITHUB_RELEASES_PREFIX_RE.match(url) is not None
+
+
+class GitHubReleaseMatch(TypedDict):
+    """A GitHub release URL matched by match_github_release."""
+
+    owner: str
+    repo: str
+    tag: str
+    asset: str | None
+
+
+def match_github_release(url: str) -> GitHubReleaseMatch | None:
+    """
+    Match a GitHub release tag or download URL in a single pass.
+
+    Args:
+        url: URL to match
+
+    Returns:
+        Dict with owner, repo, tag and asset (None for tag pages),
+        or None if URL is not a GitHub release URL
+    """
+    match = _GITHUB_RELEASE_PAGE_RE.match(url)
+    if match is None:
+        return None
+    return GitHubReleaseMatch(
+        owner=match["owner"], repo=match["repo"], tag=match["tag"], asset=match["asset"]
+    )
 
 
 def is_github_url(url: str) -> bool:
     """Check if URL is any GitHub URL."""
-    pattern = r"^https?://github\.com/[^/]+/[^/]+"
-    return bool(re.match(pattern, url))
+    return _GITHUB_PREFIX_RE.match(url) is not None
 
 
 def parse_github_url(url: str) -> dict[str, str] | None:
     """Parse GitHub URL to extract owner, repo, tag, and filename."""
-    # Try releases URL pattern first
-    pattern = r"^https?://github\.com/([^/]+)/([^/]+)/releases/download/([^/]+)/(.+)$"
-    match = re.match(pattern, url)
+    parsed = _parse_github_url(url)
+    # Copy so callers can't mutate the cached result
+    return dict(parsed) if parsed is not None else None
 
+
+@lru_cache(maxsize=2048)
+def _parse_github_url(url: str) -> dict[str, str] | None:
+    """Parse GitHub URL (cached, see parse_github_url)."""
+    # Try releases URL pattern first
+    match = _GITHUB_RELEASE_RE.match(url)
     if match:
-        return {
-            "owner": match.group(1),
-            "repo": match.group(2),
-            "tag": match.group(3),
-            "filename": match.group(4),
-            "type": "release",
-        }
+        return {**match.groupdict(), "type": "release"}
 
     # Try general GitHub URL pattern
-    pattern = r"^https?://github\.com/([^/]+)/([^/]+)(?:/(tree|blob)/([^/]+)(?:/(.+))?)?$"
-    match = re.match(pattern, url)
-
+    match = _GITHUB_REPO_RE.match(url)
     if match:
         return {
-            "owner": match.group(1),
-            "repo": match.group(2),
-            "type": match.group(3) or "repo",
-            "ref": match.group(4) if match.group(4) else "main",
-            "path": match.group(5) if match.group(5) else "",
+            "owner": match.group("owner"),
+            "repo": match.group("repo"),
+            "type": match.group("type") or "repo",
+            "ref": match.group("ref") or "main",
+            "path": match.group("path") or "",
         }
 
     return None
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Get user config directory."""
     return Path(user_config_dir("trustget"))
 
 
+@lru_cache(maxsize=1)
 def get_cache_dir() -> Path:
     """Get user cache directory."""
     return Path(user_cache_dir("trustget"))
 
 
+@lru_cache(maxsize=1)
 def ensure_dirs() -> None:
-    """Ensure config and cache directories exist."""
-    get_config_dir().mkdir(parents=True, exist_ok=True)
-    get_cache_dir().mkdir(parents=True, exist_ok=True)
+    """Ensure config and cache directories exist (checked once per process)."""
+    for directory in (get_config_dir(), get_cache_dir()):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
 
 
 def load_json_file(filepath: Path) -> Any:
     """Load JSON from file."""
-    with open(filepath, encoding="utf-8") as f:
-        return json.load(f)
+    return loads_json(filepath.read_bytes())
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    Parse a JSON document.
+
+    Uses orjson when installed, falling back to the standard library. Both
+    raise a ValueError subclass on invalid input.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values JSON can't represent, identically for orjson and json."""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def _replace_non_finite(data: Any) -> Any:
+    """Replace NaN and infinities with None, which orjson writes as null."""
+    if isinstance(data, float) and not math.isfinite(data):
+        return None
+    if isinstance(data, dict):
+        return {key: _replace_non_finite(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_replace_non_finite(value) for value in data]
+    return data
+
+
+def _orjson_dumps(data: Any, indent: bool) -> bytes:
+    """Serialize data with orjson using the options dumps_json promises."""
+    assert orjson is not None, "only called when orjson is installed"
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    option |= orjson.OPT_PASSTHROUGH_DATACLASS
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    encoded: bytes = orjson.dumps(data, option=option, default=_json_default)
+    return encoded
+
+
+def _stdlib_dumps(data: Any, indent: bool) -> str:
+    """Serialize data with the json module, matching _orjson_dumps byte for byte."""
+    kwargs: dict[str, Any] = {
+        "indent": 2 if indent else None,
+        "separators": None if indent else (",", ":"),
+        "ensure_ascii": False,
+        "allow_nan": False,
+    }
+    try:
+        return json.dumps(data, default=_json_default, **kwargs)
+    except ValueError:
+        # Non-finite floats; rare enough that the extra walk only runs here
+        return json.dumps(_replace_non_finite(data), default=_json_default, **kwargs)
+
+
+def dumps_json(data: Any, indent: bool = True) -> str:
+    """
+    Serialize data to a JSON string.
+
+    Uses orjson when installed (``pip install trustget[fast]``), falling back
+    to the standard library with identical output. Enums are written as their
+    value, dates in ISO 8601, NaN and infinities as null, and anything else
+    JSON can't represent via str().
+    """
+    if orjson is not None:
+        return _orjson_dumps(data, indent).decode()
+    return _stdlib_dumps(data, indent)
+
+
+def write_text_atomic(filepath: Path, text: str) -> None:
+    """
+    Replace a file's contents atomically, creating parent directories.
+
+    Writes to a uniquely named temp file in the same directory, so concurrent
+    writers never share one, then renames it over the target.
+
+    Raises:
+        OSError: If the file couldn't be written; the target is left as it was
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, prefix=f".{filepath.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_name, filepath)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
 
 
 def save_json_file(filepath: Path, data: Any) -> None:
     """Save data to JSON file."""
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+    if orjson is not None:
+        # orjson already produces UTF-8 bytes; skip the decode/re-encode round-trip
+        filepath.write_bytes(_orjson_dumps(data, indent=True) + b"\n")
+        return
+    filepath.write_text(dumps_json(data) + "\n", encoding="utf-8")
 
 
 def is_running_in_ci() -> bool:
@@ -199,12 +374,8 @@ def truncate_string(s: str, max_length: int = 50, suffix: str = "...") -> str:
 
 def safe_filename(filename: str) -> str:
     """Sanitize filename to be safe for filesystem."""
-    # Remove or replace unsafe characters
-    unsafe_chars = '<>:"/\\|?*'
-    for char in unsafe_chars:
-        filename = filename.replace(char, "_")
-    # Remove control characters
-    filename = "".join(c for c in filename if ord(c) >= 32)
+    # Replace unsafe characters and drop control characters in one pass
+    filename = filename.translate(_SAFE_FILENAME_TABLE)
     # Limit length
     if len(filename) > 255:
         name, ext = os.path.splitext(filename)
@@ -9,13 +9,19 @@ Supports:
 
 from __future__ import annotations
 
+import hmac
+import os
+import threading
+from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field, replace
 from enum import Enum, auto
 from pathlib import Path
 
 import gnupg
 
+from trustget.hashcache import FileKey, HashCache
 from trustget.scanner import ChecksumEntry, Scanner
 from trustget.utils import compute_hash, detect_hash_algorithm
 
@@ -30,7 +36,11 @@ class VerificationStatus(Enum):
     SKIPPED = auto()
 
 
-@dataclass
+# Enum.name is a descriptor; a plain dict lookup is cheaper in large batch exports
+_STATUS_NAMES = {status: status.name for status in VerificationStatus}
+
+
+@dataclass(slots=True)
 class VerificationResult:
     """Result of a verification operation."""
 
@@ -53,7 +63,7 @@ class VerificationResult:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "status": self.status.name,
+            "status": _STATUS_NAMES[self.status],
             "filepath": str(self.filepath),
             "algorithm": self.algorithm,
             "expected_hash": self.expected_hash,
@@ -66,7 +76,7 @@ class VerificationResult:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BatchVerificationResult:
     """Result of batch verification."""
 
@@ -86,7 +96,7 @@ class BatchVerificationResult:
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
-            "results": [r.to_dict() for r in self.results],
+            "results": list(map(VerificationResult.to_dict, self.results)),
             "total": self.total,
             "verified": self.verified,
             "failed": self.failed,
@@ -95,6 +105,47 @@ class BatchVerificationResult:
         }
 
 
+def _dir_entry_names(directory: Path) -> set[str]:
+    """Get the names in a directory (empty if it can't be read)."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+
+@dataclass(slots=True)
+class _ChecksumFile:
+    """A checksum file read by verify_with_checksum_file, parsed as lookups need it."""
+
+    path: Path
+    key: tuple[int, int]  # (size, mtime_ns) when read
+    content: str
+    lookups: int = 0
+    _entries: list[ChecksumEntry] | None = field(default=None, repr=False)
+    _index: dict[str, ChecksumEntry] | None = field(default=None, repr=False)
+
+    def entries(self, scanner: Scanner) -> list[ChecksumEntry]:
+        """Get every entry in the file (parsed once)."""
+        if self._entries is None:
+            self._entries = scanner._parse_checksum_content(self.content, str(self.path))
+        return self._entries
+
+    def find(self, scanner: Scanner, filename: str) -> ChecksumEntry | None:
+        """Find the entry for filename."""
+        self.lookups += 1
+        if self.lookups == 1:
+            # First lookup only scans for this file's line
+            return scanner._find_checksum_entry(self.content, filename)
+        if self._index is None:
+            # Second lookup in this file (e.g. a batch against SHA256SUMS):
+            # index every entry once so later lookups are dict hits
+            self._index = {}
+            for entry in self.entries(scanner):
+                self._index.setdefault(entry.filename.lower(), entry)
+        return self._index.get(filename.lower())
+
+
 class VerificationError(Exception):
     """Exception raised for verification errors."""
 
@@ -115,19 +166,38 @@ class Verifier:
     - Batch verification support
     """
 
-    SUPPORTED_ALGORITHMS = ["sha256", "sha512", "sha1", "md5"]
+    # Ordered as the former public list; the frozenset is for membership tests
+    SUPPORTED_ALGORITHMS_ORDER: tuple[str, ...] = ("sha256", "sha512", "sha1", "md5")
+    SUPPORTED_ALGORITHMS: frozenset[str] = frozenset(SUPPORTED_ALGORITHMS_ORDER)
     DEFAULT_ALGORITHM = "sha256"
+    HASH_MEMO_MAX_ENTRIES = 4096
+    CHECKSUM_FILE_CACHE_MAX_ENTRIES = 16
 
-    def __init__(self, gpg_home: str | None = None, timeout: int = 10):
+    def __init__(
+        self,
+        gpg_home: str | None = None,
+        timeout: int = 10,
+        hash_cache: HashCache | None = None,
+    ):
         """
         Initialize verifier.
 
         Args:
             gpg_home: Custom GPG home directory
             timeout: HTTP timeout for fetching checksums
+            hash_cache: Optional cache of computed hashes for unchanged files
         """
         self.gpg_home = gpg_home
         self.timeout = timeout
+        self.hash_cache = hash_cache
+        # In-memory digests by (HashCache.file_key, algorithm), so a
+        # file checked several times by one verifier is only hashed once
+        self._hash_memo: dict[tuple[FileKey, str], str] = {}
+        self._hash_memo_lock = threading.Lock()
+        # Checksum files read by verify_with_checksum_file, least recently used first
+        self._checksum_files: dict[Path, _ChecksumFile] = {}
+        # Successful GPG checks by (file identity, signature identity)
+        self._gpg_results: dict[tuple[FileKey, FileKey], VerificationResult] = {}
         self._scanner: Scanner | None = None
         self._gpg: gnupg.GPG | None = None
 
@@ -149,6 +219,8 @@ class Verifier:
         """Close resources."""
         if self._scanner:
             self._scanner.close()
+        if self.hash_cache:
+            self.hash_cache.close()
         if self._gpg:
             pass  # GPG doesn't need explicit cleanup
 
@@ -175,13 +247,6 @@ class Verifier:
         Returns:
             VerificationResult with verification status
         """
-        if not filepath.exists():
-            return VerificationResult(
-                status=VerificationStatus.NOT_FOUND,
-                filepath=filepath,
-                error=f"File not found: {filepath}",
-            )
-
         # Auto-detect algorithm if not specified
         if algorithm is None:
             algorithm = detect_hash_algorithm(expected_hash)
@@ -202,7 +267,14 @@ class Verifier:
             )
 
         try:
-            actual_hash = compute_hash(filepath, algorithm)
+            actual_hash = self._compute_hash(filepath, algorithm)
+        except FileNotFoundError:
+            # No exists() precheck: hashing stats and opens the file anyway
+            return VerificationResult(
+                status=VerificationStatus.NOT_FOUND,
+                filepath=filepath,
+                error=f"File not found: {filepath}",
+            )
         except Exception as e:
             return VerificationResult(
                 status=VerificationStatus.ERROR,
@@ -210,22 +282,43 @@ class Verifier:
                 error=f"Failed to compute hash: {e}",
             )
 
-        if actual_hash.lower() == expected_hash.lower():
-            return VerificationResult(
-                status=VerificationStatus.VERIFIED,
-                filepath=filepath,
-                algorithm=algorithm,
-                expected_hash=expected_hash.lower(),
-                actual_hash=actual_hash.lower(),
-            )
-        else:
-            return VerificationResult(
-                status=VerificationStatus.MISMATCH,
-                filepath=filepath,
-                algorithm=algorithm,
-                expected_hash=expected_hash.lower(),
-                actual_hash=actual_hash.lower(),
-            )
+        # hexdigest() is already lowercase; compare in constant time
+        expected_hash = expected_hash.lower()
+        matched = hmac.compare_digest(actual_hash.encode(), expected_hash.encode())
+        return VerificationResult(
+            status=VerificationStatus.VERIFIED if matched else VerificationStatus.MISMATCH,
+            filepath=filepath,
+            algorithm=algorithm,
+            expected_hash=expected_hash,
+            actual_hash=actual_hash,
+        )
+
+    def _compute_hash(self, filepath: Path, algorithm: str) -> str:
+        """Compute file hash, reusing earlier results while the file is unchanged."""
+        # Stat once up front; the same key serves the memo and the hash cache
+        file_key = HashCache.file_key(filepath)
+        key = (file_key, algorithm)
+        actual_hash = self._hash_memo.get(key)
+        if actual_hash is not None:
+            return actual_hash
+
+        if self.hash_cache is not None:
+            actual_hash = self.hash_cache.get(filepath, algorithm, file_key)
+        if actual_hash is None:
+            actual_hash = compute_hash(filepath, algorithm)
+            if not HashCache.unchanged_since(filepath, file_key):
+                # Written or replaced while hashing: the digest may match neither
+                # version, so don't remember it
+                return actual_hash
+            if self.hash_cache is not None:
+                self.hash_cache.put(filepath, algorithm, actual_hash, file_key)
+
+        with self._hash_memo_lock:
+            self._hash_memo[key] = actual_hash
+            if len(self._hash_memo) > self.HASH_MEMO_MAX_ENTRIES:
+                # Drop the oldest entry
+                del self._hash_memo[next(iter(self._hash_memo))]
+        return actual_hash
 
     def verify_with_entry(
         self,
@@ -265,17 +358,21 @@ class Verifier:
 
         # Strategy 1: Check for local checksum file
         local_checksums = [
-            filepath.parent / f"{filename}.sha256",
-            filepath.parent / f"{filename}.sha512",
-            filepath.parent / f"{filename}.md5",
-            filepath.parent / "SHA256SUMS",
-            filepath.parent / "SHA512SUMS",
-            filepath.parent / "MD5SUMS",
-            filepath.parent / "checksums.txt",
+            f"{filename}.sha256",
+            f"{filename}.sha512",
+            f"{filename}.md5",
+            "SHA256SUMS",
+            "SHA512SUMS",
+            "MD5SUMS",
+            "checksums.txt",
         ]
 
-        for checksum_file in local_checksums:
-            if checksum_file.exists():
+        # One directory read instead of a stat() per candidate
+        present = _dir_entry_names(filepath.parent)
+
+        for name in local_checksums:
+            if name in present:
+                checksum_file = filepath.parent / name
                 result = self.verify_with_checksum_file(filepath, checksum_file)
                 if result.status != VerificationStatus.NOT_FOUND:
                     result.source = str(checksum_file)
@@ -312,17 +409,21 @@ class Verifier:
         Returns:
             VerificationResult with verification status
         """
-        if not checksum_file.exists():
+        filename = filepath.name
+
+        try:
+            stat = checksum_file.stat()
+            key = (stat.st_size, stat.st_mtime_ns)
+            cached = self._checksum_files.pop(checksum_file, None)
+            if cached is None or cached.key != key:
+                content = checksum_file.read_text(encoding="utf-8")
+                cached = _ChecksumFile(checksum_file, key, content)
+        except FileNotFoundError:
             return VerificationResult(
                 status=VerificationStatus.NOT_FOUND,
                 filepath=filepath,
                 error=f"Checksum file not found: {checksum_file}",
             )
-
-        filename = filepath.name
-
-        try:
-            content = checksum_file.read_text(encoding="utf-8")
         except Exception as e:
             return VerificationResult(
                 status=VerificationStatus.ERROR,
@@ -330,22 +431,20 @@ class Verifier:
                 error=f"Failed to read checksum file: {e}",
             )
 
-        # Parse checksum file
-        from trustget.scanner import Scanner
-
-        scanner = Scanner()
-        entries = scanner._parse_checksum_content(content, str(checksum_file))
+        # Re-insert so the most recently used files survive trimming
+        self._checksum_files[checksum_file] = cached
+        if len(self._checksum_files) > self.CHECKSUM_FILE_CACHE_MAX_ENTRIES:
+            del self._checksum_files[next(iter(self._checksum_files))]
 
-        # Find entry for our file
-        target_lower = filename.lower()
-        for entry in entries:
-            if entry.filename.lower() == target_lower:
-                result = self.verify_with_entry(filepath, entry)
-                result.source = checksum_file.name
-                return result
+        entry = cached.find(self.scanner, filename)
+        if entry:
+            result = self.verify_with_entry(filepath, entry)
+            result.source = checksum_file.name
+            return result
 
         # Also try matching by hash if filename doesn't match
         # (some checksum files only contain one entry)
+        entries = cached.entries(self.scanner)
         if len(entries) == 1:
             entry = entries[0]
             if algorithm is None or entry.algorithm == algorithm:
@@ -383,15 +482,17 @@ class Verifier:
                 error=f"File not found: {filepath}",
             )
 
-        # Auto-detect signature file
+        # Auto-detect signature file with one directory read
         if signature_file is None:
-            for ext in [".asc", ".sig", ".gpg"]:
-                sig_path = Path(f"{filepath}{ext}")
-                if sig_path.exists():
-                    signature_file = sig_path
+            present = _dir_entry_names(filepath.parent)
+            for ext in (".asc", ".sig", ".gpg"):
+                if filepath.name + ext in present:
+                    signature_file = filepath.parent / (filepath.name + ext)
                     break
+        elif not signature_file.exists():
+            signature_file = None
 
-        if signature_file is None or not signature_file.exists():
+        if signature_file is None:
             return VerificationResult(
                 status=VerificationStatus.NOT_FOUND,
                 filepath=filepath,
@@ -399,18 +500,27 @@ class Verifier:
             )
 
         try:
+            # Same file and signature, both unchanged: skip re-running gpg
+            key = (HashCache.file_key(filepath), HashCache.file_key(signature_file))
+            cached = self._gpg_results.get(key)
+            if cached is not None:
+                return replace(cached)
+
             # Verify signature
             with open(filepath, "rb") as f:
                 verified = self.gpg.verify_file(f, signature_file)
 
             if verified.valid:
-                return VerificationResult(
+                result = VerificationResult(
                     status=VerificationStatus.VERIFIED,
                     filepath=filepath,
                     gpg_verified=True,
                     gpg_key_id=verified.key_id,
                     gpg_key_status="valid" if verified.valid else "invalid",
                 )
+                # Only successes are kept: importing a key can still fix a failure
+                self._gpg_results[key] = result
+                return replace(result)
             else:
                 return VerificationResult(
                     status=VerificationStatus.MISMATCH,
@@ -432,45 +542,54 @@ class Verifier:
         self,
         files: list[tuple[Path, str | ChecksumEntry]],
         progress_callback: Callable[[int, int], None] | None = None,
+        max_workers: int | None = None,
     ) -> BatchVerificationResult:
         """
         Verify multiple files.
 
+        Files are hashed on a thread pool; hashlib releases the GIL while
+        hashing, so independent files are verified in parallel.
+
         Args:
             files: List of (filepath, hash_or_entry) tuples
-            progress_callback: Optional callback(current, total)
+            progress_callback: Optional callback(completed, total), called as files finish
+            max_workers: Maximum number of hashing threads (default: CPU count, capped at 8)
 
         Returns:
-            BatchVerificationResult with all results
+            BatchVerificationResult with results in the same order as files
         """
-        results: list[VerificationResult] = []
-        verified = 0
-        failed = 0
-        skipped = 0
-
-        for i, (filepath, hash_or_entry) in enumerate(files):
-            if progress_callback:
-                progress_callback(i + 1, len(files))
+        if max_workers is None:
+            max_workers = min(8, os.cpu_count() or 1)
 
+        def verify_one(item: tuple[Path, str | ChecksumEntry]) -> VerificationResult:
+            filepath, hash_or_entry = item
             if isinstance(hash_or_entry, str):
-                result = self.verify_hash(filepath, hash_or_entry)
-            else:
-                result = self.verify_with_entry(filepath, hash_or_entry)
+                return self.verify_hash(filepath, hash_or_entry)
+            return self.verify_with_entry(filepath, hash_or_entry)
 
-            results.append(result)
+        results: list[VerificationResult] = []
+        if len(files) <= 1 or max_workers <= 1:
+            for i, item in enumerate(files):
+                results.append(verify_one(item))
+                if progress_callback:
+                    progress_callback(i + 1, len(files))
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers) as pool:
+                futures = [pool.submit(verify_one, item) for item in files]
+                if progress_callback:
+                    for completed, _ in enumerate(as_completed(futures), 1):
+                        progress_callback(completed, len(files))
+                results = [future.result() for future in futures]
 
-            if result.status == VerificationStatus.VERIFIED:
-                verified += 1
-            elif result.status == VerificationStatus.SKIPPED:
-                skipped += 1
-            else:
-                failed += 1
+        counts = Counter(r.status for r in results)
+        verified = counts[VerificationStatus.VERIFIED]
+        skipped = counts[VerificationStatus.SKIPPED]
 
         return BatchVerificationResult(
             results=results,
             total=len(files),
             verified=verified,
-            failed=failed,
+            failed=len(results) - verified - skipped,
             skipped=skipped,
         )
 
@@ -489,11 +608,9 @@ class Verifier:
         Returns:
             VerificationResult with verification status
         """
-        checksum_string = checksum_string.strip()
-
-        # Parse checksum string
-        parts = checksum_string.split()
-        if len(parts) >= 1:
+        # Only the hash is needed; split() skips leading whitespace itself
+        parts = checksum_string.split(None, 1)
+        if parts:
             hash_value = parts[0]
         else:
             return VerificationResult(